@@ -0,0 +1,92 @@
+import numpy as np
+
+# -------- Benchmark cases-----------------------------------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------------------------------------------------------------
+# One builder per chart: given the sweep point (rows, hue cardinality, kde on/off) it returns the keyword arguments of
+# the neon_tokyo chart call. The data is synthetic and seeded, so two runs of the same case plot the same points.
+# Charts that take aggregated input (pie, box, scatterbox) get it computed from the generated rows inside the timed
+# call, so their cost still follows the row count. The cases named <chart>_<variant> time the same chart on another
+# engine or glow (VARIANTS gives the function they call).
+
+CHARTS = ('scatter', 'bar', 'barh', 'line', 'hist', 'violin', 'pie', 'box', 'scatterbox', 'joint', 'displot',
+          'pairplot', 'joint_neon', 'pairplot_neon', 'pairplot_density', 'scatter_bloom', 'line_bloom', 'hist_bloom')
+
+VARIANTS = {'joint_neon': 'joint', 'pairplot_neon': 'pairplot', 'pairplot_density': 'pairplot',
+            'scatter_bloom': 'scatter', 'line_bloom': 'line', 'hist_bloom': 'hist'}
+
+# the only ones where the kde switch changes the chart
+KDE_CHARTS = ('hist', 'displot', 'joint', 'pairplot', 'joint_neon', 'pairplot_neon', 'pairplot_density', 'hist_bloom')
+
+# above these row counts a case is recorded as skipped: one patch per row (bar, barh) or seaborn's per-point
+# artists (joint, pairplot, scatterbox) would take minutes and gigabytes and say nothing new
+MAX_ROWS = {'bar': 100_000, 'barh': 100_000, 'scatterbox': 1_000_000, 'joint': 1_000_000, 'pairplot': 1_000_000}
+
+
+def frame(rows, hues, seed=0):
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    labels = np.array([f'h{i}' for i in range(max(hues, 1))])
+    categories = np.array([f'c{i}' for i in range(30)])
+    return pd.DataFrame({
+        'x': rng.normal(size=rows),
+        'y': rng.normal(size=rows) * 2 + 1,
+        'z': rng.exponential(size=rows),
+        't': np.arange(rows, dtype=float),
+        'category': categories[rng.integers(0, len(categories), rows)],
+        'hue': labels[rng.integers(0, len(labels), rows)],
+    })
+
+
+def _groups(data, column, value):
+    # the values of `value` split by `column`, in order of first appearance
+    import pandas as pd
+
+    codes, uniques = pd.factorize(data[column])
+    values = data[value].to_numpy()
+    order = np.argsort(codes, kind='stable')
+    bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+    return [values[order[bounds[i]:bounds[i + 1]]] for i in range(len(uniques))], list(uniques)
+
+
+def arguments(chart, data, hues, kde):
+    # keyword arguments of the timed call, or a function returning them: that one is called inside the timing (it
+    # stands for the aggregation a caller has to do before a chart that does not take rows)
+    hue = 'hue' if hues > 1 else None
+    if chart in ('scatter_bloom', 'line_bloom', 'hist_bloom'):
+        return dict(arguments(VARIANTS[chart], data, hues, kde), glow='bloom')
+    if chart == 'scatter':
+        return dict(data=data, y_column='y', x_column='x', hue=hue)
+    if chart == 'bar':
+        return dict(data=data, y_column='z', x_column='category', hue=hue)
+    if chart == 'barh':
+        return dict(data=data, y_column='category', x_column='z', hue=hue)
+    if chart == 'line':
+        return dict(data=data, y_column='y', x_column='t', hue=hue)
+    if chart == 'hist':
+        return dict(data=data, y_column='y', hue=hue, kde=kde)
+    if chart == 'violin':
+        # violin takes at most two hues; the cardinality goes into the categories instead
+        return dict(data=data, y_column='y', x_column='hue' if hue else 'category')
+    if chart == 'pie':
+        def pie():
+            counts = data['hue'].value_counts()
+            return dict(x_column=counts.to_numpy(), labels=list(counts.index), annotation='')
+        return pie
+    if chart in ('box', 'scatterbox'):
+        def boxes():
+            groups, labels = _groups(data, 'hue', 'y')
+            return dict(x_column=groups, labels=labels, x_name='hue', y_name='y')
+        return boxes
+    if chart == 'joint':
+        return dict(data=data, x_column='x', y_column='y', hue=hue, kind='kde' if kde else 'scatter')
+    if chart == 'joint_neon':
+        return dict(data=data, x_column='x', y_column='y', hue=hue, kind='kde' if kde else 'scatter', engine='neon')
+    if chart == 'displot':
+        return dict(data=data, y_column='y', hue=hue, kde=kde)
+    if chart == 'pairplot':
+        return dict(data=data, hue=hue, vars=['x', 'y', 'z'], diag_kind='kde' if kde else 'hist')
+    if chart in ('pairplot_neon', 'pairplot_density'):
+        return dict(data=data, hue=hue, vars=['x', 'y', 'z'], diag_kind='kde' if kde else 'hist', engine='neon',
+                    kind='density' if chart == 'pairplot_density' else 'scatter')
+    raise ValueError(f"no benchmark case for chart {chart!r}")
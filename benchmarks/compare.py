@@ -0,0 +1,52 @@
+import argparse
+import json
+
+# -------- Benchmark comparison------------------------------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------------------------------------------------------------
+# python benchmarks/compare.py benchmarks/results/OLD.json benchmarks/results/NEW.json [--threshold 1.25]
+#
+# Lines up the cases both runs have and prints the new/old ratio of every metric; ratios past the threshold are
+# flagged, and the exit status is 1 when any wall time regressed, so the script can gate a release.
+
+METRICS = ('wall_s', 'build_s', 'encode_s', 'import_s', 'peak_delta_mb', 'artists')
+
+
+def _cases(path):
+    with open(path) as file:
+        run = json.load(file)
+    cases = {(r['chart'], r['rows'], r['hues'], r['kde']): r for r in run['results'] if r['status'] == 'ok'}
+    return run['environment'], cases
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compare two benchmark result files.')
+    parser.add_argument('old')
+    parser.add_argument('new')
+    parser.add_argument('--threshold', type=float, default=1.25, help='ratio above which a metric is flagged')
+    options = parser.parse_args(argv)
+
+    old_environment, old = _cases(options.old)
+    new_environment, new = _cases(options.new)
+    print(f"old: {old_environment['versions']['matisse']} @ {old_environment['revision']}  "
+          f"new: {new_environment['versions']['matisse']} @ {new_environment['revision']}")
+
+    regressed = False
+    for key in sorted(old.keys() & new.keys(), key=lambda case: tuple(map(str, case))):
+        chart, rows, hues, kde = key
+        ratios = []
+        for metric in METRICS:
+            before, after = old[key][metric], new[key][metric]
+            ratio = after / before if before else float('inf') if after else 1.0
+            flag = '!' if ratio > options.threshold else ' '
+            regressed |= metric == 'wall_s' and ratio > options.threshold
+            ratios.append(f'{metric}={ratio:5.2f}{flag}')
+        print(f"{chart:<16} rows={rows:<9,} hues={hues:<3} kde={kde!s:<5} {' '.join(ratios)}")
+
+    if old.keys() - new.keys() or new.keys() - old.keys():
+        print(f"{len(old.keys() - new.keys())} cases only in old, {len(new.keys() - old.keys())} only in new "
+              f"(not compared)")
+    return 1 if regressed else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
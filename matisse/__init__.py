@@ -0,0 +1,13 @@
+__version__ = '0.1'
+
+from . import neon_tokyo
+from .batch import render_many
+from .cache import RenderCache
+from .profiling import profile
+
+
+def style(style_name, chart, **kwargs):
+    # matisse.style('neon_tokyo', 'bar', data=df, y_column=..., x_column=...) calls the chart function of that style
+    if style_name == 'neon_tokyo':
+        return getattr(neon_tokyo, chart)(**kwargs)
+    raise ValueError(f"unknown style {style_name!r}")
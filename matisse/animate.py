@@ -0,0 +1,86 @@
+import io
+import os
+import subprocess
+import tempfile
+
+import numpy as np
+
+# -------- Blitted animation--------------------------------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------------------------------------------------------------
+# The static part of the chart (facecolor, grid, labels, legend) is drawn once into the Agg buffer and kept; every
+# frame restores that background, updates the artists that move (the point collections and their glow, or the
+# density image of an aggregated scatter) and draws only those on top. A frame never rebuilds the figure.
+
+
+def blit_frames(fig, artists, update, frames):
+    # artists: the moving artists on fig's only axes, in drawing order; update(frame) points them at the next frame.
+    # Yields each frame as a (height, width, 4) uint8 RGBA array.
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.axes[0]
+    for artist in artists:
+        artist.set_animated(True)
+    canvas.draw()
+    background = canvas.copy_from_bbox(fig.bbox)
+
+    for frame in frames:
+        canvas.restore_region(background)
+        update(frame)
+        for artist in artists:
+            ax.draw_artist(artist)
+        yield np.array(canvas.buffer_rgba())
+
+
+def encode(frames, output, fps):
+    # 'frames' -> list of RGBA arrays; 'gif'/'mp4' -> bytes; a path ending in .gif/.mp4 -> the file is written
+    if output == 'frames':
+        return list(frames)
+
+    path = None
+    if output not in ('gif', 'mp4'):
+        path, output = output, os.path.splitext(output)[1].lstrip('.').lower()
+        if output not in ('gif', 'mp4'):
+            raise ValueError(f"unsupported animation output {path!r}: use 'frames', 'gif', 'mp4' or a .gif/.mp4 path")
+
+    data = _gif(frames, fps) if output == 'gif' else _mp4(frames, fps)
+    if path is None:
+        return data
+    with open(path, 'wb') as file:
+        file.write(data)
+    return path
+
+
+def _gif(frames, fps):
+    from PIL import Image
+
+    images = [Image.fromarray(frame).convert('RGB') for frame in frames]
+    buffer = io.BytesIO()
+    images[0].save(buffer, format='gif', save_all=True, append_images=images[1:], duration=1000 / fps, loop=0)
+    return buffer.getvalue()
+
+
+def _mp4(frames, fps):
+    # raw frames are piped straight into ffmpeg (the binary matplotlib is configured with), H.264 in an mp4
+    import matplotlib
+
+    frames = iter(frames)
+    first = next(frames)
+    height, width = first.shape[:2]
+    with tempfile.TemporaryDirectory(prefix='matisse-') as directory:
+        path = os.path.join(directory, 'animation.mp4')
+        command = [matplotlib.rcParams['animation.ffmpeg_path'], '-y', '-loglevel', 'error',
+                   '-f', 'rawvideo', '-pix_fmt', 'rgba', '-s', f'{width}x{height}', '-r', str(fps), '-i', '-',
+                   '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', '-vcodec', 'libx264', '-pix_fmt', 'yuv420p', path]
+        try:
+            process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        except FileNotFoundError:
+            raise RuntimeError("writing mp4 needs ffmpeg (set matplotlib.rcParams['animation.ffmpeg_path'])") from None
+        with process.stdin:
+            process.stdin.write(first.tobytes())
+            for frame in frames:
+                process.stdin.write(frame.tobytes())
+        if process.wait():
+            raise RuntimeError(f"ffmpeg exited with status {process.returncode}")
+        with open(path, 'rb') as file:
+            return file.read()
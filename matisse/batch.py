@@ -0,0 +1,123 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from . import neon_tokyo
+
+# -------- Batch rendering-----------------------------------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------------------------------------------------------------
+# render_many() fans chart specs out over a process pool. The source frames are written once, column by column, into
+# memory-mapped .npy files (in /dev/shm when the system has it); every worker maps them read-only when it starts, so
+# the data is neither pickled per task nor copied per worker. Only the small spec dicts travel with the tasks.
+
+_frames = {}  # frame name -> DataFrame over the mapped columns, filled in each worker by _attach
+
+
+def _share(frames, directory):
+    # numeric, boolean and datetime columns are mapped as they are; anything else is factorized and only its codes
+    # are mapped, the (small) table of unique values travels in the layout
+    import pandas as pd
+
+    layout = {}
+    for name, frame in frames.items():
+        columns = []
+        names = neon_tokyo._column_names(frame)
+        for position, (column, values) in enumerate(neon_tokyo._columns(frame, names).items()):
+            uniques = None
+            if values.dtype.kind not in 'biufcmM':
+                values, uniques = pd.factorize(values)
+
+            path = os.path.join(directory, f'{len(layout)}-{position}.npy')
+            mapped = np.lib.format.open_memmap(path, mode='w+', dtype=values.dtype, shape=values.shape)
+            mapped[:] = values
+            mapped.flush()
+            del mapped
+            columns.append((column, path, uniques))
+        layout[name] = columns
+    return layout
+
+
+def _attach(layout):
+    import matplotlib
+    matplotlib.use('Agg')
+    import pandas as pd
+
+    for name, columns in layout.items():
+        frame = {}
+        for column, path, uniques in columns:
+            values = np.load(path, mmap_mode='r')
+            frame[column] = values if uniques is None else pd.Categorical.from_codes(values, uniques)
+        _frames[name] = pd.DataFrame(frame, copy=False)
+
+
+def _render(spec, default_output, dpi):
+    spec = dict(spec)
+    chart = getattr(neon_tokyo, spec.pop('chart'))
+    frame = _frames[spec.pop('data', None)]
+    if spec.get('output') is None:
+        spec['output'] = default_output
+    spec.setdefault('dpi', dpi)
+    return chart(data=frame, **spec)
+
+
+def _is_named_frames(data):
+    # a dict of frames, rather than one frame given as a mapping of arrays
+    return isinstance(data, dict) and bool(data) and all(neon_tokyo._is_frame(frame) for frame in data.values())
+
+
+def _cache_key(spec, frames, output, dpi):
+    from .cache import render_key
+
+    spec = dict(spec)
+    chart = spec.pop('chart')
+    spec['data'] = frames[spec.get('data')]
+    if spec.get('output') is None:
+        spec['output'] = output
+    spec.setdefault('dpi', dpi)
+    return render_key(chart, **spec), spec['output']
+
+
+def render_many(specs, data, processes=None, output='png', dpi=None, cache=None):
+    # specs: iterable of dicts, each naming a chart function ('chart': 'bar') plus that chart's keyword arguments.
+    # data: one frame for every spec, or a dict of names to frames picked per spec with a 'data' key. A frame is
+    # anything the charts take as data (pandas, a mapping of arrays, Arrow, polars, the interchange protocol).
+    # cache: a RenderCache; specs it already holds are not sent to the pool.
+    # Returns the rendered images (bytes for 'png'/'svg'/'pdf') in the order of the specs.
+    from concurrent.futures import ProcessPoolExecutor
+
+    specs = list(specs)
+    frames = dict(data) if _is_named_frames(data) else {None: data}
+    for spec in specs:
+        if spec.get('data') not in frames:
+            raise KeyError(f"spec {spec!r} refers to unknown data {spec.get('data')!r}")
+        if not callable(getattr(neon_tokyo, spec.get('chart', ''), None)):
+            raise ValueError(f"spec {spec!r} does not name a neon_tokyo chart")
+    if output in (None, 'figure'):
+        raise ValueError("render_many returns encoded images: output must be 'png', 'svg' or 'pdf'")
+
+    images = [None] * len(specs)
+    keys = None
+    if cache is not None:
+        keys = [_cache_key(spec, frames, output, dpi) for spec in specs]
+        images = [cache.get(key, format) for key, format in keys]
+    pending = [position for position, image in enumerate(images) if image is None]
+    if not pending:
+        return images
+
+    directory = tempfile.mkdtemp(prefix='matisse-', dir='/dev/shm' if os.path.isdir('/dev/shm') else None)
+    try:
+        layout = _share(frames, directory)
+        processes = min(processes or os.cpu_count() or 1, len(pending))
+        with ProcessPoolExecutor(max_workers=processes, initializer=_attach, initargs=(layout,)) as pool:
+            chunksize = max(1, len(pending) // (processes * 4))
+            rendered = pool.map(_render, [specs[position] for position in pending], [output] * len(pending),
+                                [dpi] * len(pending), chunksize=chunksize)
+            for position, image in zip(pending, rendered):
+                images[position] = image
+                if cache is not None:
+                    cache.put(*keys[position], image)
+        return images
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
@@ -0,0 +1,88 @@
+import numpy as np
+from matplotlib.artist import Artist
+
+from .raster import gaussian_blur, over, unpremultiply
+
+# -------- Bloom glow----------------------------------------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------------------------------------------------------------
+# glow='bloom' replaces the stacked glow layers of a chart with one post-processing pass. A Bloom sits just under the
+# artists it glows for and draws them itself: whenever the figure is drawn, it renders them once into an offscreen
+# Agg buffer, blurs the pixels of their axes (premultiplied, at two radii) and lays the crisp pixels over the blurred
+# copy as one image; the artists skip their own draw on that renderer. The data is drawn once per frame at its own
+# width, and what the glow adds on top of that (reading back, blurring and compositing the pixels) only depends on the
+# pixel size of the axes, not on the number of points. Vector outputs (svg, pdf) get the glow as an embedded raster
+# under the data, which the artists still draw themselves as vectors, so there the data is drawn twice.
+# This module imports matplotlib at the top, so neon_tokyo only imports it from the charts that ask for a bloom.
+
+
+class Bloom(Artist):
+    # `sources` are artists already on `ax`; `radius` is the width of the glow in points, `strength` the gain of the
+    # blurred copy and `peak` its highest opacity (about what the stacked layers add up to)
+    def __init__(self, ax, sources, radius=6, strength=2.5, peak=0.5):
+        super().__init__()
+        self.sources = list(sources)
+        self.radius = radius
+        self.strength = strength
+        self.peak = peak
+        self._composited = None  # the renderer the sources were last drawn into by the bloom
+        self.set_zorder(min((artist.get_zorder() for artist in self.sources), default=1) - 0.01)
+        for artist in self.sources:
+            self._hold(artist)
+        ax.add_artist(self)
+
+    def _hold(self, artist):
+        # the source no longer draws itself on a raster renderer the bloom has just drawn it into; the bloom calls the
+        # original draw for its buffer, and vector renderers still get the source as it is
+        draw = artist.draw
+
+        def held(renderer):
+            if renderer is not self._composited:
+                return draw(renderer)
+        held.original = draw
+        artist.draw = held
+
+    def draw(self, renderer):
+        from matplotlib.backends.backend_agg import RendererAgg
+
+        self._composited = None
+        if not self.get_visible() or not self.sources:
+            return
+        width, height = (int(np.ceil(size)) for size in renderer.get_canvas_width_height())
+        dpi = self.figure.dpi
+        sigma = self.radius * dpi / 72 / 2
+        raster = isinstance(renderer, RendererAgg)
+        # on a raster renderer the sources are drawn only here, so they count as drawn even if nothing comes out
+        if raster:
+            self._composited = renderer
+
+        # only the box of the axes, grown by the reach of the wider blur, is read back and blurred
+        reach = int(np.ceil(6 * sigma))
+        box = self.axes.bbox
+        left, right = max(int(box.x0) - reach, 0), min(int(np.ceil(box.x1)) + reach, width)
+        top, bottom = max(height - int(np.ceil(box.y1)) - reach, 0), min(height - int(box.y0) + reach, height)
+        if left >= right or top >= bottom:
+            return
+
+        offscreen = RendererAgg(width, height, dpi)
+        for artist in sorted(self.sources, key=lambda artist: artist.get_zorder()):
+            if artist.get_visible():
+                artist.draw.original(offscreen)
+        layer = np.asarray(offscreen.buffer_rgba())[top:bottom, left:right].astype(np.float32) / 255
+        if not layer[..., 3].any():
+            return
+        layer[..., :3] *= layer[..., 3:]  # premultiplied, so the blur does not darken the edges
+
+        # a tight halo and a wide one, like the narrowest and the widest of the stacked layers. The gain brings the
+        # thin halos of markers and lines up; the cap keeps large filled areas from turning opaque under the data
+        glow = (gaussian_blur(layer, sigma) + gaussian_blur(layer, 3 * sigma)) * (self.strength / 2)
+        alpha = glow[..., 3:]
+        glow *= np.minimum(1, np.divide(self.peak, alpha, out=np.ones_like(alpha), where=alpha > 0))
+        if raster:
+            glow = over(layer, glow)  # the crisp data on top of its glow, from the same buffer
+        image = np.round(unpremultiply(glow) * 255).astype(np.uint8)
+
+        gc = renderer.new_gc()
+        self._set_gc_clip(gc)
+        renderer.draw_image(gc, left, height - bottom, image[::-1])
+        gc.restore()
+        self.stale = False
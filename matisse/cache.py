@@ -0,0 +1,248 @@
+import collections
+import functools
+import hashlib
+import inspect
+import os
+import tempfile
+import threading
+
+import numpy as np
+
+from . import neon_tokyo
+
+# -------- Render cache--------------------------------------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------------------------------------------------------------
+# A RenderCache sits in front of the neon_tokyo chart functions and keeps the encoded images they return. The key is a
+# blake2b digest of the chart name, its arguments with the defaults filled in, the raw buffers of the data columns the
+# chart reads, the active rcParams and the matisse/matplotlib/seaborn versions, so a chart whose inputs did not change
+# costs one pass of hashing over its columns instead of a render. Images are kept in memory, on disk or both, each
+# store bounded in bytes and evicting the least recently used images first.
+
+@functools.lru_cache(maxsize=None)
+def _versions():
+    # read from the installed package metadata, so computing a key never imports seaborn for the charts that do not
+    # load it
+    from importlib.metadata import PackageNotFoundError, version
+    from . import __version__
+
+    versions = [__version__]
+    for package in ('matplotlib', 'seaborn'):
+        try:
+            versions.append(version(package))
+        except PackageNotFoundError:
+            versions.append('-')
+    return '/'.join(versions)
+
+
+def _update_array(digest, values):
+    # dtype, shape and the raw buffer; object columns (strings, mixed) go through pandas' vectorized hashing and
+    # categoricals through their codes plus their categories
+    import pandas as pd
+
+    dtype = getattr(values, 'dtype', None)
+    if isinstance(dtype, pd.CategoricalDtype):
+        values = pd.Categorical(values)
+        digest.update(f'category/{dtype.ordered}/'.encode())
+        _update_array(digest, values.categories.to_numpy())
+        values = values.codes
+    values = np.asarray(values)
+    if values.dtype.kind == 'O':
+        values = pd.util.hash_array(values.ravel(), categorize=True)
+    digest.update(f'{values.dtype.str}{values.shape}'.encode())
+    digest.update(memoryview(np.ascontiguousarray(values)).cast('B'))
+
+
+def _update(digest, value):
+    import pandas as pd
+
+    if isinstance(value, pd.DataFrame):
+        _update_frame(digest, value, value.columns)
+    elif isinstance(value, (np.ndarray, pd.Series, pd.Index)):
+        digest.update(b'array')
+        _update_array(digest, value)
+    elif isinstance(value, (list, tuple)):
+        digest.update(f'{type(value).__name__}{len(value)}'.encode())
+        for item in value:
+            _update(digest, item)
+    elif isinstance(value, dict):
+        digest.update(f'dict{len(value)}'.encode())
+        for name in sorted(value, key=repr):
+            digest.update(repr(name).encode())
+            _update(digest, value[name])
+    elif neon_tokyo._is_frame(value):
+        # Arrow, polars or interchange frames nested in other arguments (the panels of a dashboard): every column
+        _update_frame(digest, value, neon_tokyo._column_names(value))
+    else:
+        digest.update(repr(value).encode())
+    digest.update(b'\0')
+
+
+def _update_frame(digest, frame, columns):
+    # any input the charts take as `data` (pandas, a mapping of arrays, Arrow, polars, the interchange protocol);
+    # pandas columns are hashed as they are, so a categorical's category order is part of the key
+    import pandas as pd
+
+    arrays = frame if isinstance(frame, pd.DataFrame) else neon_tokyo._columns(frame, columns)
+    digest.update(b'frame')
+    for column in columns:
+        digest.update(repr(column).encode())
+        _update_array(digest, arrays[column])
+
+
+def _update_files(digest, path):
+    # a streamed source on disk: its partitions with their sizes and modification times, so rewriting a file
+    # changes the key without reading it
+    from . import stream
+
+    digest.update(b'files')
+    for partition in stream._partitions(os.fspath(path)):
+        status = os.stat(partition)
+        digest.update(f'{partition}/{status.st_size}/{status.st_mtime_ns}\0'.encode())
+
+
+def _referenced(chart, data, arguments):
+    # every column of `data` the chart reads: the ones named by *_column, hue and weights, and for pairplot the
+    # columns it plots (vars/x_vars/y_vars, or every numeric column); all of them when the chart names none
+    from collections.abc import Hashable
+
+    available = set(neon_tokyo._column_names(data))
+    names = [value for name, value in arguments.items() if name.endswith('_column') or name in ('hue', 'weights')]
+    if chart == 'pairplot':
+        x_vars, y_vars = neon_tokyo._pair_vars(data, arguments.get('hue'), arguments.get('vars'),
+                                               arguments.get('x_vars'), arguments.get('y_vars'))
+        names += x_vars + y_vars
+    columns = [name for name in names if isinstance(name, Hashable) and name in available]
+    return list(dict.fromkeys(columns)) or neon_tokyo._column_names(data)
+
+
+def render_key(chart, **kwargs):
+    # hex digest identifying the image chart(**kwargs) renders
+    import matplotlib
+
+    function = getattr(neon_tokyo, chart)
+    arguments = inspect.signature(function).bind(**kwargs)
+    arguments.apply_defaults()
+    arguments = dict(arguments.arguments)
+    arguments.update(arguments.pop('kwargs', {}))
+
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f'{chart}/{_versions()}\0'.encode())
+    _update(digest, sorted(matplotlib.rcParams.items()))
+    for name in sorted(arguments):
+        value = arguments[name]
+        digest.update(name.encode())
+        if name == 'data' and neon_tokyo._is_frame(value):
+            _update_frame(digest, value, _referenced(chart, value, arguments))
+        elif name == 'data' and isinstance(value, (str, os.PathLike)):
+            _update_files(digest, value)
+        else:
+            _update(digest, value)
+    return digest.hexdigest()
+
+
+class RenderCache:
+    # cache = RenderCache(directory='~/.cache/matisse'); cache.render('bar', data=df, y_column=..., x_column=...)
+    # max_bytes bounds the in-memory store (0 disables it); with a directory the images are also kept there as
+    # <key>.<format> files, at most max_disk_bytes of them. Safe to share between threads.
+    def __init__(self, max_bytes=256 * 2 ** 20, directory=None, max_disk_bytes=2 ** 30):
+        self.max_bytes = max_bytes
+        self.directory = None if directory is None else os.path.expanduser(directory)
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.misses = 0
+        self._memory = collections.OrderedDict()  # key -> image, least recently used first
+        self._size = 0
+        self._lock = threading.Lock()
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+
+    def render(self, chart, **kwargs):
+        # the image chart(**kwargs) renders; output defaults to 'png' and has to be an image format
+        output = kwargs.setdefault('output', 'png')
+        if not isinstance(output, str) or output == 'figure':
+            raise ValueError("RenderCache keeps encoded images: output must be 'png', 'svg' or 'pdf'")
+        key = render_key(chart, **kwargs)
+        image = self.get(key, output)
+        if image is None:
+            image = getattr(neon_tokyo, chart)(**kwargs)
+            self.put(key, output, image)
+        return image
+
+    def get(self, key, output):
+        with self._lock:
+            image = self._memory.get(key)
+            if image is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return image
+
+        image = None
+        if self.directory is not None:
+            path = os.path.join(self.directory, f'{key}.{output}')
+            try:
+                with open(path, 'rb') as file:
+                    image = file.read()
+                os.utime(path)
+            except OSError:
+                image = None
+
+        with self._lock:
+            if image is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        self._remember(key, image)
+        return image
+
+    def put(self, key, output, image):
+        self._remember(key, image)
+        if self.directory is None:
+            return
+        # written under a temporary name and renamed, so readers never see half an image
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(descriptor, 'wb') as file:
+            file.write(image)
+        os.replace(temporary, os.path.join(self.directory, f'{key}.{output}'))
+        self._evict_disk()
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._size = 0
+        if self.directory is not None:
+            for entry in self._entries():
+                os.remove(entry.path)
+
+    def _remember(self, key, image):
+        if len(image) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return
+            self._memory[key] = image
+            self._size += len(image)
+            while self._size > self.max_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._size -= len(evicted)
+
+    def _entries(self):
+        return [entry for entry in os.scandir(self.directory) if entry.is_file() and not entry.name.endswith('.tmp')]
+
+    def _evict_disk(self):
+        # least recently used first: every hit touches its file
+        entries = []
+        for entry in self._entries():
+            try:
+                entries.append((entry.stat().st_mtime_ns, entry.stat().st_size, entry.path))
+            except FileNotFoundError:
+                continue
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
@@ -1,39 +0,0 @@
-{
- "cells": [
-  {
-   "cell_type": "code",
-   "execution_count": null,
-   "id": "4bb29b57",
-   "metadata": {},
-   "outputs": [],
-   "source": [
-    "from .neon_tokyo import neon_tokyo\n",
-    "\n",
-    "def style(style_name, **kwargs):\n",
-    "    if style_name == 'neon_tokyo':\n",
-    "        neon_tokyo(**kwargs)"
-   ]
-  }
- ],
- "metadata": {
-  "kernelspec": {
-   "display_name": "Python 3 (ipykernel)",
-   "language": "python",
-   "name": "python3"
-  },
-  "language_info": {
-   "codemirror_mode": {
-    "name": "ipython",
-    "version": 3
-   },
-   "file_extension": ".py",
-   "mimetype": "text/x-python",
-   "name": "python",
-   "nbconvert_exporter": "python",
-   "pygments_lexer": "ipython3",
-   "version": "3.9.12"
-  }
- },
- "nbformat": 4,
- "nbformat_minor": 5
-}
@@ -0,0 +1,118 @@
+import inspect
+
+import numpy as np
+
+from . import neon_tokyo
+
+# -------- Live line charts----------------------------------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------------------------------------------------------------
+# A LiveLine keeps the artists of a neon line chart alive between updates. Every series owns a ring buffer of its last
+# `capacity` points; append() only writes the new points and hands the base line and its glow a view of the buffer,
+# so an update costs the new points plus one redraw instead of re-sorting the history and rebuilding every layer.
+
+
+class _Ring:
+    # mirrored ring buffer: each point is written twice, `capacity` slots apart, so the newest points are always one
+    # contiguous slice of the buffer (a view, never a copy)
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.buffer = np.empty((2 * capacity, 2))
+        self.end = 0  # next write position, in [0, capacity)
+        self.size = 0
+
+    def extend(self, xy):
+        xy = xy[-self.capacity:]
+        positions = (self.end + np.arange(len(xy))) % self.capacity
+        self.buffer[positions] = xy
+        self.buffer[positions + self.capacity] = xy
+        self.end = (self.end + len(xy)) % self.capacity
+        self.size = min(self.size + len(xy), self.capacity)
+
+    def view(self):
+        stop = self.end + self.capacity
+        return self.buffer[stop - self.size:stop]
+
+
+class LiveLine:
+    # handle returned by neon_tokyo.live_line(); `fig` is the chart, render() encodes it like the chart functions do
+    def __init__(self, fig, capacity, hue, arguments):
+        from matplotlib.collections import LineCollection
+
+        self.fig = fig
+        self.ax = fig.axes[0]
+        self.capacity = capacity
+        self.hue = hue
+        self.arguments = arguments
+        self.series = {}  # hue label (None without a hue) -> (ring buffer, base line, glow collection)
+
+        # line() draws one base line per series and then one glow collection per base line, in the same order
+        glows = [artist for artist in self.ax.collections if isinstance(artist, LineCollection)]
+        for base, glow in zip(self.ax.lines, glows):
+            ring = _Ring(capacity)
+            ring.extend(base.get_xydata())
+            self.series[base.get_label() if hue else None] = (ring, base, glow)
+            self._update(ring, base, glow)
+        self._rescale()
+
+    def append(self, x, y, hue=None, autoscale=True):
+        # x, y: one point or arrays of points for the series `hue`; a hue the chart has not seen yet gets a new series
+        if not self.hue:
+            hue = None
+        elif hue is None:
+            raise ValueError("the chart has a hue: append() needs the hue of the new points")
+        else:
+            hue = f'{hue}'
+        if hue not in self.series:
+            self._add_series(hue)
+
+        ring, base, glow = self.series[hue]
+        x = np.atleast_1d(self.ax.convert_xunits(np.atleast_1d(x)))
+        y = np.atleast_1d(self.ax.convert_yunits(np.atleast_1d(y)))
+        ring.extend(np.column_stack([x, y]).astype(float))
+        self._update(ring, base, glow)
+        if autoscale:
+            self._rescale()
+
+    def render(self, output='png', dpi=None):
+        return neon_tokyo._output(self.fig, output, dpi)
+
+    def _update(self, ring, base, glow):
+        xy = ring.view()
+        base.set_data(xy[:, 0], xy[:, 1])
+        glow.set_segments([xy] * len(glow.get_linewidths()))
+
+    def _rescale(self):
+        views = [ring.view() for ring, base, glow in self.series.values() if ring.size]
+        if not views:
+            return
+        lo = np.nanmin([view.min(axis=0) for view in views], axis=0)
+        hi = np.nanmax([view.max(axis=0) for view in views], axis=0)
+        pad = np.where(hi > lo, (hi - lo) * 0.05, 0.5)
+        self.ax.set_xlim(lo[0] - pad[0], hi[0] + pad[0])
+        self.ax.set_ylim(lo[1] - pad[1], hi[1] + pad[1])
+
+    def _add_series(self, label):
+        # a new series is drawn like line() draws one, under the chart's theme, and the legend is rebuilt for it
+        import matplotlib
+
+        arguments = self.arguments
+        style = {name: arguments[name] for name in neon_tokyo._theme_arguments}
+        color = arguments['bar_color'][len(self.series) % len(arguments['bar_color'])]
+        with neon_tokyo._theme_lock, matplotlib.rc_context(neon_tokyo._theme(**style)):
+            base, = self.ax.plot([], [], color=color, label=label, linestyle=arguments['linestyle'],
+                                 marker=arguments['marker'])
+            glow = neon_tokyo._glow_line(self.ax, base, color, linestyle=arguments['linestyle'])
+            if label is not None:
+                legend = self.ax.legend(loc='upper left', bbox_to_anchor=(1, 1))
+                legend.get_frame().set_facecolor('white')
+                legend.get_title().set_color('white')
+        self.series[label] = (_Ring(self.capacity), base, glow)
+
+
+def line_arguments(kwargs):
+    # the keyword arguments of line() with its defaults filled in
+    signature = inspect.signature(neon_tokyo.line)
+    arguments = {name: parameter.default for name, parameter in signature.parameters.items()
+                 if parameter.default is not inspect.Parameter.empty}
+    arguments.update(kwargs)
+    return arguments
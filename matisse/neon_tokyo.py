@@ -1,17 +1,508 @@
-import seaborn as sns
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
+import functools
+import inspect
+import threading
 import warnings
+import io
 # Suppress all warnings
 warnings.filterwarnings("ignore")
-import matplotlib.patches as mpatches
-import matplotlib.transforms as mtransforms
-import matplotlib.patheffects as path_effects
-from scipy.stats import gaussian_kde
+
+from . import profiling
+from .kde import binned_kde
+
+# pyplot, pandas and seaborn are imported inside the functions that use them, so importing the module (and the
+# package) stays cheap for short-lived workers; seaborn is only loaded by the charts that need it.
+
+# -------- Glow engine---------------------------------------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------------------------------------------------------------
+# The neon glow is a stack of copies of the data drawn with growing line widths and fading alpha.
+# Each hue's stack is built as one pre-batched collection: the geometry is shared by all the layers and only the
+# per-layer linewidth/alpha arrays differ, so the artist count does not grow with the number of glow layers. Only
+# the artist count: each layer still strokes every point, outline or line once more, so drawing the glow costs
+# glow_layers times drawing the data.
+# glow='bloom' (scatter, bar, barh, line, hist) draws no layers: the data is drawn once into a pixel buffer and
+# blurred there, so the glow adds a cost that only depends on the pixel size of the axes (see matisse/bloom.py).
+
+glow_layers = 4
+
+
+def _check_glow(glow):
+    if glow not in ('layers', 'bloom'):
+        raise ValueError(f"glow must be 'layers' or 'bloom', not {glow!r}")
+
+
+@profiling.stage('glow')
+def _glow_bloom(ax, sources):
+    # one blurred copy of the `sources` artists under them
+    from .bloom import Bloom
+
+    return Bloom(ax, sources)
+
+
+def _glow_style(alpha_step, width_step, layers=glow_layers):
+    # widest and faintest layer first, the same order as the old `for i in range(4, 0, -1)` loops
+    steps = np.arange(layers, 0, -1)
+    return steps / alpha_step, steps * width_step
+
+
+def _layer_colors(color, alphas, count):
+    # one RGBA row per (layer, element); the layer alpha replaces the colour's own alpha like `alpha=` did
+    import matplotlib.colors as mcolors
+
+    base = mcolors.to_rgba_array(color)
+    if len(base) == 1:
+        base = np.repeat(base, count, axis=0)
+    rgba = np.tile(base, (len(alphas), 1))
+    rgba[:, 3] = np.repeat(alphas, count)
+    return rgba
+
+
+@profiling.stage('glow')
+def _glow_scatter(ax, x, y, color, s, alpha_step=20, width_step=3):
+    import matplotlib.transforms as mtransforms
+    import matplotlib.markers as mmarkers
+    from matplotlib.collections import PathCollection
+
+    marker = mmarkers.MarkerStyle('o')
+    glow = PathCollection([marker.get_path().transformed(marker.get_transform())], sizes=[s],
+                          offset_transform=ax.transData)
+    glow.set_transform(mtransforms.IdentityTransform())
+    _set_glow_points(glow, np.column_stack([ax.convert_xunits(x), ax.convert_yunits(y)]), color,
+                     alpha_step, width_step)
+    ax.add_collection(glow, autolim=False)
+    return glow
+
+
+def _set_glow_points(glow, offsets, color, alpha_step=20, width_step=3):
+    # (re)fills a scatter glow collection: every layer repeats the offsets with its own alpha and edge width, so the
+    # collection draws glow_layers markers per point
+    alphas, widths = _glow_style(alpha_step, width_step)
+    offsets = np.asarray(offsets, dtype=float).reshape(-1, 2)
+    count = len(offsets)
+    colors = _layer_colors(color, alphas, count)
+    glow.set_offsets(np.tile(offsets, (len(alphas), 1)))
+    glow.set_facecolor(colors)
+    glow.set_edgecolor(colors)
+    glow.set_linewidths(np.repeat(widths, count))
+
+
+@profiling.stage('glow')
+def _glow_polygons(ax, verts, color, alpha_step=20, width_step=3, fill=False, closed=True):
+    # `verts` are polygons in data coordinates; `color` is one colour or one per polygon
+    from matplotlib.collections import PolyCollection
+
+    alphas, widths = _glow_style(alpha_step, width_step)
+    count = len(verts)
+    colors = _layer_colors(color, alphas, count)
+
+    glow = PolyCollection(list(verts) * len(alphas), closed=closed, edgecolors=colors,
+                          facecolors=colors if fill else 'none', linewidths=np.repeat(widths, count))
+    ax.add_collection(glow, autolim=False)
+    return glow
+
+
+@profiling.stage('glow')
+def _glow_patches(ax, patches, color, alpha_step=20, width_step=3, fill=False):
+    # bars (or any patches) already on the axes: their outlines are reused for every glow layer
+    verts = [patch.get_patch_transform().transform(patch.get_path().vertices) for patch in patches]
+    closed = all(patch.get_closed() for patch in patches if hasattr(patch, 'get_closed'))
+    return _glow_polygons(ax, verts, color, alpha_step, width_step, fill=fill, closed=closed)
+
+
+@profiling.stage('glow')
+def _glow_line(ax, line, color, linestyle=None, alpha_step=20, width_step=3):
+    # every layer references the same vertex array of the base line
+    from matplotlib.collections import LineCollection
+
+    alphas, widths = _glow_style(alpha_step, width_step)
+    xy = line.get_xydata()
+
+    glow = LineCollection([xy] * len(alphas), colors=_layer_colors(color, alphas, 1), linewidths=widths,
+                          linestyles=linestyle or 'solid', capstyle='projecting', joinstyle='round')
+    ax.add_collection(glow, autolim=False)
+    return glow
+
+
+# -------- Data prep and hue grouping-----------------------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------------------------------------------------------------
+# `data` can be a pandas DataFrame, a mapping of column names to arrays, a pyarrow Table/RecordBatch, a polars
+# DataFrame or any other object with the dataframe interchange protocol (__dataframe__). Only the referenced columns
+# are pulled out, as numpy arrays that view the source buffers wherever its layout allows (numeric and datetime
+# columns without missing values); strings and columns with nulls are converted on their own, never the whole frame.
+
+def _library(data):
+    # 'pyarrow' for a Table/RecordBatch, 'polars' for a DataFrame, else None. The library is only imported when the
+    # object comes from it, so other inputs never load it; its other objects (pyarrow's interchange frame among them)
+    # go through the generic protocol path
+    library = type(data).__module__.split('.')[0]
+    if library == 'pyarrow':
+        import pyarrow as pa
+
+        return library if isinstance(data, (pa.Table, pa.RecordBatch)) else None
+    if library == 'polars':
+        import polars as pl
+
+        return library if isinstance(data, pl.DataFrame) else None
+    return None
+
+
+def _is_frame(data):
+    import pandas as pd
+    from collections.abc import Mapping
+
+    return isinstance(data, (pd.DataFrame, Mapping)) or _library(data) is not None or hasattr(data, '__dataframe__')
+
+
+def _column_names(data):
+    import pandas as pd
+    from collections.abc import Mapping
+
+    if isinstance(data, pd.DataFrame):
+        return list(data.columns)
+    if isinstance(data, Mapping):
+        return list(data)
+    library = _library(data)
+    if library == 'pyarrow':
+        return list(data.column_names)
+    if library == 'polars':
+        return list(data.columns)
+    return list(data.__dataframe__().column_names())
+
+
+def _columns(data, columns):
+    # {column: numpy array} for the named columns of `data` (see above)
+    import pandas as pd
+    from collections.abc import Mapping
+
+    columns = list(dict.fromkeys(column for column in columns if column is not None))
+    if isinstance(data, pd.DataFrame):
+        return {column: data[column].to_numpy() for column in columns}
+    if isinstance(data, Mapping):
+        return {column: np.asarray(data[column]) for column in columns}
+
+    library = _library(data)
+    if library == 'pyarrow':
+        # Table columns are chunked: a single chunk is viewed in place, several have to be joined
+        arrays = {}
+        for column in columns:
+            values = data.column(column)
+            if getattr(values, 'num_chunks', 1) == 1:
+                values = values.chunk(0) if hasattr(values, 'chunk') else values
+            arrays[column] = values.to_numpy(zero_copy_only=False)
+        return arrays
+    if library == 'polars':
+        return {column: data.get_column(column).to_numpy() for column in columns}
+
+    # the interchange protocol: primitive columns are mapped straight from their data buffer, anything else (strings,
+    # categoricals, nulls, several chunks) goes through pandas' converter, one column at a time
+    frame = data.__dataframe__()
+    arrays = {}
+    for column in columns:
+        arrays[column] = _interchange_view(frame.get_column_by_name(column))
+        if arrays[column] is None:
+            converted = pd.api.interchange.from_dataframe(frame.select_columns_by_name([column]))
+            arrays[column] = converted[column].to_numpy()
+    return arrays
+
+
+def _interchange_view(column):
+    # numpy view of an interchange column's data buffer (ints, uints, floats, 8-bit bools in one chunk with no
+    # nulls other than NaN), or None. The array holds on to the column, which owns the memory.
+    import ctypes
+
+    kind, bits, _, byteorder = column.dtype
+    kinds = {0: 'i', 1: 'u', 2: 'f', 20: 'b'}  # INT, UINT, FLOAT, BOOL in the protocol's DtypeKind
+    if kind not in kinds or bits % 8 or (kind == 20 and bits != 8) or column.num_chunks() != 1:
+        return None
+    null_kind = column.describe_null[0]
+    if null_kind not in (0, 1) and column.null_count != 0:  # NON_NULLABLE, USE_NAN
+        return None
+
+    buffer, _ = column.get_buffers()['data']
+    raw = (ctypes.c_char * buffer.bufsize).from_address(buffer.ptr)
+    raw.owner = column
+    dtype = np.dtype(f"{'<' if byteorder in ('=', '<') else '>'}{kinds[kind]}{bits // 8}")
+    if kind == 20:
+        dtype = np.dtype(bool)
+    values = np.frombuffer(raw, dtype=dtype, count=column.offset + column.size())[column.offset:]
+    values.flags.writeable = False
+    return values
+
+
+def _frame(data, columns=None):
+    # the charts drawn by seaborn need a pandas DataFrame: other inputs are wrapped in one over the named columns
+    # (all of them by default), without copying the arrays
+    import pandas as pd
+
+    if data is None or isinstance(data, pd.DataFrame):
+        return data
+    return pd.DataFrame(_columns(data, _column_names(data) if columns is None else columns), copy=False)
+
+
+@profiling.stage('prep')
+def _prepare(data, columns, hue=None, sort_by=None, ascending=True, dropna=False, presorted=False):
+    # lean prep stage: only the referenced columns are pulled out of `data` (as arrays, the source is never
+    # copied), missing values are dropped on those columns only and the rows are reordered by one sort of `sort_by`.
+    # presorted=True trusts the incoming row order and skips the sort. Returns the arrays by column name and the hue
+    # levels in order of first appearance before the sort (None without a hue), which decides the colours.
+    import pandas as pd
+
+    arrays = _columns(data, list(columns) + [hue or None])
+
+    if dropna:
+        missing = np.logical_or.reduce([pd.isna(values) for values in arrays.values()])
+        if missing.any():
+            arrays = {column: values[~missing] for column, values in arrays.items()}
+
+    levels = pd.unique(arrays[hue]) if hue else None
+
+    if sort_by is not None and not presorted:
+        order = pd.Series(arrays[sort_by]).sort_values(ascending=ascending, kind='stable').index.to_numpy()
+        arrays = {column: values[order] for column, values in arrays.items()}
+    return arrays, levels
+
+
+@profiling.stage('prep')
+def _hue_groups(data, hue, columns, bar_color, levels=None):
+    # factorize `hue` once and cut every referenced column into contiguous per-group arrays that the base and the
+    # glow passes share. `data` is a frame or the arrays from _prepare. Groups follow `levels` (default: first
+    # appearance) and take their colour from that position; rows with a missing hue belong to no group. Without a
+    # hue the whole frame is a single group.
+    import pandas as pd
+
+    arrays = {column: np.asarray(data[column]) for column in columns}
+    if not hue:
+        return [(None, bar_color[0], arrays)]
+
+    if levels is None:
+        codes, levels = pd.factorize(data[hue])
+    else:
+        levels = pd.Index(levels).dropna()
+        codes = levels.get_indexer(data[hue])
+
+    order = np.argsort(codes, kind='stable')  # keeps the incoming row order inside each group
+    bounds = np.searchsorted(codes[order], np.arange(len(levels) + 1))
+    arrays = {column: values[order] for column, values in arrays.items()}
+
+    return [(f'{level}', bar_color[i % len(bar_color)],
+             {column: values[bounds[i]:bounds[i + 1]] for column, values in arrays.items()})
+            for i, level in enumerate(levels)]
+
+# -------- Theme------------------------------------------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------------------------------------------------------------
+# The Neon Tokyo look is compiled once into an rcParams dict and applied around each chart call through
+# matplotlib.rc_context: every artist is created already styled, and nothing is left behind in the global state for
+# the next call (or the user's own plots) to inherit.
+# rcParams are process-wide, so only one thread at a time builds a figure under its theme. Building is the cheap
+# part: the chart hands its finished figure back and the drawing/encoding happens after the lock is released, on
+# the figure's own canvas, so charts rendered from a thread pool only wait for each other while they are set up.
+
+_theme_arguments = ('bg_color', 'font_color', 'font_family', 'font_size', 'grid_color', 'title_pad')
+_theme_lock = threading.RLock()
+
+
+@functools.lru_cache(maxsize=None)
+def _theme(bg_color='#212946', font_color='#FDF0F0', font_family='Sangha', font_size=20, grid_color='#FE53BB',
+           title_pad=15):
+    # the dark seaborn base (renamed 'seaborn-v0_8-dark' in matplotlib 3.6, the old name is gone since 3.8) with the
+    # neon colours, fonts and paddings on top; the grid is styled here but each chart still switches on its own axis
+    import matplotlib.style as mstyle
+
+    library = mstyle.library
+    rc = dict(library.get('seaborn-v0_8-dark', library.get('seaborn-dark', {})))
+    rc.update({
+        'figure.facecolor': bg_color,
+        'axes.facecolor': bg_color,
+        'font.family': font_family,
+        'axes.titlesize': 24,
+        'axes.titlecolor': font_color,
+        'axes.titlepad': title_pad,
+        'axes.labelsize': font_size,
+        'axes.labelcolor': font_color,
+        'axes.labelpad': 10,
+        'xtick.labelcolor': font_color,
+        'ytick.labelcolor': font_color,
+        'grid.color': grid_color,
+        'grid.linestyle': '--',
+        'grid.alpha': 0.7,
+        'legend.labelcolor': 'white',
+    })
+    return rc
+
+
+def _themed(chart):
+    # builds the chart inside the theme made from its own styling arguments (defaults included), then renders the
+    # returned figure to the requested output outside of it
+    signature = inspect.signature(chart)
+
+    @functools.wraps(chart)
+    def themed(*args, **kwargs):
+        import matplotlib
+
+        arguments = signature.bind(*args, **kwargs)
+        arguments.apply_defaults()
+        style = {name: arguments.arguments[name] for name in _theme_arguments if name in arguments.arguments}
+        # drawn into the caller's axes (ax=): the figure is theirs to show or encode, the chart only returns it
+        panel = arguments.arguments.get('ax') is not None
+        if panel:
+            if arguments.arguments['output'] not in (None, 'figure'):
+                raise ValueError("a chart drawn into ax= is part of that axes' figure: leave output to None or "
+                                 "'figure' and encode the figure itself (or use dashboard())")
+            arguments.arguments['output'] = 'panel'
+        with profiling.chart_call(chart.__name__, arguments.arguments.get('data')) as built:
+            with _theme_lock, matplotlib.rc_context(_theme(**style)):
+                profiling.mark('artists')
+                fig = chart(*arguments.args, **arguments.kwargs)
+            built(fig)
+            if panel:
+                return fig
+            profiling.mark('render')
+            return _output(fig, arguments.arguments.get('output'), arguments.arguments.get('dpi'))
+    return themed
+
+
+def _boxplot_labels(labels):
+    # boxplot's labels= became tick_labels= in matplotlib 3.9 and is gone since 3.11
+    from matplotlib.axes import Axes
+
+    return {'tick_labels' if 'tick_labels' in inspect.signature(Axes.boxplot).parameters else 'labels': labels}
+
+
+def _make_ticks(fig):
+    # ticks are only created when first needed and take their style from the rc active at that moment; creating them
+    # inside the rc context pins the theme on them (later ticks copy the first one)
+    for ax in fig.axes:
+        ax.xaxis.get_major_ticks()
+        ax.yaxis.get_major_ticks()
+
+
+def _legend_handles(legend):
+    # renamed from legendHandles in matplotlib 3.7, the old name is gone since 3.9
+    handles = getattr(legend, 'legend_handles', None)
+    return legend.legendHandles if handles is None else handles
+
+# -------- Output-------------------------------------------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------------------------------------------------------------
+
+def _new_figure(output=None, **kwargs):
+    # pyplot's figure manager is only needed to show the figure: for any other output the chart is drawn on a plain
+    # Figure with its own canvas, which is not registered anywhere and can be built and rendered in any thread
+    if output is None:
+        import matplotlib.pyplot as plt
+        return plt.figure(**kwargs)
+
+    from matplotlib.figure import Figure
+    return Figure(**kwargs)
+
+
+def _new_axes(output=None, ax=None, **kwargs):
+    # the axes a single-axes chart draws on: `ax` itself when the caller passes one (a panel of a larger figure, see
+    # dashboard()), else the only axes of a new figure
+    if ax is not None:
+        return ax.figure, ax
+    fig = _new_figure(output, **kwargs)
+    return fig, fig.subplots()
+
+
+def _finish(fig, output=None, dpi=None):
+    # last step of every chart, still inside its theme. output=None keeps the interactive plt.show(); anything else
+    # returns the figure for _output. Figures that seaborn created through pyplot are released from it here.
+    # output='panel' (set for charts drawn into a given ax=) leaves the figure to whoever owns it.
+    _make_ticks(fig)  # the figure is drawn after the chart call (and its theme) is over
+
+    if output == 'panel':
+        return fig
+
+    if output is None:
+        import matplotlib.pyplot as plt
+        profiling.mark('render')
+        plt.show()
+        return None
+
+    if fig.canvas.manager is not None:
+        import matplotlib.pyplot as plt
+        plt.close(fig)
+    return fig
+
+
+def _output(fig, output=None, dpi=None):
+    # 'figure' returns the Figure itself, 'png'/'svg'/'pdf' return the encoded bytes and a binary file-like object
+    # gets the image written into it (format taken from its name, png by default)
+    if fig is None or output is None:
+        return None
+
+    if output == 'figure':
+        if dpi is not None:
+            fig.set_dpi(dpi)
+        return fig
+
+    if isinstance(output, str):
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=output, dpi=dpi if dpi is not None else 'figure', bbox_inches='tight')
+        return buffer.getvalue()
+
+    fig.savefig(output, dpi=dpi if dpi is not None else 'figure', bbox_inches='tight')
+    return output
 
 # -------- Scatterplot----------------------------------------------------------------------------------------------------------------
 # ------------------------------------------------------------------------------------------------------------------------------------
+
+@profiling.stage('glow')
+def _scatter_image(ax, groups, x_column, y_column, s, dpi=None):
+    # density-aggregated scatter: every hue is binned onto the pixel grid of the axes, shaded in its colour with a
+    # log-scaled opacity and composited in hue order; the glow is a blurred copy of that image laid underneath.
+    # The cost is O(rows) for the binning and O(pixels) for everything after it, and only one image artist is drawn.
+    points = []
+    for label, color, columns in groups:
+        ax.xaxis.update_units(columns[x_column])
+        ax.yaxis.update_units(columns[y_column])
+        x = np.asarray(ax.convert_xunits(columns[x_column]), dtype=float)
+        y = np.asarray(ax.convert_yunits(columns[y_column]), dtype=float)
+        finite = np.isfinite(x) & np.isfinite(y)
+        points.append((color, x[finite], y[finite]))
+
+    xs = np.concatenate([x for _, x, _ in points])
+    ys = np.concatenate([y for _, _, y in points])
+    if not len(xs):
+        return None
+    extent = []
+    for values in (xs, ys):
+        lo, hi = values.min(), values.max()
+        pad = (hi - lo) * 0.05 if hi > lo else 0.5
+        extent += [lo - pad, hi + pad]
+
+    image = _shade_points(points, extent, _pixel_shape(ax, dpi), np.sqrt(s) / 2 * (dpi or ax.figure.dpi) / 72)
+    return ax.imshow(image, extent=extent, origin='lower', aspect='auto', interpolation='nearest', zorder=1)
+
+
+def _pixel_shape(ax, dpi=None):
+    # (rows, cols) with one cell per output pixel of the axes, so an image on it is not resampled when it is saved
+    scale = (dpi or ax.figure.dpi) / ax.figure.dpi
+    box = ax.get_window_extent()
+    return max(int(box.height * scale), 1), max(int(box.width * scale), 1)
+
+
+def _shade_points(points, extent, shape, radius):
+    # (color, x, y) per hue, in data units -> straight RGBA image of `shape` covering `extent`, for imshow.
+    # Markers are spread over about their own `radius` (in pixels), the glow over a few radii. The spread counts are
+    # rescaled so a lone point peaks at 1 and the faint tails below a tenth of that are cleared.
+    from .raster import bin2d, gaussian_blur, shade, over, unpremultiply
+
+    sigma = radius / 3
+    counts = []
+    for _, x, y in points:
+        spread = gaussian_blur(bin2d(x, y, extent, shape), sigma) * (2 * np.pi * sigma ** 2)
+        spread[spread < 0.1] = 0
+        counts.append(spread)
+    peak = max([c.max() for c in counts], default=0)
+    image = np.zeros(tuple(shape) + (4,), dtype=np.float32)
+    for (color, _, _), c in zip(points, counts):
+        image = over(shade(c, color, peak=peak) * 0.7, image)
+    image = over(image, gaussian_blur(image, radius * 1.5) * 0.6)
+    return unpremultiply(image)
+
+
+@_themed
 def scatter(data, y_column, x_column,
                font_family='Sangha', font_color='#FDF0F0', font_size=20,
                title_pad=15, bg_color='#212946', grid_color='#FE53BB',
@@ -21,45 +512,41 @@ def scatter(data, y_column, x_column,
                hue=None, 
                s=80,          
                alpha=0.7,
-               rotation=0, figsize=(10,8), annotation='', ann_x=1.45,ann_y=-0.2, x_name=None, y_name=None):     
+               rotation=0, figsize=(10,8), annotation='', ann_x=1.45,ann_y=-0.2, x_name=None, y_name=None,
+               aggregate=None, aggregate_threshold=200_000, glow='layers', ax=None, output=None, dpi=None):
+    # aggregate=True draws the points as a density image instead of one marker per row (see _scatter_image);
+    # the default switches to it on its own once the frame has more than `aggregate_threshold` rows
                
-    plt.style.use("seaborn-dark")
+    _check_glow(glow)
+    fig, ax = _new_axes(output, ax, figsize=figsize)
 
-    fig, ax = plt.subplots(figsize=figsize)
-    fig.set_facecolor(bg_color)
-    ax.set_facecolor(bg_color)
+    # the points of one hue share a colour, so their drawing order does not show and the rows are not sorted
+    arrays, levels = _prepare(data, [x_column, y_column], hue)
+    groups = _hue_groups(arrays, hue, [x_column, y_column], bar_color, levels=levels)
 
-    data_sorted = data.sort_values(by=y_column, ascending=False)  # Sort data globally in ascending order
+    if aggregate is None:
+        aggregate = len(arrays[x_column]) > aggregate_threshold
 
-    if hue:
-        unique_hue_values = data[hue].unique()
-
-        for hue_value in unique_hue_values:
-            data_filtered = data_sorted[data_sorted[hue] == hue_value]
-            label = f'{hue_value}'  # Label for the legend
-            color_index = np.where(unique_hue_values == hue_value)[0][0]
-            color = bar_color[color_index % len(bar_color)]
-            # Explicitly assign labels to the bars
-            bars = ax.scatter(data_filtered[x_column], data_filtered[y_column],color=color, s=s, edgecolor=color, label=label, alpha=0.7)
-    else:
-        [None]  # Get unique "hue" values
-        data_filtered = data_sorted
-        label = None
-        color_index = 0
-        color = bar_color[color_index % len(bar_color)]
-        # Explicitly assign labels to the bars
-        bars = ax.scatter(data_filtered[x_column], data_filtered[y_column], s=s,color=color, edgecolor=color, label=label, alpha=0.7)
+    base_points = []  # (collection, color) pairs the glow is built from
+    for label, color, columns in groups:
+        if aggregate:
+            # legend handle only, the points themselves are part of the density image
+            ax.scatter([], [], color=color, s=s, edgecolor=color, label=label, alpha=0.7)
+        else:
+            bars = ax.scatter(columns[x_column], columns[y_column], color=color, s=s, edgecolor=color, label=label, alpha=0.7)
+            base_points.append((bars, color))
 
+    if aggregate:
+        _scatter_image(ax, groups, x_column, y_column, s, dpi)
 
 
+    profiling.mark('legend')
     if hue:
         legend = ax.legend(loc='upper left', bbox_to_anchor=(1, 1))
 
         title = legend.get_title()
         title.set_color('white')  # Set the legend title's text color to white
 
-        for text in legend.get_texts():
-            text.set_color('white')  # Set the legend item text color to white
 
             
     if x_name==None:
@@ -67,42 +554,29 @@ def scatter(data, y_column, x_column,
     if y_name==None:
         y_name=y_column
         
-    plt.xlabel(x_name, fontname=font_family, fontsize=font_size, color=font_color)
-    plt.ylabel(y_name, fontname=font_family, fontsize=font_size, color=font_color)
+    ax.set_xlabel(x_name)
+    ax.set_ylabel(y_name)
 
     if not plot_title is None:
-        ax.set_title(plot_title, fontsize=24, fontname=font_family, pad=title_pad, color=font_color)
+        ax.set_title(plot_title)
     else:
-        ax.set_title(label=f'{x_column} by {y_column}', fontsize=24, fontname=font_family, pad=title_pad, color=font_color)
-    plt.xticks(rotation=rotation, color=font_color)
-    plt.yticks(color=font_color)
-
-    plt.grid(axis='y', linestyle='--', color=grid_color, alpha=0.7)
-
-    for i in range(4, 0, -1):
-        alpha = i / 20  # Varies alpha from 1 to 0 (fully visible to fully transparent)
-        linewidth = i * 3  # Varies line thickness
-        if hue:
-            for hue_value in unique_hue_values:
-                color_index = np.where(unique_hue_values == hue_value)[0][0] if hue else 0
-                color = bar_color[color_index % len(bar_color)]
-                data_filtered = data_sorted[data_sorted[hue] == hue_value]
-                bars = ax.scatter(data_filtered[x_column], data_filtered[y_column], edgecolor=color,
-                              linewidth=linewidth, label=label,
-                              alpha=alpha, s=s)
-
-        else:
-            bars = ax.scatter(data_filtered[x_column], data_filtered[y_column], edgecolor=color, 
-                          linewidth=linewidth, label=label,
-                          alpha=alpha, s=s)
+        ax.set_title(label=f'{x_column} by {y_column}')
+    ax.tick_params(axis='x', labelrotation=rotation)
+
+    ax.grid(True, axis='y')
+
+    # the glow: one pre-batched collection per hue holding all the layers, or one bloom under all of them (already
+    # in the image when aggregated)
+    if not aggregate and glow == 'bloom':
+        _glow_bloom(ax, [points for points, _ in base_points])
+    elif not aggregate:
+        for label, color, columns in groups:
+            _glow_scatter(ax, columns[x_column], columns[y_column], color, s)
             
             
-    # adding padding to axis        
-    for ax in plt.gcf().get_axes():
-        ax.yaxis.labelpad = 10
-        ax.xaxis.labelpad = 10        
             
     # annotation
+    profiling.mark('annotation')
     annotation_text = annotation
     annotation_x = ann_x  # Keep it at the right edge to position the annotation to the right
     annotation_y = ann_y  # Y-coordinate of the annotation (negative value to place it at the bottom)
@@ -123,11 +597,105 @@ def scatter(data, y_column, x_column,
 
  
             
-    plt.show()
-                
+    return _finish(fig, output, dpi)
+
+
+def animate_scatter(data, y_column, x_column, frame_column=None, hue=None, output='frames', fps=10, dpi=None,
+                    s=80, aggregate=None, aggregate_threshold=20_000, **kwargs):
+    # scatter() over time: one frame per value of `frame_column` (in sorted order), or one per DataFrame when `data` is
+    # an iterable of frames. The axes, grid, labels and legend are drawn once and cached, every frame only redraws the
+    # points on top of them (matisse/animate.py). Frames larger than `aggregate_threshold` rows are drawn as density
+    # images like scatter(aggregate=True), which keeps the frame rate independent of the point count. The other
+    # keyword arguments are scatter()'s. output: 'frames' (list of RGBA arrays), 'gif' or 'mp4' (bytes), or a path
+    # ending in .gif/.mp4.
+    import pandas as pd
+    from .animate import blit_frames, encode
+
+    columns = [x_column, y_column]
+    if frame_column is not None:
+        arrays, _ = _prepare(data, columns + [frame_column], hue)
+        codes, keys = pd.factorize(arrays[frame_column], sort=True)
+        order = np.argsort(codes, kind='stable')
+        bounds = np.searchsorted(codes[order], np.arange(len(keys) + 1))
+        arrays = {column: values[order] for column, values in arrays.items()}
+        frames = [{column: values[bounds[i]:bounds[i + 1]] for column, values in arrays.items()}
+                  for i in range(len(keys))]
+    else:
+        frames = [_prepare(frame, columns, hue)[0] for frame in data]
+    if not frames:
+        raise ValueError("animate_scatter needs at least one frame")
+    everything = {column: np.concatenate([frame[column] for frame in frames]) for column in frames[0]}
+    if aggregate is None:
+        aggregate = max(len(frame[x_column]) for frame in frames) > aggregate_threshold
+
+    # the chart itself is built on the first row of every hue, so each hue gets its colour, collections and legend
+    # entry in the usual order; the points are only ever drawn per frame
+    first = pd.Series(everything[hue]).drop_duplicates().index if hue else [0]
+    seed = pd.DataFrame({column: values[first] for column, values in everything.items()})
+    fig = scatter(seed, y_column, x_column, hue=hue, s=s, aggregate=aggregate, output='figure', dpi=dpi, **kwargs)
+    ax = fig.axes[0]
+
+    # the background has to hold every frame: all the categories are registered and the limits cover all the points
+    ax.xaxis.update_units(everything[x_column])
+    ax.yaxis.update_units(everything[y_column])
+    for values, set_limits in ((ax.convert_xunits(everything[x_column]), ax.set_xlim),
+                               (ax.convert_yunits(everything[y_column]), ax.set_ylim)):
+        values = np.asarray(values, dtype=float)
+        values = values[np.isfinite(values)]
+        if len(values):
+            lo, hi = values.min(), values.max()
+            pad = (hi - lo) * 0.05 if hi > lo else 0.5
+            set_limits(lo - pad, hi + pad)
+
+    # scatter() adds one marker collection per hue, then one glow collection per hue (or, aggregated, empty legend
+    # handles and one image; with glow='bloom', one Bloom artist under the markers)
+    blooms = list(ax.artists) if kwargs.get('glow') == 'bloom' and not aggregate else []
+    count = len(ax.collections) // (1 if aggregate or blooms else 2)
+    colors = [base.get_edgecolor()[0] for base in ax.collections[:count]]
+    levels = pd.unique(seed[hue]) if hue else None
+
+    def points(frame):
+        for (label, color, group), rgba in zip(_hue_groups(frame, hue, columns, [None], levels=levels), colors):
+            yield rgba, np.asarray(ax.convert_xunits(group[x_column]), dtype=float), \
+                np.asarray(ax.convert_yunits(group[y_column]), dtype=float)
+
+    if aggregate:
+        image = ax.images[0]
+        extent = [*ax.get_xlim(), *ax.get_ylim()]
+        image.set_extent(extent)
+        box = ax.get_window_extent()
+        shape = (max(int(box.height), 1), max(int(box.width), 1))
+        radius = np.sqrt(s) / 2 * fig.dpi / 72
+
+        def update(frame):
+            image.set_data(_shade_points(list(points(frame)), extent, shape, radius))
+        artists = [image]
+    elif blooms:
+        bases = ax.collections[:count]
+
+        def update(frame):
+            for base, (rgba, x, y) in zip(bases, points(frame)):
+                base.set_offsets(np.column_stack([x, y]))
+        # the bloom draws the markers itself, with their glow; they stay in the list so they are animated (kept out of
+        # the background) and skip their own draw once the bloom has drawn them
+        artists = blooms + bases
+    else:
+        layers = list(zip(ax.collections[:count], ax.collections[count:]))
+
+        def update(frame):
+            for (base, glow), (rgba, x, y) in zip(layers, points(frame)):
+                base.set_offsets(np.column_stack([x, y]))
+                _set_glow_points(glow, np.column_stack([x, y]), rgba)
+        # same stacking as the static chart: every marker collection, then every glow
+        artists = [base for base, glow in layers] + [glow for base, glow in layers]
+
+    return encode(blit_frames(fig, artists, update, frames), output, fps)
+
+
 # -------- Barplot--------------------------------------------------------------------------------------------------------------------
 # ------------------------------------------------------------------------------------------------------------------------------------
 
+@_themed
 def bar(data, y_column, x_column,
                font_family='Sangha', font_color='#FDF0F0', font_size=20,
                title_pad=15, bg_color='#212946', grid_color='#FE53BB',
@@ -136,53 +704,39 @@ def bar(data, y_column, x_column,
                plot_title=None,
                hue=None,
                bar_fill='empty',
-               rotation=0, figsize=(10,8), annotation='', ann_x=1.45,ann_y=-0.2, x_name=None, y_name=None):
+               rotation=0, figsize=(10,8), annotation='', ann_x=1.45,ann_y=-0.2, x_name=None, y_name=None,
+               presorted=False, glow='layers', ax=None, output=None, dpi=None):
+    # presorted=True: the rows already come in the order the bars should appear (largest y_column first)
+
+    import matplotlib.patheffects as path_effects
     
-    plt.style.use("seaborn-dark")
+    _check_glow(glow)
 
-    fig, ax = plt.subplots(figsize=figsize)
-    fig.set_facecolor(bg_color)
-    ax.set_facecolor(bg_color)
+    fig, ax = _new_axes(output, ax, figsize=figsize)
 
-    data_sorted = data.sort_values(by=y_column, ascending=False)  # Sort data globally in ascending order
-    
-    if hue:
-        unique_hue_values = data[hue].unique()
-
-        for hue_value in unique_hue_values:
-            data_filtered = data_sorted[data_sorted[hue] == hue_value]
-            label = f'{hue_value}'  # Label for the legend
-            color_index = np.where(unique_hue_values == hue_value)[0][0]
-            color = bar_color[color_index % len(bar_color)]
-            # Explicitly assign labels to the bars
-            if bar_fill == 'full':
-                bars = ax.bar(data_filtered[x_column], data_filtered[y_column],alpha=0.8, facecolor=color, edgecolor=color, width=width, label=label)
-            else:
-                bars = ax.bar(data_filtered[x_column], data_filtered[y_column], color='none', edgecolor=color, width=width, label=label)
-    else:
-        [None]  # Get unique "hue" values
-        data_filtered = data_sorted
-        label = None
-        color_index = 0
-        color = bar_color[color_index % len(bar_color)]
+    # the sort decides the order of the categories along the axis: largest y_column first
+    arrays, levels = _prepare(data, [x_column, y_column], hue, sort_by=y_column, ascending=False, presorted=presorted)
+
+    base_bars = []  # (container, color) pairs the glow is built from
+    for label, color, columns in _hue_groups(arrays, hue, [x_column, y_column], bar_color, levels=levels):
         # Explicitly assign labels to the bars
         if bar_fill == 'full':
-            bars = ax.bar(data_filtered[x_column], data_filtered[y_column], color=color, edgecolor=color, width=width, label=label, facecolor=color)
+            bars = ax.bar(columns[x_column], columns[y_column], alpha=0.8 if hue else None, facecolor=color, edgecolor=color, width=width, label=label)
         else:
-            bars = ax.bar(data_filtered[x_column], data_filtered[y_column], color='none', edgecolor=color, width=width, label=label)
+            bars = ax.bar(columns[x_column], columns[y_column], color='none', edgecolor=color, width=width, label=label)
+        base_bars.append((bars, color))
 
 
 
+    profiling.mark('legend')
     if hue:
         legend = ax.legend(loc='upper left', bbox_to_anchor=(1, 1))
 
         title = legend.get_title()
         title.set_color('white')  # Set the legend title's text color to white
 
-        for text in legend.get_texts():
-            text.set_color('white')  # Set the legend item text color to white
         # Get the handles (bars) and labels
-        handles, labels = ax.get_legend().legendHandles, [text.get_text() for text in legend.get_texts()]    
+        handles, labels = _legend_handles(ax.get_legend()), [text.get_text() for text in legend.get_texts()]    
         for handle, label in zip(handles, labels):
             # Set the color of the handle to match the label's color
             color = handle.get_edgecolor()
@@ -198,64 +752,28 @@ def bar(data, y_column, x_column,
         y_name=y_column
         
         
-    plt.xlabel(x_name, fontname=font_family, fontsize=font_size, color=font_color)
-    plt.ylabel(y_name, fontname=font_family, fontsize=font_size, color=font_color)
+    ax.set_xlabel(x_name)
+    ax.set_ylabel(y_name)
 
     if not plot_title is None:
-        ax.set_title(plot_title, fontsize=24, fontname=font_family, pad=title_pad, color=font_color)
+        ax.set_title(plot_title)
     else:
-        ax.set_title(label=f'{x_column} by {y_column}', fontsize=24, fontname=font_family, pad=title_pad, color=font_color)
-    plt.xticks(rotation=rotation, color=font_color)
-    plt.yticks(color=font_color)
-
-    plt.grid(axis='y', linestyle='--', color=grid_color, alpha=0.7)
-
-    if bar_fill == 'empty':
-        for i in range(4, 0, -1):
-            alpha = i / 20  # Varies alpha from 1 to 0 (fully visible to fully transparent)
-            linewidth = i * 3  # Varies line thickness
-            if hue:
-                for hue_value in unique_hue_values:
-                    color_index = np.where(unique_hue_values == hue_value)[0][0] if hue else 0
-                    color = bar_color[color_index % len(bar_color)]
-                    data_filtered = data_sorted[data_sorted[hue] == hue_value]
-                    bars = ax.bar(data_filtered[x_column], data_filtered[y_column],
-                                  color='none', edgecolor=color,
-                                  linewidth=linewidth, label=label,
-                                  alpha=alpha)
+        ax.set_title(label=f'{x_column} by {y_column}')
+    ax.tick_params(axis='x', labelrotation=rotation)
 
-            else:
-                bars = ax.bar(data_filtered[x_column], data_filtered[y_column],
-                              color='none', edgecolor=color, 
-                              linewidth=linewidth, label=label,
-                              alpha=alpha)
-
-    elif bar_fill == 'full' or bar_fill=='semi':
-        for i in range(4, 0, -1):
-            alpha = i / 23  # Varies alpha from 1 to 0 (fully visible to fully transparent)
-            linewidth = i * 3  # Varies line thickness
-            if hue:
-                for hue_value in unique_hue_values:
-                    color_index = np.where(unique_hue_values == hue_value)[0][0] if hue else 0
-                    color = bar_color[color_index % len(bar_color)]
-                    data_filtered = data_sorted[data_sorted[hue] == hue_value]
-                    bars = ax.bar(data_filtered[x_column], data_filtered[y_column],
-                                  color='none', edgecolor=color,
-                                  linewidth=linewidth, label=label,
-                                  alpha=alpha,facecolor=color)
+    ax.grid(True, axis='y')
+
+    # the glow: one pre-batched collection per hue, reusing the outlines of the base bars, or one bloom under them
+    if bar_fill in ('empty', 'full', 'semi') and glow == 'bloom':
+        _glow_bloom(ax, [patch for bars, _ in base_bars for patch in bars.patches])
+    elif bar_fill in ('empty', 'full', 'semi'):
+        fill = bar_fill != 'empty'
+        for bars, color in base_bars:
+            _glow_patches(ax, bars.patches, color, alpha_step=23 if fill else 20, fill=fill)
 
-            else:
-                bars = ax.bar(data_filtered[x_column], data_filtered[y_column],
-                              color='none', edgecolor=color, facecolor=color,
-                              linewidth=linewidth, label=label,
-                              alpha=alpha)
-                
-                
-    for ax in plt.gcf().get_axes():
-        ax.yaxis.labelpad = 10
-        ax.xaxis.labelpad = 10            
                 
     # annotation
+    profiling.mark('annotation')
     annotation_text = annotation
     annotation_x = ann_x  # Keep it at the right edge to position the annotation to the right
     annotation_y = ann_y  # Y-coordinate of the annotation (negative value to place it at the bottom)
@@ -275,10 +793,11 @@ def bar(data, y_column, x_column,
         vertical_position -= vertical_spacing 
         
                         
-    plt.show()        
+    return _finish(fig, output, dpi)
 
 # -------- Barhplot-------------------------------------------------------------------------------------------------------------------
 # ------------------------------------------------------------------------------------------------------------------------------------
+@_themed
 def barh(data, y_column, x_column,
                font_family='Sangha', font_color='#FDF0F0', font_size=20,
                title_pad=15, bg_color='#212946', grid_color='#FE53BB',
@@ -287,45 +806,32 @@ def barh(data, y_column, x_column,
                plot_title=None,
                hue=None,
                bar_fill='empty',
-               rotation=0, figsize=(10,8), annotation='', ann_x=1.45,ann_y=-0.2, y_name=None, x_name=None):
+               rotation=0, figsize=(10,8), annotation='', ann_x=1.45,ann_y=-0.2, y_name=None, x_name=None,
+               presorted=False, glow='layers', ax=None, output=None, dpi=None):
+    # presorted=True: the rows already come in the order the bars should appear (ascending x_column)
+
+    import matplotlib.patheffects as path_effects
     
-    plt.style.use("seaborn-dark")
+    _check_glow(glow)
 
-    fig, ax = plt.subplots(figsize=figsize)
-    fig.set_facecolor(bg_color)
-    ax.set_facecolor(bg_color)
+    fig, ax = _new_axes(output, ax, figsize=figsize)
 
-    data_sorted = data.sort_values(by=y_column, ascending=False)  # Sort data globally in ascending order
-    
-    data_sorted = data.sort_values(by=x_column, ascending=True)
-    
-    if hue:
-        unique_hue_values = data[hue].unique()
-
-        for hue_value in unique_hue_values:
-            data_filtered = data_sorted[data_sorted[hue] == hue_value]
-            label = f'{hue_value}'  # Label for the legend
-            color_index = np.where(unique_hue_values == hue_value)[0][0]
-            color = bar_color[color_index % len(bar_color)]
-            # Explicitly assign labels to the bars
-            if bar_fill == 'full':
-                bars = ax.barh(data_filtered[y_column], data_filtered[x_column],alpha=0.8, facecolor=color, edgecolor=color, label=label)
-            else:
-                bars = ax.barh(data_filtered[y_column], data_filtered[x_column], color='none', edgecolor=color, label=label)
-    else:
-        [None]  # Get unique "hue" values
-        data_filtered = data_sorted
-        label = None
-        color_index = 0
-        color = bar_color[color_index % len(bar_color)]
+    # the sort decides the order of the categories along the axis: ascending x_column (the descending sort by
+    # y_column that used to precede it was discarded by this one anyway)
+    arrays, levels = _prepare(data, [x_column, y_column], hue, sort_by=x_column, presorted=presorted)
+
+    base_bars = []  # (container, color) pairs the glow is built from
+    for label, color, columns in _hue_groups(arrays, hue, [x_column, y_column], bar_color, levels=levels):
         # Explicitly assign labels to the bars
         if bar_fill == 'full':
-            bars = ax.barh(data_filtered[y_column], data_filtered[x_column], color=color, edgecolor=color, label=label, facecolor=color)
+            bars = ax.barh(columns[y_column], columns[x_column], alpha=0.8 if hue else None, facecolor=color, edgecolor=color, label=label)
         else:
-            bars = ax.barh(data_filtered[y_column], data_filtered[x_column], color='none', edgecolor=color, label=label)
+            bars = ax.barh(columns[y_column], columns[x_column], color='none', edgecolor=color, label=label)
+        base_bars.append((bars, color))
 
 
 
+    profiling.mark('legend')
     if hue:
         legend = ax.legend(loc='upper left', bbox_to_anchor=(1, 1))
         frame = legend.get_frame()
@@ -334,10 +840,8 @@ def barh(data, y_column, x_column,
         title = legend.get_title()
         title.set_color('white')  # Set the legend title's text color to white
 
-        for text in legend.get_texts():
-            text.set_color('white')  # Set the legend item text color to white
         # Get the handles (bars) and labels
-        handles, labels = ax.get_legend().legendHandles, [text.get_text() for text in legend.get_texts()]
+        handles, labels = _legend_handles(ax.get_legend()), [text.get_text() for text in legend.get_texts()]
         for handle, label in zip(handles, labels):
             # Set the color of the handle to match the label's color
             color = handle.get_edgecolor()
@@ -352,66 +856,28 @@ def barh(data, y_column, x_column,
     if y_name==None:
         y_name=y_column        
 
-    plt.xlabel(x_name, fontname=font_family, fontsize=font_size, color=font_color)
-    plt.ylabel(y_name, fontname=font_family, fontsize=font_size, color=font_color)
+    ax.set_xlabel(x_name)
+    ax.set_ylabel(y_name)
 
     if not plot_title is None:
-        ax.set_title(plot_title, fontsize=24, fontname=font_family, pad=title_pad, color=font_color)
+        ax.set_title(plot_title)
     else:
-        ax.set_title(label=f'{x_column} by {y_column}', fontsize=24, fontname=font_family, pad=title_pad, color=font_color)
-    plt.xticks(rotation=rotation, color=font_color)
-    plt.yticks(color=font_color)
-
-    plt.grid(axis='x', linestyle='--', color=grid_color, alpha=0.7)
-
-    if bar_fill == 'empty':
-        for i in range(4, 0, -1):
-            alpha = i / 20  # Varies alpha from 1 to 0 (fully visible to fully transparent)
-            linewidth = i * 3  # Varies line thickness
-            if hue:
-                for hue_value in unique_hue_values:
-                    color_index = np.where(unique_hue_values == hue_value)[0][0] if hue else 0
-                    color = bar_color[color_index % len(bar_color)]
-                    data_filtered = data_sorted[data_sorted[hue] == hue_value]
-                    bars = ax.barh(data_filtered[y_column], data_filtered[x_column],
-                                  color='none', edgecolor=color,
-                                  linewidth=linewidth, label=label,
-                                  alpha=alpha)
+        ax.set_title(label=f'{x_column} by {y_column}')
+    ax.tick_params(axis='x', labelrotation=rotation)
 
-            else:
-                bars = ax.barh(data_filtered[y_column], data_filtered[x_column],
-                              color='none', edgecolor=color, 
-                              linewidth=linewidth, label=label,
-                              alpha=alpha)
-
-    elif bar_fill == 'full' or bar_fill=='semi':
-        for i in range(4, 0, -1):
-            alpha = i / 23  # Varies alpha from 1 to 0 (fully visible to fully transparent)
-            linewidth = i * 3  # Varies line thickness
-            if hue:
-                for hue_value in unique_hue_values:
-                    color_index = np.where(unique_hue_values == hue_value)[0][0] if hue else 0
-                    color = bar_color[color_index % len(bar_color)]
-                    data_filtered = data_sorted[data_sorted[hue] == hue_value]
-                    bars = ax.barh(data_filtered[y_column], data_filtered[x_column],
-                                  color='none', edgecolor=color,
-                                  linewidth=linewidth, label=label,
-                                  alpha=alpha,facecolor=color)
+    ax.grid(True, axis='x')
+
+    # the glow: one pre-batched collection per hue, reusing the outlines of the base bars, or one bloom under them
+    if bar_fill in ('empty', 'full', 'semi') and glow == 'bloom':
+        _glow_bloom(ax, [patch for bars, _ in base_bars for patch in bars.patches])
+    elif bar_fill in ('empty', 'full', 'semi'):
+        fill = bar_fill != 'empty'
+        for bars, color in base_bars:
+            _glow_patches(ax, bars.patches, color, alpha_step=23 if fill else 20, fill=fill)
 
-            else:
-                bars = ax.barh(data_filtered[y_column], data_filtered[x_column],
-                              color='none', edgecolor=color, facecolor=color,
-                              linewidth=linewidth, label=label,
-                              alpha=alpha)
-                
-                
-     # spacing for axis           
-                
-    for ax in plt.gcf().get_axes():
-                ax.yaxis.labelpad = 10
-                ax.xaxis.labelpad = 10
 
     # annotation
+    profiling.mark('annotation')
     annotation_text = annotation
     annotation_x = ann_x  # Keep it at the right edge to position the annotation to the right
     annotation_y = ann_y  # Y-coordinate of the annotation (negative value to place it at the bottom)
@@ -432,7 +898,7 @@ def barh(data, y_column, x_column,
         
         
         
-    plt.show()             
+    return _finish(fig, output, dpi)
 
 
 
@@ -441,6 +907,32 @@ def barh(data, y_column, x_column,
 # -------- Lineplot-------------------------------------------------------------------------------------------------------------------
 # ------------------------------------------------------------------------------------------------------------------------------------
 
+def _min_max_decimate(x, y, buckets):
+    # per-pixel envelope of a series: x is cut into `buckets` equal spans, one per pixel column of the axes, and each
+    # span keeps only its first, lowest, highest and last sample, so every peak and the path between columns survive.
+    # At most 4 * buckets points are left, whatever the length of the input. A span is only a run of the drawing
+    # order when x is monotonic in it; any other path (line() follows descending y_column unless presorted) is kept
+    # whole, since dropping points from it would move the line.
+    count = len(y)
+    if count <= 4 * buckets or y.dtype.kind not in 'biuf' or x.dtype.kind not in 'biufmM':
+        return x, y
+    position = x.astype(np.int64) if x.dtype.kind in 'mM' else x
+    steps = np.diff(position)
+    if not ((steps >= 0).all() or (steps <= 0).all()):
+        return x, y
+
+    width = position[-1] - position[0]
+    column = np.zeros(count, dtype=np.intp) if width == 0 else \
+        np.minimum(((position - position[0]) / width * buckets).astype(np.intp), buckets - 1)
+    starts = np.flatnonzero(np.concatenate([[True], column[1:] != column[:-1]]))
+    ends = np.concatenate([starts[1:], [count]]) - 1
+    # sorted by y within each column: the first and last of a run are its lowest and highest sample
+    order = np.lexsort((y, column))
+    keep = np.unique(np.concatenate([starts, ends, order[starts], order[ends]]))
+    return x[keep], y[keep]
+
+
+@_themed
 def line(data, y_column, x_column,
          font_family='Sangha', font_color='#FDF0F0', font_size=20,
          title_pad=15, bg_color='#212946', grid_color='#FE53BB',
@@ -452,43 +944,34 @@ def line(data, y_column, x_column,
          linestyle=None,  # lineplot param
          marker=None,
          rotation=0,
-        figsize=(10,8), ann_x=1.15,ann_y=-0.2, x_name=None, y_name=None):
+        figsize=(10,8), annotation='', ann_x=1.15,ann_y=-0.2, x_name=None, y_name=None, decimate=True,
+         presorted=False, glow='layers', ax=None, output=None, dpi=None):
+    # presorted=True: the rows already come in the order the line should follow (descending y_column)
+    # decimate=True cuts every series that runs along x (presorted by x) down to a min/max envelope of the pixel
+    # columns of the axes before drawing, so long series cost what the output resolution costs (see _min_max_decimate)
 
-    plt.style.use("seaborn-dark")
+    _check_glow(glow)
 
-    fig, ax = plt.subplots(figsize=figsize)
-    fig.set_facecolor(bg_color)
-    ax.set_facecolor(bg_color)
+    fig, ax = _new_axes(output, ax, figsize=figsize)
     
-    data=data.dropna()
-
-    data_sorted = data.sort_values(by=y_column, ascending=False)  # Sort data globally in ascending order
-
-    if hue:
-        unique_hue_values = data[hue].unique()
-
-        for hue_value in unique_hue_values:
-            data_filtered = data_sorted[data_sorted[hue] == hue_value]
-            label = f'{hue_value}'  # Label for the legend
-            color_index = np.where(unique_hue_values == hue_value)[0][0]
-            color = bar_color[color_index % len(bar_color)]
-            # Explicitly assign labels to the bars
-            valid_data = data_filtered.dropna(subset=[x_column, y_column])  # Remove rows with NaN values in x_column or y_column
-            if not valid_data.empty:
-                bars = ax.plot(valid_data[x_column], valid_data[y_column],
-                               color=color, label=label, linestyle=linestyle, marker=marker)
-    else:
-        [None]  # Get unique "hue" values
-        data_filtered = data_sorted
-        label = None
-        color_index = 0
-        color = bar_color[color_index % len(bar_color)]
-        # Explicitly assign labels to the bars
-        valid_data = data_filtered.dropna(subset=[x_column, y_column])  # Remove rows with NaN values in x_column or y_column
-        if not valid_data.empty:
-            bars = ax.plot(valid_data[x_column], valid_data[y_column],
+    # the sort decides the path of the line; missing values are only dropped from the columns that are drawn
+    arrays, levels = _prepare(data, [x_column, y_column], hue, sort_by=y_column, ascending=False, dropna=True,
+                              presorted=presorted)
+
+    # one bucket per output pixel column of the axes
+    buckets = int(ax.get_window_extent().width * (dpi or fig.dpi) / fig.dpi)
+
+    base_lines = []  # (Line2D, color) pairs the glow is built from
+    for label, color, columns in _hue_groups(arrays, hue, [x_column, y_column], bar_color, levels=levels):
+        if len(columns[x_column]):
+            x, y = columns[x_column], columns[y_column]
+            if decimate:
+                x, y = _min_max_decimate(x, y, max(buckets, 1))
+            bars = ax.plot(x, y,
                            color=color, label=label, linestyle=linestyle, marker=marker)
+            base_lines.append((bars[0], color))
 
+    profiling.mark('legend')
     if hue:
         legend = ax.legend(loc='upper left', bbox_to_anchor=(1, 1))
         frame = legend.get_frame()
@@ -497,8 +980,6 @@ def line(data, y_column, x_column,
         title = legend.get_title()
         title.set_color('white')  # Set the legend title's text color to white
 
-        for text in legend.get_texts():
-            text.set_color('white')  # Set the legend item text color to white
             
             
     if x_name==None:
@@ -506,43 +987,27 @@ def line(data, y_column, x_column,
     if y_name==None:
         y_name=y_column        
 
-    plt.xlabel(x_name, fontname=font_family, fontsize=font_size, color=font_color)
-    plt.ylabel(y_name, fontname=font_family, fontsize=font_size, color=font_color)
+    ax.set_xlabel(x_name)
+    ax.set_ylabel(y_name)
 
     if not plot_title is None:
-        ax.set_title(plot_title, fontsize=24, fontname=font_family, pad=title_pad, color=font_color)
+        ax.set_title(plot_title)
     else:
-        ax.set_title(label=f'{x_column} by {y_column}', fontsize=24, fontname=font_family, pad=title_pad, color=font_color)
-    plt.xticks(rotation=rotation, color=font_color)
-    plt.yticks(color=font_color)
+        ax.set_title(label=f'{x_column} by {y_column}')
+    ax.tick_params(axis='x', labelrotation=rotation)
 
-    plt.grid(axis='y', linestyle='--', color=grid_color, alpha=0.7)
+    ax.grid(True, axis='y')
+
+    # the glow: one pre-batched collection per hue sharing the vertices of the base line, or one bloom under them
+    if glow == 'bloom':
+        _glow_bloom(ax, [base_line for base_line, _ in base_lines])
+    else:
+        for base_line, color in base_lines:
+            _glow_line(ax, base_line, color, linestyle=linestyle)
 
-    for i in range(4, 0, -1):
-        alpha = i / 20  # Varies alpha from 1 to 0 (fully visible to fully transparent)
-        linewidth = i * 3  # Varies line thickness
-        if hue:
-            for hue_value in unique_hue_values:
-                color_index = np.where(unique_hue_values == hue_value)[0][0] if hue else 0
-                color = bar_color[color_index % len(bar_color)]
-                data_filtered = data_sorted[data_sorted[hue] == hue_value]
-                valid_data = data_filtered.dropna(subset=[x_column, y_column])  # Remove rows with NaN values in x_column or y_column
-                if not valid_data.empty:
-                    bars = ax.plot(valid_data[x_column], valid_data[y_column],
-                                   color=color, linewidth=linewidth, label=label,
-                                   alpha=alpha, linestyle=linestyle, marker=marker)
-        else:
-            valid_data = data_filtered.dropna(subset=[x_column, y_column])  # Remove rows with NaN values in x_column or y_column
-            if not valid_data.empty:
-                bars = ax.plot(valid_data[x_column], valid_data[y_column],
-                               color=color, linewidth=linewidth, label=label,
-                               alpha=alpha, linestyle=linestyle, marker=marker)
-
-    for ax in plt.gcf().get_axes():
-        ax.yaxis.labelpad = 10
-        ax.xaxis.labelpad = 10
         
     # annotation
+    profiling.mark('annotation')
     annotation_text = annotation
     annotation_x = ann_x  # Keep it at the right edge to position the annotation to the right
     annotation_y = ann_y  # Y-coordinate of the annotation (negative value to place it at the bottom)
@@ -561,82 +1026,95 @@ def line(data, y_column, x_column,
                     xycoords='axes fraction', fontsize=12, color='white', ha='right')  # Set ha='right' for right alignment
         vertical_position -= vertical_spacing     
 
-    plt.show()      
+    return _finish(fig, output, dpi)
+
 
 
 
 
+def live_line(data, y_column, x_column, hue=None, capacity=10_000, **kwargs):
+    # line() that stays open for new points: returns a LiveLine (matisse/live.py) whose append(x, y, hue=...) updates
+    # the drawn series in place. Rows are taken in the order given (time order) and each series keeps its newest
+    # `capacity` points; the other keyword arguments are line()'s.
+    from .live import LiveLine, line_arguments
+
+    if kwargs.get('glow', 'layers') != 'layers':
+        raise ValueError("live_line updates the glow layers in place: it only takes glow='layers'")
+    kwargs.update(output='figure', presorted=True, decimate=False)
+    fig = line(data, y_column, x_column, hue=hue, **kwargs)
+    return LiveLine(fig, capacity, hue, line_arguments(kwargs))
+
 
 # -------- Histogram-------------------------------------------------------------------------------------------------------------------
 # ------------------------------------------------------------------------------------------------------------------------------------
 
+@_themed
 def hist(data, y_column, x_column=None, font_family='Sangha', font_color='#FDF0F0',
          font_size=20, title_pad=15, bg_color='#212946', grid_color='#FE53BB',
          bar_color=['#FE53BB', '#97FEED','#FEFFAC', '#E384FF', '#FF8400'],
          plot_title=None, hue=None, histtype='bar', stacked=False,
          bins=20, density=False, weights=None, cumulative=False, kde=False, 
          rotation=0, figsize=(10,8),
-         annotation='', ann_x=1.45,ann_y=-0.2, x_name=None, y_name=None):
-
-    plt.style.use("seaborn-dark")
-
-    fig, ax = plt.subplots(figsize=figsize)
-    fig.set_facecolor(bg_color)
-    ax.set_facecolor(bg_color)
-
-    data_sorted = data.sort_values(by=y_column, ascending=False)
-
-    if hue:
-        data_filtered = data_sorted[pd.notna(data_sorted[hue])]
-        unique_hue_values = data_filtered[hue].unique()
-
-        for hue_value in unique_hue_values:
-            data_filtered = data_sorted[data_sorted[hue] == hue_value]
-            label = f'{hue_value}'
-            color_index = np.where(unique_hue_values == hue_value)[0][0]
-            color = bar_color[color_index % len(bar_color)]
-
-            valid_data = data_filtered[y_column].dropna()
-
-            if len(valid_data) > 0:
-                if kde:
-                    kde_obj = gaussian_kde(valid_data, bw_method='silverman')
-                    x_values = np.linspace(valid_data.min(), valid_data.max(), 100)
-                    kde_values = kde_obj(x_values)
-                    plt.plot(x_values, kde_values, label=f'KDE ({hue_value})', color=color)
-
-                hist, bins, patches = ax.hist(valid_data, color=color, edgecolor=color, label=label,
-                                              histtype=histtype, stacked=stacked, bins=bins, density=True, weights=weights, cumulative=cumulative, alpha=0.5)
-
-                for patch in patches:
-                    patch.set_edgecolor(color)
-
+         annotation='', ann_x=1.45,ann_y=-0.2, x_name=None, y_name=None, kde_gridsize=100, chunksize=1_000_000,
+         glow='layers', ax=None, output=None, dpi=None):
+    # data can also be a streamed source (a Parquet/CSV path, a directory or glob of partitions, an iterable of chunks
+    # or a function returning one, see matisse/stream.py): it is binned chunk by chunk, `chunksize` rows at a time
+    import pandas as pd
+    import matplotlib.patches as mpatches
+    from . import stream
+
+    _check_glow(glow)
+
+    fig, ax = _new_axes(output, ax, figsize=figsize)
+
+    # (label, color, bin counts, bin edges, KDE curve) per hue, shared by the base and the glow passes; a hue with no
+    # values has no counts. Binning does not depend on the row order, so nothing is sorted. The hue levels keep the
+    # order the old descending sort by y_column met them in: by each level's largest value
+    binned = []
+    if stream.is_source(data):
+        groups = stream.histograms(data, y_column, hue, bins, weights, kde, kde_gridsize, chunksize)
+        if hue:
+            groups.sort(key=lambda group: (np.isnan(group[4]), -group[4]))
+        for i, (label, counts, edges, curve, _) in enumerate(groups):
+            binned.append((label, bar_color[i % len(bar_color)], counts, edges, curve))
     else:
-        data_filtered = data_sorted
-        label = None
-        color_index = 0
-        color = bar_color[color_index % len(bar_color)]
-
-        valid_data = data_filtered[y_column].dropna()
-
-        if len(valid_data) > 0:
-            if kde:
-                kde_obj = gaussian_kde(valid_data, bw_method='silverman')
-                x_values = np.linspace(valid_data.min(), valid_data.max(), 100)
-                kde_values = kde_obj(x_values)
-                plt.plot(x_values, kde_values, label='KDE', color=color)
-
-            hist, bins, patches = ax.hist(valid_data, color=color, edgecolor=color, label=label,
-                                          histtype=histtype, stacked=stacked, bins=bins, density=True, weights=weights, cumulative=cumulative, alpha=0.5)
+        columns = [y_column] + ([weights] if isinstance(weights, str) else [])
+        arrays, levels = _prepare(data, columns, hue)
+        if hue:
+            levels = pd.Series(arrays[y_column]).groupby(arrays[hue], sort=False).max()
+            levels = levels.sort_values(ascending=False, kind='stable').index
+
+        for label, color, arrays in _hue_groups(arrays, hue, columns, bar_color, levels=levels):
+            values = arrays[y_column]
+            valid = pd.notna(values)
+            valid_weights = arrays[weights][valid] if isinstance(weights, str) else weights
+            if not valid.any():
+                binned.append((label, color, None, None, None))
+                continue
+            curve = binned_kde(values[valid], gridsize=kde_gridsize) if kde else None
+            # bin once; ax.hist only redraws the cached counts (one weighted sample per bin) and applies
+            # density/cumulative to them
+            counts, edges = np.histogram(values[valid], bins=bins, weights=valid_weights)
+            binned.append((label, color, counts, edges, curve))
+
+    drawn = []  # (color, histogram patches, KDE line) per hue: the glow is built from what the base pass drew
+    for label, color, counts, edges, curve in binned:
+        if counts is not None:
+            kde_line = None
+            if curve is not None:
+                kde_line, = ax.plot(*curve, label=f'KDE ({label})' if hue else 'KDE', color=color)
+
+            hist, edges, patches = ax.hist(edges[:-1], color=color, edgecolor=color, label=label,
+                                           histtype=histtype, stacked=stacked, bins=edges, density=True, weights=counts, cumulative=cumulative, alpha=0.5)
 
             for patch in patches:
                 patch.set_edgecolor(color)
-                
-                
+            drawn.append((color, patches, kde_line))
 
+    profiling.mark('legend')
     if hue:
         legend = ax.legend(loc='upper left', bbox_to_anchor=(1, 1))
-        legend_handles = [mpatches.Rectangle((0, 0), 1, 1, color=bar_color[i % len(bar_color)],alpha=0.7, label=unique_hue_values[i]) for i in range(len(unique_hue_values))]
+        legend_handles = [mpatches.Rectangle((0, 0), 1, 1, color=color, alpha=0.7, label=label) for label, color, *_ in binned]
         ax.legend(handles=legend_handles, loc='upper left', bbox_to_anchor=(1, 1))
         legend = ax.get_legend()
         for text in legend.get_texts():
@@ -646,50 +1124,34 @@ def hist(data, y_column, x_column=None, font_family='Sangha', font_color='#FDF0F
     if y_name==None:
         y_name=y_column        
 
-    plt.ylabel(y_name, fontname=font_family, fontsize=font_size, color=font_color)
-    plt.xlabel(x_name, fontname=font_family, fontsize=font_size, color=font_color)
+    ax.set_ylabel(y_name)
+    ax.set_xlabel(x_name)
 
     if not plot_title is None:
-        ax.set_title(plot_title, fontsize=24, fontname=font_family, pad=title_pad, color=font_color)
+        ax.set_title(plot_title)
     else:
-        ax.set_title(label=f'{y_column}', fontsize=24, fontname=font_family, pad=title_pad, color=font_color)
-    plt.xticks(rotation=rotation, color=font_color)
-    plt.yticks(color=font_color)
-    plt.grid(axis='y', linestyle='--', color=grid_color, alpha=0.7)
+        ax.set_title(label=f'{y_column}')
+    ax.tick_params(axis='x', labelrotation=rotation)
+    ax.grid(True, axis='y')
 
     legend = ax.legend(loc='upper left', bbox_to_anchor=(1, 1))
     for text in legend.get_texts():
         text.set_color(font_color)
     
-    for i in range(4, 0, -1):
-        alpha = i / 25
-        linewidth = i * 1
-        if hue:
-            for hue_value in unique_hue_values:
-                color_index = np.where(unique_hue_values == hue_value)[0][0] if hue else 0
-                color = bar_color[color_index % len(bar_color)]
-                data_filtered = data_sorted[data_sorted[hue] == hue_value]
-                hist, bins, patches = ax.hist(data_filtered[y_column], edgecolor=color,
-                                              linewidth=linewidth, label=label, alpha=alpha, histtype=histtype, stacked=stacked, bins=bins, density=True, weights=weights, cumulative=cumulative)
-                if kde:
-                    kde_obj = gaussian_kde(data_filtered[y_column].dropna(), bw_method='silverman')
-                    x_values = np.linspace(data_filtered[y_column].min(), data_filtered[y_column].max(), 100)
-                    kde_values = kde_obj(x_values)
-                    plt.plot(x_values, kde_values, label=f'KDE ({hue_value})', color=color, alpha=i / 24, linewidth=i * 2)
+    # the glow: the cached outlines of each base histogram (and KDE curve), one pre-batched collection per hue, or
+    # one bloom under all of them
+    if glow == 'bloom':
+        _glow_bloom(ax, [artist for _, patches, kde_line in drawn for artist in [*patches, kde_line]
+                         if artist is not None])
+    else:
+        for color, patches, kde_line in drawn:
+            _glow_patches(ax, patches, color, alpha_step=25, width_step=1, fill=histtype != 'step')
+            if kde_line is not None:
+                _glow_line(ax, kde_line, color, alpha_step=24, width_step=2)
 
-        else:
-            hist, bins, patches = ax.hist(data_filtered[y_column], edgecolor=color, linewidth=linewidth, label=label, alpha=alpha, histtype=histtype, stacked=stacked, bins=bins, density=True, weights=weights, cumulative=cumulative)
-            if kde:
-                kde_obj = gaussian_kde(valid_data, bw_method='silverman')
-                x_values = np.linspace(valid_data.min(), valid_data.max(), 100)
-                kde_values = kde_obj(x_values)
-                plt.plot(x_values, kde_values, label='KDE', color=color, alpha=i / 24, linewidth=i * 2)
-                
-    for ax in plt.gcf().get_axes():
-        ax.yaxis.labelpad = 10
-        ax.xaxis.labelpad = 10
         
     # annotation
+    profiling.mark('annotation')
     annotation_text = annotation
     annotation_x = ann_x  # Keep it at the right edge to position the annotation to the right
     annotation_y = ann_y  # Y-coordinate of the annotation (negative value to place it at the bottom)
@@ -709,7 +1171,7 @@ def hist(data, y_column, x_column=None, font_family='Sangha', font_color='#FDF0F
         vertical_position -= vertical_spacing             
                 
 
-    plt.show()      
+    return _finish(fig, output, dpi)
 
 
 
@@ -717,6 +1179,7 @@ def hist(data, y_column, x_column=None, font_family='Sangha', font_color='#FDF0F
 # -------- Violinplot-------------------------------------------------------------------------------------------------------------------
 # ------------------------------------------------------------------------------------------------------------------------------------
 
+@_themed
 def violin(data, y_column, x_column,
                font_family='Sangha', font_color='#FDF0F0', font_size=20,
                title_pad=15, bg_color='#212946', grid_color='#FE53BB',
@@ -730,21 +1193,16 @@ def violin(data, y_column, x_column,
                showmeans=True, 
                showextrema=True, 
                showmedians=True, 
-               split=False, figsize=(10,8), annotation='', ann_x=1.45,ann_y=-0.2, x_name=None, y_name=None):
-    
-    plt.style.use("seaborn-dark")
+               split=False, fill=True, figsize=(10,8), annotation='', ann_x=1.45,ann_y=-0.2, x_name=None, y_name=None, ax=None, output=None, dpi=None):
+    from matplotlib.lines import Line2D
+    import pandas as pd
+    from matplotlib.collections import PolyCollection, LineCollection
 
-    fig, ax = plt.subplots(figsize=figsize)
-    fig.set_facecolor(bg_color)
-    ax.set_facecolor(bg_color)
 
-    data_sorted = data.sort_values(by=y_column, ascending=False)  # Sort data globally in ascending order
-    
-    
-    if hue:
-        data[hue] = data[hue].astype('category')
+    fig, ax = _new_axes(output, ax, figsize=figsize)
 
-    unique_x_values = data[x_column].unique()
+    arrays, _ = _prepare(data, [x_column, y_column], hue)
+    x_codes, unique_x_values = pd.factorize(arrays[x_column])
 
     if positions is None:
         positions = np.arange(len(unique_x_values))
@@ -754,116 +1212,106 @@ def violin(data, y_column, x_column,
     if y_name==None:
         y_name=y_column    
 
-    plt.xlabel(x_name, fontname=font_family, fontsize=font_size, color=font_color)
-    plt.ylabel(y_name, fontname=font_family, fontsize=font_size, color=font_color)
+    ax.set_xlabel(x_name)
+    ax.set_ylabel(y_name)
 
     if not plot_title:
         plot_title = f'{x_column} by {y_column}'
 
-    ax.set_title(label=plot_title, fontsize=24, fontname=font_family, pad=title_pad, color=font_color)
+    ax.set_title(label=plot_title)
 
-    plt.xticks(rotation=rotation, color=font_color)
-    plt.yticks(color=font_color)
+    ax.set_xticks(positions, [str(x_value) for x_value in unique_x_values])
+    ax.tick_params(axis='x', labelrotation=rotation)
 
-    plt.grid(axis='y', linestyle='--', color=grid_color, alpha=0.7)
+    ax.grid(True, axis='y')
 
+    hue_codes, hue_values = pd.factorize(arrays[hue]) if hue else (np.zeros(len(x_codes), dtype=np.intp), [None])
     if hue:
-        if len(data[hue].unique()) > 2:
+        if len(hue_values) > 2:
             ax.annotate("Too many hue values", xy=(0.5, 0.5), xycoords='axes fraction', color=font_color)
-        if len(data[hue].unique()) == 2:
+        if len(hue_values) == 2:
             bar_color = ['#FE53BB', '#97FEED']
-
-    for x_value in unique_x_values:
-        data_filtered = data[data[x_column] == x_value]
-        label = str(x_value)
-        color_index = np.where(unique_x_values == x_value)[0][0]
-        color = bar_color[color_index % len(bar_color)]
-
-        if hue is None:
-            if fill is False:
-                sns.violinplot(x=x_column, y=y_column, data=data_filtered, edgecolor=color, alpha=0.8, hue=hue, inner_kws=dict(color=".2", alpha=1))
-            else:
-                sns.violinplot(x=x_column, y=y_column, data=data_filtered, palette=[color], edgecolor=color,
-                               alpha=0.8, hue=hue, inner_kws=dict(color=".2", alpha=1))
-        else:
-            if fill is False:
-                sns.violinplot(x=x_column, y=y_column,palette=bar_color, 
-                               data=data_filtered, edgecolor='gray', 
-                               alpha=0.8, hue=hue, inner_kws=dict(color=".2", alpha=1), split=split)
-                for patch in ax.patches:
-                    clr = patch.get_facecolor()
-                    patch.set_edgecolor(clr)
+    split = split and len(hue_values) == 2
+
+    # densities and inner box statistics, estimated once per (category, hue)
+    values = np.asarray(arrays[y_column], dtype=float)
+    cells = (x_codes * len(hue_values) + hue_codes)[(x_codes >= 0) & (hue_codes >= 0) & ~np.isnan(values)]
+    order = np.argsort(cells, kind='stable')
+    values = values[(x_codes >= 0) & (hue_codes >= 0) & ~np.isnan(values)][order]
+    bounds = np.searchsorted(cells[order], np.arange(len(unique_x_values) * len(hue_values) + 1))
+
+    shapes = []  # (center, side, color, grid, density, box statistics)
+    for x_index, position in enumerate(positions):
+        for hue_index in range(len(hue_values)):
+            cell = x_index * len(hue_values) + hue_index
+            cell_values = values[bounds[cell]:bounds[cell + 1]]
+            if len(cell_values) == 0:
+                continue
+            if split:
+                center, side = position, ('left', 'right')[hue_index]
             else:
-
-                data_filtered = data[data[x_column] == x_value]
-                label = str(x_value)
-                color_index = np.where(unique_x_values == x_value)[0][0]
-                color = bar_color[color_index % len(bar_color)]
-                sns.violinplot(x=x_column, y=y_column, data=data_filtered, palette=bar_color,
-                               edgecolor='gray', alpha=0.8, hue=hue, inner_kws=dict(box_width=5, whis_width=2,color=".2", alpha=1),split=split)
-                for patch in ax.patches:
-                    clr = patch.get_facecolor()
-                    patch.set_edgecolor(clr)
-
+                center, side = position + (hue_index + 0.5 - len(hue_values) / 2) * widths / len(hue_values), 'both'
+            color = bar_color[(hue_index if hue else x_index) % len(bar_color)]
+
+            grid, density = binned_kde(cell_values, gridsize=100, bw_method='scott', cut=2)
+            q1, median, q3 = np.percentile(cell_values, [25, 50, 75])
+            low = cell_values[cell_values >= q1 - 1.5 * (q3 - q1)].min()
+            high = cell_values[cell_values <= q3 + 1.5 * (q3 - q1)].max()
+            shapes.append((center, side, color, grid, density, (low, q1, median, q3, high)))
+
+    # one scale for every violin, so their areas stay comparable
+    peak = max([density.max() for center, side, color, grid, density, stats in shapes] + [0]) or 1
+    half_width = widths / 2 if split or not hue else widths / len(hue_values) / 2
+
+    verts, colors, whiskers, boxes, medians = [], [], [], [], []
+    for center, side, color, grid, density, (low, q1, median, q3, high) in shapes:
+        extent = density / peak * half_width
+        left = center - extent if side != 'right' else np.full_like(grid, center)
+        right = center + extent if side != 'left' else np.full_like(grid, center)
+        verts.append(np.concatenate([np.column_stack([left, grid]), np.column_stack([right, grid])[::-1]]))
+        colors.append(color)
+
+        inner = center + {'left': -1, 'right': 1, 'both': 0}[side] * half_width / 8
+        whiskers.append([(inner, low), (inner, high)])
+        boxes.append([(inner, q1), (inner, q3)])
+        medians.append((inner, median))
+
+    if verts:
+        body = PolyCollection(verts, facecolors=colors if fill else 'none', edgecolors=colors, linewidths=1.5,
+                              alpha=0.8)
+        ax.add_collection(body)
+        ax.autoscale_view()
+
+    profiling.mark('legend')
     if hue:
         legend_handles = []
         legend_labels = []
 
-        for hue_value in data[hue].unique():
-            data_filtered = data[data[hue] == hue_value]
+        for hue_index, hue_value in enumerate(hue_values):
             label = f'{hue_value}'
-            color_index = np.where(data[hue] == hue_value)[0][0]
-            color = bar_color[color_index % len(bar_color)]
-            legend_handles.append(plt.Line2D([], [], color=color, label=label))
+            color = bar_color[hue_index % len(bar_color)]
+            legend_handles.append(Line2D([], [], color=color, label=label))
             legend_labels.append(label)
 
         legend = ax.legend(loc='upper left', bbox_to_anchor=(1, 1), handles=legend_handles, labels=legend_labels)
 
         title = ax.get_legend().get_title()
         title.set_color('white')
-        for text in legend.get_texts():
-            text.set_color('white')
-
-    if hue is None:
-        for x_value in unique_x_values:
-            data_filtered = data[data[x_column] == x_value]
-            label = str(x_value)
-            color_index = np.where(unique_x_values == x_value)[0][0]
-            color = bar_color[color_index % len(bar_color)]
-            for i in range(4, 0, -1):
-                alpha = i / 25
-                linewidth = i * 2
-                sns.violinplot(x=x_column, y=y_column, data=data_filtered,
-                               palette=[color], edgecolor=color, alpha=alpha, linewidth=linewidth,
-                               inner_kws=dict(box_width=5, whis_width=2, alpha=1, color="0.2"))
-                for patch in ax.patches:
-                    clr = patch.get_facecolor()
-                    patch.set_edgecolor(clr)
-
-    else:
-        for x_value in unique_x_values:
-            data_filtered = data[data[x_column] == x_value]
-            label = str(x_value)
-            color_index = np.where(unique_x_values == x_value)[0][0]
-            color = bar_color[color_index % len(bar_color)]
 
+    # the glow: styled copies of the cached violin outlines, one pre-batched collection for all of them
+    if verts:
+        _glow_polygons(ax, verts, colors, alpha_step=25, width_step=2, fill=True)
 
-            for i in range(4, 0, -1):
-                alpha = i / 25
-                linewidth = i *2
-                sns.violinplot(x=x_column, y=y_column,palette=bar_color, data=data_filtered, 
-                               edgecolor='gray', alpha=alpha, hue=hue, 
-                               inner_kws=dict(box_width=5, whis_width=2, alpha=1, color="0.2"), legend=False,
-                              linewidth=linewidth, split=split)
-
+        # inner box: whiskers, interquartile bar and median dot
+        ax.add_collection(LineCollection(whiskers, colors='0.2', linewidths=2, zorder=3))
+        ax.add_collection(LineCollection(boxes, colors='0.2', linewidths=5, zorder=3))
+        ax.scatter(*np.transpose(medians), color='white', s=12, zorder=4)
 
     ax.set_ylim(bottom=0)
     
-    for ax in plt.gcf().get_axes():
-        ax.yaxis.labelpad = 10
-        ax.xaxis.labelpad = 10
         
     # annotation
+    profiling.mark('annotation')
     annotation_text = annotation
     annotation_x = ann_x  # Keep it at the right edge to position the annotation to the right
     annotation_y = ann_y  # Y-coordinate of the annotation (negative value to place it at the bottom)
@@ -882,12 +1330,13 @@ def violin(data, y_column, x_column,
                     xycoords='axes fraction', fontsize=12, color='white', ha='right')  # Set ha='right' for right alignment
         vertical_position -= vertical_spacing 
     
-    plt.show() 
+    return _finish(fig, output, dpi)
 
 
 # -------- Pieplot-------------------------------------------------------------------------------------------------------------------
 # ------------------------------------------------------------------------------------------------------------------------------------
 
+@_themed
 def pie(data=None, y_column=None, x_column=None,
                font_family='Sangha', font_color='#FDF0F0', font_size=20,
                title_pad=15, bg_color='#212946', grid_color='#FE53BB',
@@ -906,19 +1355,25 @@ def pie(data=None, y_column=None, x_column=None,
               side_bar_color=1,    # pie default color for side bar. can be 1,2,3,4,5
               side_lines = False,
               connector=1.35,
-              annotation=None,
-              pie_legend=False, radius=1, figsize=(10,8), ann_x=315,ann_y=-0.1):  # pie
+              annotation='',
+              pie_legend=False, radius=1, figsize=(10,8), ann_x=315,ann_y=-0.1, ax=None, output=None, dpi=None):  # pie
+
+    import matplotlib.patheffects as path_effects
     
-    plt.style.use("seaborn-dark")
-     
+    panel = ax is not None  # drawn into the caller's axes: the caller lays the figure out
     if ratios == None:    
-        fig, ax = plt.subplots(figsize=figsize)
+        fig, ax = _new_axes(output, ax, figsize=figsize)
+    elif panel:
+        # the bar of the ratios goes next to the pie, both inside the cell of the given axes
+        fig = ax.figure
+        cells = ax.get_subplotspec().subgridspec(1, 2)
+        ax.remove()
+        ax, ax2 = fig.add_subplot(cells[0]), fig.add_subplot(cells[1])
     else:
-        fig, (ax,ax2) = plt.subplots(1,2, figsize=figsize)
+        fig = _new_figure(output, figsize=figsize)
+        ax, ax2 = fig.subplots(1, 2)
         
                                 
-    fig.set_facecolor(bg_color)
-    ax.set_facecolor(bg_color)
 
 
         
@@ -926,7 +1381,7 @@ def pie(data=None, y_column=None, x_column=None,
         colors = bar_color  # Use the bar_color parameter as colors for the pie chart
         bars, _ = ax.pie(x_column, colors=colors, explode=explode, startangle=startangle,
                          labeldistance=1.1, 
-                         textprops={'color': '#FDF0F0', 'fontsize': 18, 'fontfamily': font_family},
+                         textprops={'color': '#FDF0F0', 'fontsize': 18},
                          shadow=shadow, radius=radius)
         if ratios== None:
             legend = ax.legend(loc='upper left', bbox_to_anchor=(1.1, 0.97), labels=labels, title=None)
@@ -934,9 +1389,7 @@ def pie(data=None, y_column=None, x_column=None,
             legend = ax.legend(loc='upper left', bbox_to_anchor=(247, 0.5), labels=labels, title=None)
 
 
-        for text in legend.get_texts():
-            text.set_color('white') 
-        handles, labels = ax.get_legend().legendHandles, [text.get_text() for text in legend.get_texts()]
+        handles, labels = _legend_handles(ax.get_legend()), [text.get_text() for text in legend.get_texts()]
 
         for handle, label in zip(handles, labels):
                 # Set the color of the handle to match the label's color
@@ -951,7 +1404,7 @@ def pie(data=None, y_column=None, x_column=None,
         colors = bar_color  # Use the bar_color parameter as colors for the pie chart
         bars, labs = ax.pie(x_column, colors=colors, explode=explode, startangle=startangle,
                              labels=labels, labeldistance=1.1, 
-                             textprops={'color': '#FDF0F0', 'fontsize': 18, 'fontfamily': font_family},
+                             textprops={'color': '#FDF0F0', 'fontsize': 18},
                              shadow=shadow)
 
     total = sum(x_column)  # Calculate the total value of all slices
@@ -1049,19 +1502,18 @@ def pie(data=None, y_column=None, x_column=None,
 
 
         legend = ax2.legend(loc='upper left', bbox_to_anchor=(0.6, 0.97))
-        ax2.text(0.006, 5, side_title, ha='center', va='center', fontsize=10, color='white', fontname=font_family)
-        for text in legend.get_texts():
-            text.set_color('white')       
+        ax2.text(0.006, 5, side_title, ha='center', va='center', fontsize=10, color='white')
 
 
 
 
 
+    profiling.mark('annotation')
     if not plot_title is None:
-        title = ax.set_title(plot_title, fontsize=24, fontname=font_family, pad=title_pad, color=font_color)
+        title = ax.set_title(plot_title)
         title.set_position([0.5, 1])
     else:
-        ax.set_title(label=f'pie plot', fontsize=24, fontname=font_family, pad=title_pad, color=font_color)
+        ax.set_title(label=f'pie plot')
 
     # these are just some invisible tricks lines to add the padding to the plot that would not work otherwise
     annotation_text_top = 'trick line'
@@ -1108,15 +1560,17 @@ def pie(data=None, y_column=None, x_column=None,
                     fontsize=12, color='none', rotation=90)
 
 
-    if ratios == None:
-        plt.subplots_adjust(left=0.2, right=0.9, top=1.5, bottom=0.1)
+    if panel:
+        pass
+    elif ratios == None:
+        fig.subplots_adjust(left=0.2, right=0.9, top=1.5, bottom=0.1)
 
     else:
-        plt.subplots_adjust(left=0.2, right=1, top=0.6, bottom=0)
+        fig.subplots_adjust(left=0.2, right=1, top=0.6, bottom=0)
 
             
 
-    plt.show()
+    return _finish(fig, output, dpi)
 
 
 
@@ -1124,6 +1578,7 @@ def pie(data=None, y_column=None, x_column=None,
 # -------- Boxplot-------------------------------------------------------------------------------------------------------------------
 # ------------------------------------------------------------------------------------------------------------------------------------
 
+@_themed
 def box(x_column, font_family='Sangha', font_color='#FDF0F0', font_size=20,
                title_pad=15, bg_color='#212946', grid_color='#FE53BB',
                bar_color=['#FE53BB', '#FEFFAC', '#97FEED', '#E384FF', '#FF8400', '#45FFCA', '#0B666A', '#3E00FF'],
@@ -1136,22 +1591,20 @@ def box(x_column, font_family='Sangha', font_color='#FDF0F0', font_size=20,
                usermedians=None, conf_intervals=None, meanline=None, showmeans=None, 
                showcaps=None, showbox=None, showfliers=None, boxprops=None, labels=None, 
                flierprops=None, medianprops=None, meanprops=None, capprops=None, 
-               whiskerprops=None, manage_ticks=True, autorange=False, zorder=None, data=None, figsize=(10,8), x_name=None, y_name=None, annotation='', ann_x=1.1, ann_y=-0.2):
+               whiskerprops=None, manage_ticks=True, autorange=False, zorder=None, data=None, figsize=(10,8), x_name=None, y_name=None, annotation='', ann_x=1.1, ann_y=-0.2, ax=None, output=None, dpi=None):
+    from matplotlib.artist import setp
 
-    plt.style.use("seaborn-dark")
 
-    fig, ax = plt.subplots(figsize=figsize)
-    fig.set_facecolor(bg_color)
-    ax.set_facecolor(bg_color)
+    fig, ax = _new_axes(output, ax, figsize=figsize)
 
-    plt.grid(axis='y', linestyle='--', color=grid_color, alpha=0.7)
+    ax.grid(True, axis='y')
 
     # the plot starts here
     boxplots = ax.boxplot(x_column, 
                           notch=notch, sym=sym, vert=vert, whis=whis, 
                           positions=positions, widths=widths, patch_artist=True, bootstrap=bootstrap, 
                           usermedians=usermedians, conf_intervals=conf_intervals, meanline=meanline, showmeans=showmeans, 
-                          showcaps=showcaps, showbox=showbox, showfliers=showfliers, boxprops=dict(linestyle='-', linewidth=2), labels=labels, 
+                          showcaps=showcaps, showbox=showbox, showfliers=showfliers, boxprops=dict(linestyle='-', linewidth=2), **_boxplot_labels(labels), 
                           flierprops=flierprops, medianprops=medianprops, meanprops=meanprops, capprops=capprops, 
                           whiskerprops=whiskerprops, manage_ticks=manage_ticks, autorange=autorange, zorder=zorder, data=data)
 
@@ -1163,42 +1616,40 @@ def box(x_column, font_family='Sangha', font_color='#FDF0F0', font_size=20,
     # quick overwork for plt bug of coloring each half whisker with a differnt color. duplicated each color
     whisk_bar = ['#FE53BB', '#FE53BB', '#FEFFAC', '#FEFFAC', '#97FEED', '#97FEED', '#E384FF','#E384FF', '#FF8400','#FF8400', '#45FFCA','#45FFCA', '#0B666A','#0B666A', '#3E00FF', '#3E00FF']
     for whiskers, color in zip(boxplots['whiskers'], whisk_bar):  
-            plt.setp(whiskers, color=color)
+            setp(whiskers, color=color)
     for fliers, color in zip(boxplots['fliers'], bar_color):
-            plt.setp(fliers, markeredgecolor=color)   
+            setp(fliers, markeredgecolor=color)   
     for caps, color in zip(boxplots['caps'], whisk_bar):  
-            plt.setp(caps, color=color)        
+            setp(caps, color=color)        
         
 
         
     # x and y labels
-    # plt.xlabel(x_column, fontname=font_family, fontsize=font_size, color=font_color)
+    # ax.set_xlabel(x_column)
 
     # plot title
     if not plot_title is None:
-        ax.set_title(plot_title, fontsize=24, fontname=font_family, pad=title_pad, color=font_color)
+        ax.set_title(plot_title)
     else:
-        ax.set_title(label=f'{plot_title}', fontsize=24, fontname=font_family, pad=title_pad, color=font_color)
-    plt.xticks(rotation=rotation, color=font_color)
-    plt.yticks(color=font_color)
+        ax.set_title(label=f'{plot_title}')
+    ax.tick_params(axis='x', labelrotation=rotation)
 
     # the glow:
-    plt.xticks(rotation=rotation)
+    ax.tick_params(axis='x', labelrotation=rotation)
     
+    # x_column holds the values themselves, so the axes have no column names to fall back on
     if x_name==None:
-        x_name=x_column
+        x_name=''
     if y_name==None:
-        y_name=y_column
+        y_name=''
  
-    plt.ylabel(ylabel=x_name, fontname=font_family, fontsize=font_size, color=font_color)
+    ax.set_ylabel(x_name)
 
-    plt.xlabel(xlabel=y_name, fontname=font_family, fontsize=font_size, color=font_color)
+    ax.set_xlabel(y_name)
     
-    for ax in plt.gcf().get_axes():
-        ax.yaxis.labelpad = 10
-        ax.xaxis.labelpad = 10
         
     # annotation
+    profiling.mark('annotation')
     annotation_text = annotation
     annotation_x = ann_x  # Keep it at the right edge to position the annotation to the right
     annotation_y = ann_y  # Y-coordinate of the annotation (negative value to place it at the bottom)
@@ -1217,11 +1668,12 @@ def box(x_column, font_family='Sangha', font_color='#FDF0F0', font_size=20,
                     xycoords='axes fraction', fontsize=12, color='white', ha='right')  # Set ha='right' for right alignment
         vertical_position -= vertical_spacing 
 
-    plt.show()
+    return _finish(fig, output, dpi)
 
 # -------- Scatterboxplot-------------------------------------------------------------------------------------------------------------------
 # ------------------------------------------------------------------------------------------------------------------------------------
 
+@_themed
 def scatterbox(x_column, font_family='Sangha', font_color='#FDF0F0', font_size=20,
                title_pad=15, bg_color='#212946', grid_color='#FE53BB',
                bar_color=['#FE53BB', '#FEFFAC', '#97FEED', '#E384FF', '#FF8400', '#45FFCA', '#0B666A', '#3E00FF'],
@@ -1233,15 +1685,13 @@ def scatterbox(x_column, font_family='Sangha', font_color='#FDF0F0', font_size=2
                usermedians=None, conf_intervals=None, meanline=None, showmeans=None,
                showcaps=None, showbox=None, showfliers=None, boxprops=None, labels=None,
                flierprops=None, medianprops=None, meanprops=None, capprops=None,
-               whiskerprops=None, manage_ticks=True, autorange=False, zorder=None, data=None, legend=False, x_name=None, y_name=None, annotation='', ann_x=1.1, ann_y=-0.2):
+               whiskerprops=None, manage_ticks=True, autorange=False, zorder=None, data=None, legend=False, x_name=None, y_name=None, annotation='', ann_x=1.1, ann_y=-0.2, ax=None, output=None, dpi=None):
+    from matplotlib.artist import setp
 
-    plt.style.use("seaborn-dark")
 
-    fig, ax = plt.subplots(figsize=figsize)
-    fig.set_facecolor(bg_color)
-    ax.set_facecolor(bg_color)
+    fig, ax = _new_axes(output, ax, figsize=figsize)
 
-    plt.grid(axis='y', linestyle='--', color=grid_color, alpha=0.7)
+    ax.grid(True, axis='y')
 
     # Box plot
     boxplots = ax.boxplot(x_column,
@@ -1249,7 +1699,7 @@ def scatterbox(x_column, font_family='Sangha', font_color='#FDF0F0', font_size=2
                           positions=positions, widths=widths, patch_artist=True, bootstrap=bootstrap,
                           usermedians=usermedians, conf_intervals=conf_intervals, meanline=meanline, showmeans=showmeans,
                           showcaps=showcaps, showbox=showbox, showfliers=showfliers, boxprops=dict(linestyle='-', linewidth=2),
-                          labels=labels, flierprops=flierprops, medianprops=medianprops, meanprops=meanprops,
+                          **_boxplot_labels(labels), flierprops=flierprops, medianprops=medianprops, meanprops=meanprops,
                           capprops=capprops, whiskerprops=whiskerprops, manage_ticks=manage_ticks, autorange=autorange,
                           zorder=zorder, data=data)
 
@@ -1262,53 +1712,53 @@ def scatterbox(x_column, font_family='Sangha', font_color='#FDF0F0', font_size=2
     whisk_bar = ['#FE53BB', '#FE53BB', '#FEFFAC', '#FEFFAC', '#97FEED', '#97FEED', '#E384FF', '#E384FF', '#FF8400',
                  '#FF8400', '#45FFCA', '#45FFCA', '#0B666A', '#0B666A', '#3E00FF', '#3E00FF']
     for whiskers, color in zip(boxplots['whiskers'], whisk_bar):
-        plt.setp(whiskers, color=color)
+        setp(whiskers, color=color)
     for fliers, color in zip(boxplots['fliers'], bar_color):
-        plt.setp(fliers, markeredgecolor=color)
+        setp(fliers, markeredgecolor=color)
 
     for caps, color in zip(boxplots['caps'], whisk_bar):
-        plt.setp(caps, color=color)
-
-    # Scatter plot based on the same data as the boxes
-    for lab, box_data, scatter_color in zip(labels, x_column, bar_color):
-        scatter_x = np.full_like(box_data, lab)  # Create x positions for scatter dots
+        setp(caps, color=color)
+
+    # Scatter plot based on the same data as the boxes: the dots sit on their box (at 1..n unless `positions` moves
+    # the boxes), the labels only name them
+    spots = positions if positions is not None else range(1, len(x_column) + 1)
+    names = labels if labels is not None else [None] * len(x_column)
+    for spot, lab, box_data, scatter_color in zip(spots, names, x_column, bar_color):
+        scatter_x = np.full(np.shape(box_data), spot, dtype=float)  # Create x positions for scatter dots
         ax.scatter(scatter_x, box_data, color=scatter_color, marker='o', label=lab)
 
     # x and y labels
-    # plt.xlabel(x_column, fontname=font_family, fontsize=font_size, color=font_color)
+    # ax.set_xlabel(x_column)
 
     # Plot title
     if not plot_title is None:
-        ax.set_title(plot_title, fontsize=24, fontname=font_family, pad=title_pad, color=font_color)
+        ax.set_title(plot_title)
     else:
-        ax.set_title(label=f'{plot_title}', fontsize=24, fontname=font_family, pad=title_pad, color=font_color)
-    plt.xticks(rotation=rotation, color=font_color)
-    plt.yticks(color=font_color)
+        ax.set_title(label=f'{plot_title}')
+    ax.tick_params(axis='x', labelrotation=rotation)
 
     
-    plt.xticks(rotation=rotation)
+    ax.tick_params(axis='x', labelrotation=rotation)
     
+    # x_column holds the values themselves, so the axes have no column names to fall back on
     if x_name==None:
-        x_name=x_column
+        x_name=''
     if y_name==None:
-        y_name=y_column
+        y_name=''
     
-    plt.xlabel(x_name, fontname=font_family, fontsize=font_size, color=font_color)
-    plt.ylabel(y_name, fontname=font_family, fontsize=font_size, color=font_color)
+    ax.set_xlabel(x_name)
+    ax.set_ylabel(y_name)
 
+    profiling.mark('legend')
     if legend==True:
         legend = ax.legend(loc='upper left', bbox_to_anchor=(1, 1))
 
-        for text in legend.get_texts():
-            text.set_color('white')  # Set the legend item text color to white  # Add a legend for the scatter dots
 
             
             
-    for ax in plt.gcf().get_axes():
-        ax.yaxis.labelpad = 10
-        ax.xaxis.labelpad = 10
         
     # annotation
+    profiling.mark('annotation')
     annotation_text = annotation
     annotation_x = ann_x  # Keep it at the right edge to position the annotation to the right
     annotation_y = ann_y  # Y-coordinate of the annotation (negative value to place it at the bottom)
@@ -1327,13 +1777,206 @@ def scatterbox(x_column, font_family='Sangha', font_color='#FDF0F0', font_size=2
                     xycoords='axes fraction', fontsize=12, color='white', ha='right')  # Set ha='right' for right alignment
         vertical_position -= vertical_spacing         
             
-    plt.show()
+    return _finish(fig, output, dpi)
 
 
 
 # -------- Jointplot-------------------------------------------------------------------------------------------------------------------
 # ------------------------------------------------------------------------------------------------------------------------------------
-
+# engine='neon' lays out the joint grid itself instead of going through sns.jointplot, which estimates the joint and
+# both marginal distributions separately from the rows. Here x and y are binned once, per hue, onto one 2D grid and
+# all three panels come from those counts: the joint panel shows them as a heat image (kind='hist'), as contours of
+# their smoothed density (kind='kde') or shows the points themselves (kind='scatter'), and the marginals are the sums
+# of the grid along either axis, drawn as one collection each (bars, or KDE curves smoothed from the sums).
+
+@profiling.stage('prep')
+def _joint_counts(groups, x_column, y_column, bars, bins, cut):
+    # (extent, counts of shape (hue, rows, cols), bandwidths). Bars need the grid on the data range with `bins` cells
+    # per axis; KDEs need it widened by `cut` bandwidths and fine next to the narrowest of them. Bandwidths follow
+    # Scott's rule, ((x, y) for the joint density, (x, y) for the marginals) per hue, None for a hue whose points do
+    # not spread along both axes.
+    from .raster import bin2d
+
+    points = []
+    for _, _, columns in groups:
+        x = np.asarray(columns[x_column], dtype=float)
+        y = np.asarray(columns[y_column], dtype=float)
+        finite = np.isfinite(x) & np.isfinite(y)
+        points.append((x[finite], y[finite]))
+
+    bounds = []
+    for axis in (0, 1):
+        present = [p[axis] for p in points if len(p[axis])]
+        lo = min((v.min() for v in present), default=0.0)
+        hi = max((v.max() for v in present), default=1.0)
+        bounds.append((lo - 0.5, hi + 0.5) if lo == hi else (lo, hi))
+
+    bandwidths = []
+    for x, y in points:
+        std = np.array([x.std(ddof=1), y.std(ddof=1)]) if len(x) > 1 else np.zeros(2)
+        bandwidths.append((std * len(x) ** (-1 / 6), std * len(x) ** (-1 / 5)) if (std > 0).all() else None)
+
+    if bars:
+        shape = (bins, bins)
+    else:
+        widest = np.max([joint for joint, _ in filter(None, bandwidths)] or [np.zeros(2)], axis=0)
+        narrowest = np.min([joint for joint, _ in filter(None, bandwidths)] or [np.ones(2)], axis=0)
+        bounds = [(lo - cut * widest[axis], hi + cut * widest[axis]) for axis, (lo, hi) in enumerate(bounds)]
+        shape = tuple(int(np.clip(np.ceil(4 * (bounds[axis][1] - bounds[axis][0]) / narrowest[axis]), 128, 1024))
+                      for axis in (1, 0))
+    extent = bounds[0] + bounds[1]
+    return extent, np.stack([bin2d(x, y, extent, shape) for x, y in points]), bandwidths
+
+
+def _joint_density(counts, extent, bandwidth, share):
+    # the Gaussian KDE of one hue's grid counts, scaled to its share of all the rows (seaborn's common_norm)
+    from . import kde as _kde
+
+    x0, x1, y0, y1 = extent
+    rows, cols = counts.shape
+    density = _kde.smooth(counts.astype(float), (y1 - y0) / rows, bandwidth[1], axis=0)
+    density = _kde.smooth(density, (x1 - x0) / cols, bandwidth[0], axis=1)
+    return density / (counts.sum() * (x1 - x0) / cols * (y1 - y0) / rows) * share
+
+
+def _iso_levels(density, levels=10, thresh=0.05):
+    # the density values enclosing 1 - thresh ... 0 of the mass, seaborn's default contour levels
+    values = np.sort(density.ravel())[::-1]
+    mass = np.cumsum(values) / values.sum()
+    return np.unique(np.take(values, np.searchsorted(mass, 1 - np.linspace(thresh, 1, levels)), mode='clip'))
+
+
+def _marginal_bars(ax, counts, edges, colors, vertical=False, alpha=0.75):
+    # the histogram bars of every hue (layered in hue order) as one PolyCollection; empty bins draw nothing
+    import matplotlib.colors as mcolors
+    from matplotlib.collections import PolyCollection
+
+    verts, faces = [], []
+    for hue_counts, color in zip(counts, colors):
+        filled = hue_counts > 0
+        left, right, height = edges[:-1][filled], edges[1:][filled], hue_counts[filled]
+        bars = np.stack([np.column_stack(corner) for corner in
+                         ((left, 0 * height), (left, height), (right, height), (right, 0 * height))], axis=1)
+        verts.append(bars[..., ::-1] if vertical else bars)
+        faces += [color] * len(bars)
+    bars = PolyCollection(np.concatenate(verts), facecolors=mcolors.to_rgba_array(faces, alpha), edgecolors='black',
+                          linewidths=0.5)
+    ax.add_collection(bars)
+    ax.autoscale_view()
+    return bars
+
+
+def _marginal_curves(ax, curves, colors, vertical=False, fill=False):
+    # the KDE curve (positions, density) of every hue, or None, as one collection: lines, or filled areas edged in
+    # the hue's colour
+    import matplotlib.colors as mcolors
+    from matplotlib.collections import LineCollection, PolyCollection
+
+    drawn = [(np.column_stack(curve), color) for curve, color in zip(curves, colors) if curve is not None]
+    if not drawn:
+        return None
+    colors = [color for _, color in drawn]
+    shapes = [xy for xy, _ in drawn]
+    if fill:
+        # every area closes along the baseline, back to where its curve starts
+        shapes = [np.concatenate([xy, [[xy[-1, 0], 0], [xy[0, 0], 0]]]) for xy in shapes]
+    if vertical:
+        shapes = [shape[:, ::-1] for shape in shapes]
+    if fill:
+        curves = PolyCollection(shapes, facecolors=mcolors.to_rgba_array(colors, 0.25), edgecolors=colors)
+    else:
+        curves = LineCollection(shapes, colors=colors)
+    ax.add_collection(curves)
+    ax.autoscale_view()
+    return curves
+
+
+def _joint_panels(ax_joint, ax_marg_x, ax_marg_y, groups, x_column, y_column, hue, kind, bins, cut, s, alpha,
+                  marker, fill, aggregate, aggregate_threshold, dpi):
+    # draws the three panels of the neon engine from one binning of the rows; scatter panels with a hue get KDE
+    # marginals like seaborn's, without one histogram bars
+    import matplotlib.lines as mlines
+
+    bars = kind == 'hist' or (kind == 'scatter' and not hue)
+    extent, counts, bandwidths = _joint_counts(groups, x_column, y_column, bars, bins, cut if kind == 'kde' else 3)
+    colors = [color for _, color, _ in groups]
+    x0, x1, y0, y1 = extent
+    rows, cols = counts.shape[1:]
+    x_edges, y_edges = np.linspace(x0, x1, cols + 1), np.linspace(y0, y1, rows + 1)
+
+    if kind == 'hist':
+        ax_joint.imshow(_heat_image(counts, colors), extent=extent, origin='lower', aspect='auto',
+                        interpolation='nearest', zorder=1)
+    elif kind == 'kde':
+        total = counts.sum()
+        for hue_counts, bandwidth, color in zip(counts, bandwidths, colors):
+            if bandwidth is not None:
+                density = _joint_density(hue_counts, extent, bandwidth[0], hue_counts.sum() / total)
+                ax_joint.contour((x_edges[:-1] + x_edges[1:]) / 2, (y_edges[:-1] + y_edges[1:]) / 2, density,
+                                 levels=_iso_levels(density), colors=[color])
+    else:
+        if aggregate is None:
+            aggregate = sum(len(columns[x_column]) for _, _, columns in groups) > aggregate_threshold
+        if aggregate:
+            _scatter_image(ax_joint, groups, x_column, y_column, s, dpi)
+        else:
+            for _, color, columns in groups:
+                ax_joint.scatter(columns[x_column], columns[y_column], color=color, s=s, alpha=alpha,
+                                 edgecolor=color, marker=marker or 'o')
+    if kind != 'scatter':
+        ax_joint.set_xlim(x0, x1)
+        ax_joint.set_ylim(y0, y1)
+
+    # the marginals: the sums of the grid along y (for x) and along x (for y)
+    if bars:
+        alpha = 0.5 if hue else 0.75
+        _marginal_bars(ax_marg_x, counts.sum(axis=1), x_edges, colors, alpha=alpha)
+        _marginal_bars(ax_marg_y, counts.sum(axis=2), y_edges, colors, vertical=True, alpha=alpha)
+    else:
+        from . import kde as _kde
+
+        total = counts.sum()
+        for ax, sums, edges, axis in ((ax_marg_x, counts.sum(axis=1), x_edges, 0),
+                                      (ax_marg_y, counts.sum(axis=2), y_edges, 1)):
+            delta = edges[1] - edges[0]
+            centers = (edges[:-1] + edges[1:]) / 2
+            curves = [None if bandwidth is None else
+                      (centers, _kde.smooth(hue_sums.astype(float), delta, bandwidth[1][axis]) / total)
+                      for hue_sums, bandwidth in zip(sums, bandwidths)]
+            _marginal_curves(ax, curves, colors, vertical=axis == 1, fill=fill)
+
+    profiling.mark('legend')
+    if hue:
+        handles = [mlines.Line2D([], [], marker='o', linestyle='', color=color, markersize=8, label=label)
+                   for label, color, _ in groups]
+        ax_joint.legend(handles=handles, title=hue)
+
+
+def _joint_grid(output, height, ratio, space, marginal_ticks):
+    # the figure and its joint/marginal axes, laid out like seaborn's JointGrid
+    fig = _new_figure(output, figsize=(height, height))
+    grid = fig.add_gridspec(ratio + 1, ratio + 1)
+    ax_joint = fig.add_subplot(grid[1:, :-1])
+    ax_marg_x = fig.add_subplot(grid[0, :-1], sharex=ax_joint)
+    ax_marg_y = fig.add_subplot(grid[1:, -1], sharey=ax_joint)
+
+    ax_marg_x.tick_params(axis='x', labelbottom=False)
+    ax_marg_y.tick_params(axis='y', labelleft=False)
+    if not marginal_ticks:
+        ax_marg_x.tick_params(axis='y', left=False, labelleft=False)
+        ax_marg_y.tick_params(axis='x', bottom=False, labelbottom=False)
+        ax_marg_x.yaxis.grid(False)
+        ax_marg_y.xaxis.grid(False)
+    for ax in (ax_joint, ax_marg_x, ax_marg_y):
+        ax.spines[['top', 'right']].set_visible(False)
+    if not marginal_ticks:
+        ax_marg_x.spines['left'].set_visible(False)
+        ax_marg_y.spines['bottom'].set_visible(False)
+    fig.subplots_adjust(hspace=space, wspace=space)
+    return fig, ax_joint, ax_marg_x, ax_marg_y
+
+
+@_themed
 def joint(data=None, x_column=None, y_column=None, hue=None, 
          kind='scatter', 
           space=0.2, dropna=False, 
@@ -1351,76 +1994,72 @@ def joint(data=None, x_column=None, y_column=None, hue=None,
          num=1,
          cut=5,
          marker=None,
-         annotation = '', ann_x=0.85, ann_y=-0.2, x_name=None, y_name=None):
-    
-    # Set Seaborn style
-    
-    sns.set_style('ticks')
-    sns.set_style("darkgrid", {
+         annotation = '', ann_x=0.85, ann_y=-0.2, x_name=None, y_name=None, engine='seaborn', bins=50,
+         aggregate=None, aggregate_threshold=200_000, output=None, dpi=None):
+    # engine='neon' draws kind='scatter', 'hist' or 'kde' from one binning of x and y (see above), on `bins` cells
+    # per axis for the bars; scatter points turn into a density image past `aggregate_threshold` rows
+
+    import matplotlib
+    import seaborn as sns
+    from cycler import cycler
+    from types import SimpleNamespace
+
+    # seaborn's darkgrid look and the palette only apply while the grid is drawn (sns.set_style/sns.set_palette would
+    # change them for every later figure); the palette is the colour cycle seaborn picks hue colours from
+    style = dict(sns.axes_style("darkgrid", {
         "axes.facecolor": '#14192b', # this is the color of the upper and right plot
         "grid.color": "white",  # Set grid color to the same as the background
         "axes.titlepad": title_pad,
         "figure.facecolor":"#14192b"  # the area around the plots
-    })
-    
-    
-    
-    #sns.set_theme(style="ticks")
-    
+    }))
+    style['axes.prop_cycle'] = cycler(color=bar_color)
+
     if hue==None:
         my_palette = bar_color[num-1]
     else:
-        my_palette= sns.set_palette(sns.color_palette(bar_color))
- 
-    import warnings
-    # Suppress all warnings
-    warnings.filterwarnings("ignore")
-   
-    if kind == 'reg' or kind=='hex' or kind=='hist':
-        plot = sns.jointplot(data=data, x=x_column, y=y_column, kind=kind, palette=my_palette,color=my_palette,
-                         height=height, ratio=ratio, hue=hue, space=space)
-        
-        # setting the borders and bottom lines of the histograms to black
-        for ax in [plot.ax_marg_x, plot.ax_marg_y]:
-            for patch in ax.patches:
-                patch.set_edgecolor('black')
-            ax.spines['bottom'].set_color('black')  
-            ax.spines['left'].set_color('black') 
-            
-    elif kind=='kde':
-        plot = sns.jointplot(data=data, x=x_column, y=y_column, kind=kind, alpha=alpha, palette=my_palette,color=my_palette,
-                         height=height, ratio=ratio, edgecolor=my_palette, s=s, hue=hue, space=space, joint_kws={"cut": cut, 'marker':marker})
-        
-        # setting the borders and bottom lines of the histograms to black
-        for ax in [plot.ax_marg_x, plot.ax_marg_y]:
-            for patch in ax.patches:
-                patch.set_edgecolor('black')
-            ax.spines['bottom'].set_color('black')  
-            ax.spines['left'].set_color('black') 
-    elif kind=='resid':
-        plot = sns.jointplot(data=data, x=x_column, y=y_column, kind=kind, palette=my_palette,color=my_palette,
-                         height=height, ratio=ratio, hue=hue, space=space)
-        # setting the borders and bottom lines of the histograms to black
-        for ax in [plot.ax_marg_x, plot.ax_marg_y]:
-            for patch in ax.patches:
-                patch.set_edgecolor('black')
-            ax.spines['bottom'].set_color('black')  
-            ax.spines['left'].set_color('black')
-        
+        my_palette = None
+
+    kws = dict(data=_frame(data, [x_column, y_column, hue]), x=x_column, y=y_column, kind=kind, palette=my_palette, color=my_palette,
+               height=height, ratio=ratio, hue=hue, space=space)
+    if kind == 'kde':
+        # contours have no markers: `marker` and `s` only apply to the scatter kinds
+        kws.update(alpha=alpha, edgecolor=my_palette, joint_kws={"cut": cut})
+    elif kind not in ('reg', 'hex', 'hist', 'resid'):
+        kws.update(alpha=alpha, edgecolor=my_palette, s=s)
+
+    if engine == 'neon':
+        if kind not in ('scatter', 'hist', 'kde'):
+            raise ValueError(f"engine='neon' draws kind='scatter', 'hist' or 'kde', not kind={kind!r}")
+        arrays, levels = _prepare(data, [x_column, y_column], hue)
+        groups = _hue_groups(arrays, hue, [x_column, y_column], bar_color if hue else [bar_color[num - 1]],
+                             levels=levels if hue_order is None else hue_order)
+        with matplotlib.rc_context(style):
+            fig, ax_joint, ax_marg_x, ax_marg_y = _joint_grid(output, height, ratio, space, marginal_ticks)
+            _joint_panels(ax_joint, ax_marg_x, ax_marg_y, groups, x_column, y_column, hue, kind, bins, cut, s, alpha,
+                          marker, (joint_kws or {}).get('fill', kind == 'scatter'), aggregate, aggregate_threshold,
+                          dpi)
+            if xlim is not None:
+                ax_joint.set_xlim(xlim)
+            if ylim is not None:
+                ax_joint.set_ylim(ylim)
+            _make_ticks(fig)
+        # the same attributes as seaborn's JointGrid, for the styling below
+        plot = SimpleNamespace(fig=fig, ax_joint=ax_joint, ax_marg_x=ax_marg_x, ax_marg_y=ax_marg_y)
+    elif engine == 'seaborn':
+        with matplotlib.rc_context(style):
+            plot = sns.jointplot(**kws)
+            _make_ticks(plot.fig)
     else:
-        plot = sns.jointplot(data=data, x=x_column, y=y_column, kind=kind, alpha=alpha, palette=my_palette,color=my_palette,
-                         height=height, ratio=ratio, edgecolor=my_palette, s=s, hue=hue, space=space)
-        
-        # setting the borders and bottom lines of the histograms to black
-        for ax in [plot.ax_marg_x, plot.ax_marg_y]:
-            for patch in ax.patches:
-                patch.set_edgecolor('black')
-            ax.spines['bottom'].set_color('black')  
-            ax.spines['left'].set_color('black') 
-            
-            
-            
-    plt.xticks(rotation=rotation)
+        raise ValueError(f"engine must be 'seaborn' or 'neon', not {engine!r}")
+
+    # setting the borders and bottom lines of the histograms to black (the neon engine draws them black already)
+    for ax in [plot.ax_marg_x, plot.ax_marg_y]:
+        for patch in ax.patches:
+            patch.set_edgecolor('black')
+        ax.spines['bottom'].set_color('black')
+        ax.spines['left'].set_color('black')
+
+    plot.ax_joint.tick_params(axis='x', labelrotation=rotation)
     
     if x_name==None:
         x_name=x_column
@@ -1447,8 +2086,6 @@ def joint(data=None, x_column=None, y_column=None, hue=None,
     #sns.despine(bottom=True, left=True)    
     if hue:
         legend = plot.ax_joint.get_legend()
-        for text in legend.get_texts():
-            text.set_color('white') 
         #legend.set_fontcolor('white')  
   
     
@@ -1491,49 +2128,67 @@ def joint(data=None, x_column=None, y_column=None, hue=None,
                     xycoords='axes fraction', fontsize=12, color='white', ha='right')  # Set ha='right' for right alignment
         vertical_position -= vertical_spacing
     
-    plt.show()
+    return _finish(plot.fig, output, dpi)
 
 
 
 # -------- Displot-------------------------------------------------------------------------------------------------------------------
 # ------------------------------------------------------------------------------------------------------------------------------------
 
+@_themed
 def displot(data, y_column, font_family='Sangha', font_color='#FDF0F0', font_size=20,
          title_pad=15, bg_color='#212946', grid_color='#FE53BB',
          kde=False, hue=None, bar_color=['#FE53BB', '#FEFFAC', '#97FEED', '#E384FF', '#FF8400'],
-           plot_title='', bins=30, y_name=None, x_name=None):
+           plot_title='', bins=30, y_name=None, x_name=None, rotation=0, kde_gridsize=100, chunksize=1_000_000,
+           ax=None, output=None, dpi=None):
+    # data can also be a streamed source, binned chunk by chunk like hist() does (see matisse/stream.py)
+    import pandas as pd
+    from . import stream
+
     
-    plt.style.use("seaborn-dark")
     
-    fig, ax = plt.subplots(figsize=(8, 6))
-    fig.set_facecolor(bg_color)
-    ax.set_facecolor(bg_color)
-
-    if hue:
-        unique_hue_values = data[hue].unique()
-        if len(unique_hue_values) == 0:
-            print("No unique values found for 'hue'.")
-            return
-
-        for i, hue_value in enumerate(unique_hue_values):
-            subset_data = data[data[hue] == hue_value]
-            label = f'{hue_value}'
-            color = bar_color[i % len(bar_color)]
-
+    # the data is read before the figure is made, so a hue without values leaves no figure behind
+    if stream.is_source(data):
+        # the same bins as below: the hues share the first one's, without a hue there are 30 (unless edges are given)
+        groups = stream.histograms(data, y_column, hue, bins if hue or np.ndim(bins) else 30, kde=kde,
+                                   kde_gridsize=kde_gridsize, chunksize=chunksize, share_bins=True)
+        empty = hue and not groups
+    elif hue:
+        # only the value and hue columns are read; every hue is a slice of them rather than a filtered frame
+        arrays, levels = _prepare(data, [y_column], hue)
+        empty = len(levels) == 0
+    else:
+        empty = False
+    if empty:
+        raise ValueError(f"No unique values found for hue={hue!r}")
+
+    fig, ax = _new_axes(output, ax, figsize=(8, 6))
+
+    if stream.is_source(data):
+        for i, (label, counts, edges, curve, _) in enumerate(groups):
+            if counts is None:
+                continue
+            color = bar_color[i % len(bar_color)] if hue else bar_color[0]
+            label = label if hue else 'Distribution'
+            hist, _, patches = ax.hist(edges[:-1], bins=edges, weights=counts, alpha=0.5, label=label, color=color,
+                                       density=True, edgecolor=color)
+            if curve is not None:
+                ax.plot(*curve, label=f'KDE ({label})' if hue else 'KDE', color=color)
+
+    elif hue:
+        for label, color, columns in _hue_groups(arrays, hue, [y_column], bar_color, levels=levels):
             # Filter out 'nan' values
-            valid_data = subset_data[y_column].dropna()
+            valid_data = columns[y_column][pd.notna(columns[y_column])]
             
             if len(valid_data) > 0:
                 # Create histogram with different colors for each hue
                 hist, bins, patches = ax.hist(valid_data, bins=bins, alpha=0.5, label=label, color=color, density=True, edgecolor=color)
 
                 if kde:
-                    kde_obj = gaussian_kde(valid_data, bw_method='silverman')
-                    x_values = np.linspace(valid_data.min(), valid_data.max(), 100)
-                    kde_values = kde_obj(x_values)
+                    x_values, kde_values = binned_kde(valid_data, gridsize=kde_gridsize)
 
                     # Create KDE plot with the same color as the distribution bars
-                    plt.plot(x_values, kde_values, label=f'KDE ({hue_value})', color=color)
+                    ax.plot(x_values, kde_values, label=f'KDE ({label})', color=color)
 
                     # Set edge color of the distribution bars to match the bar color
                     for patch in patches:
@@ -1544,33 +2199,32 @@ def displot(data, y_column, font_family='Sangha', font_color='#FDF0F0', font_siz
         color = bar_color[0]
 
         # Filter out 'nan' values
-        valid_data = data[y_column].dropna()
+        arrays, _ = _prepare(data, [y_column], dropna=True)
+        valid_data = arrays[y_column]
 
         if len(valid_data) > 0:
             # Create histogram with the same color for distribution bars and edges
             hist, bins, patches = ax.hist(valid_data, bins=30, alpha=0.5, label=label, color=color, density=True, edgecolor=color)
 
             if kde:
-                kde_obj = gaussian_kde(valid_data, bw_method='silverman')
-                x_values = np.linspace(valid_data.min(), valid_data.max(), 100)
-                kde_values = kde_obj(x_values)
+                x_values, kde_values = binned_kde(valid_data, gridsize=kde_gridsize)
 
                 # Create KDE plot with the same color as the distribution bars
-                plt.plot(x_values, kde_values, label=f'KDE', color=color)
+                ax.plot(x_values, kde_values, label=f'KDE', color=color)
                 
                 
+    profiling.mark('legend')
     if x_name==None:
-        x_name=x_column
+        x_name=y_column
     if y_name==None:
         y_name=y_column  
         
-    plt.xlabel(x_name, fontname=font_family, fontsize=font_size, color=font_color)    
+    ax.set_xlabel(x_name)    
 
-    ax.set_title(plot_title, fontsize=24, fontname=font_family, pad=title_pad, color=font_color)
-    plt.xticks(rotation=rotation, color=font_color)
-    plt.yticks(color=font_color)
-    plt.xlabel(y_name, fontname=font_family, fontsize=font_size, color=font_color)
-    plt.grid(axis='y', linestyle='--', color=grid_color, alpha=0.7)
+    ax.set_title(plot_title)
+    ax.tick_params(axis='x', labelrotation=rotation)
+    ax.set_xlabel(y_name)
+    ax.grid(True, axis='y')
 
     # Set legend text color to font_color
     legend = ax.legend(loc='upper left', bbox_to_anchor=(1, 1))
@@ -1578,12 +2232,325 @@ def displot(data, y_column, font_family='Sangha', font_color='#FDF0F0', font_siz
         text.set_color(font_color)
     
 
-    plt.show()
+    return _finish(fig, output, dpi)
 
 
 # -------- Pairplot-------------------------------------------------------------------------------------------------------------------
 # ------------------------------------------------------------------------------------------------------------------------------------
+# engine='neon' lays the grid out itself instead of going through sns.pairplot: the columns are pulled out once, the
+# aggregate of every panel (a column's range and diagonal bins or KDE, the finite pairs or the density image of an
+# off-diagonal panel) is computed on a thread pool, where NumPy releases the GIL in its inner loops, and only the
+# artists are assembled on the calling thread. A column's range and diagonal statistics are computed once and shared
+# by its diagonal panel and every panel of its row and column.
+# kind='density' draws the off-diagonal panels as 2D-binned heat images instead of markers, scanning the rows in
+# blocks once for all the pairs (see _pair_binned), so memory stays bounded and the cost grows with rows x pairs
+# without any per-row artist; kind='auto' picks it once the grid would hold more than `aggregate_threshold` markers.
+
+_pair_block = 2 ** 18  # rows binned at a time by kind='density'
+
+def _pair_vars(data, hue, vars, x_vars, y_vars):
+    # the columns along both axes: vars, x_vars/y_vars, or every numeric column other than the hue like seaborn
+    if vars is None and (x_vars is None or y_vars is None):
+        arrays = _columns(data, [name for name in _column_names(data) if name != hue])
+        vars = [name for name, values in arrays.items() if values.dtype.kind in 'iuf']
+    listed = lambda names: [names] if isinstance(names, str) else list(names)
+    return listed(vars if x_vars is None else x_vars), listed(vars if y_vars is None else y_vars)
+
+
+def _pair_column(values, diagonal, diag_kind, bins, kde_gridsize):
+    # padded (lo, hi) of one column over every hue and, on the diagonal, per hue: the counts on bins common to all
+    # hues, or the KDE curve weighted by the hue's share of the rows so the hues stay comparable (None when empty)
+    finite = [v[np.isfinite(v)] for v in values]
+    present = [v for v in finite if len(v)]
+    lo = min((v.min() for v in present), default=0.0)
+    hi = max((v.max() for v in present), default=1.0)
+    pad = (hi - lo) * 0.05 if hi > lo else 0.5
+    extent = (lo - pad, hi + pad)
+    if not diagonal:
+        return extent, None
+
+    if diag_kind == 'hist':
+        edges = np.histogram_bin_edges(np.concatenate(finite), bins, range=(lo, hi))
+        return extent, [(np.histogram(v, edges)[0], edges) if len(v) else None for v in finite]
+    total = sum(len(v) for v in finite)
+    curves = []
+    for v in finite:
+        grid, density = binned_kde(v, gridsize=kde_gridsize) if len(v) else (None, None)
+        curves.append(None if grid is None else (grid, density * len(v) / total))
+    return extent, curves
+
+
+def _pair_panel(xs, ys, extent, colors, image):
+    # the finite (x, y) pairs per hue, or with image=(shape, radius) their density image covering `extent`
+    points = []
+    for x, y in zip(xs, ys):
+        finite = np.isfinite(x) & np.isfinite(y)
+        points.append((x[finite], y[finite]))
+    if image is None:
+        return points
+    shape, radius = image
+    return _shade_points([(color, x, y) for color, (x, y) in zip(colors, points)], extent, shape, radius)
+
+
+@profiling.stage('prep')
+def _pair_aggregates(groups, columns, diagonal, panels, diag_kind, bins, kde_gridsize, workers=None):
+    # {column: (extent, diagonal)} and {(x_var, y_var): panel} for the panels given as {(x_var, y_var): image or
+    # None}; the columns go first, the panels need their extents
+    import os
+    from concurrent.futures import ThreadPoolExecutor
+
+    values = {column: [arrays[column] for _, _, arrays in groups] for column in columns}
+    colors = [color for _, color, _ in groups]
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+        summaries = {column: pool.submit(_pair_column, values[column], column in diagonal, diag_kind, bins,
+                                         kde_gridsize) for column in columns}
+        summaries = {column: future.result() for column, future in summaries.items()}
+        results = {(x, y): pool.submit(_pair_panel, values[x], values[y], summaries[x][0] + summaries[y][0],
+                                       colors, image) for (x, y), image in panels.items()}
+        return summaries, {key: future.result() for key, future in results.items()}
+
+
+def _heat_image(counts, colors):
+    # straight RGBA image of the (hue, rows, cols) counts of a density panel: every hue shaded in its colour with a
+    # log-scaled opacity and composited in hue order, over a blurred copy for the glow
+    from .raster import gaussian_blur, shade, over, unpremultiply
+
+    counts = counts.astype(np.float32)
+    peak = counts.max()
+    image = np.zeros(counts.shape[1:] + (4,), dtype=np.float32)
+    for hue_counts, color in zip(counts, colors):
+        image = over(shade(hue_counts, color, peak=peak) * 0.7, image)
+    image = over(image, gaussian_blur(image, 1.5) * 0.6)
+    return unpremultiply(image)
+
+
+@profiling.stage('prep')
+def _pair_binned(arrays, hue, levels, columns, diagonal, diag_kind, diag_bins, kde_gridsize, pairs, colors, bins,
+                 workers=None):
+    # kind='density': the same {column: (extent, diagonal)} as _pair_column and a heat image per (x_var, y_var) of
+    # `pairs`, from two scans over blocks of rows. The first collects the range and moments of every column per hue;
+    # the second bins each column of a block once, on the `bins` x `bins` panel grid of its extent (and on its
+    # diagonal bins or KDE grid), and adds up the 2D counts of every pair from those shared bin indices. Memory is a
+    # block plus the counts, whatever the number of rows.
+    import os
+    import pandas as pd
+    from concurrent.futures import ThreadPoolExecutor
+    from . import kde as _kde
+    from .stream import _Group
+
+    if diag_kind == 'hist' and isinstance(diag_bins, str):
+        raise ValueError("kind='density' bins the diagonal block by block: its bins must be a count or edges")
+    hues = len(levels) if hue else 1
+    index = pd.Index(levels) if hue else None
+    rows = len(arrays[columns[0]])
+    stats = {column: [_Group(None) for _ in range(hues)] for column in columns}
+
+    # the hue code of every row is looked up once, into the narrowest integer type: -1 for a missing or unlisted hue
+    row_codes = np.zeros(rows, dtype=np.min_scalar_type(-hues))
+    if hue:
+        for start in range(0, rows, _pair_block):
+            row_codes[start:start + _pair_block] = index.get_indexer(arrays[hue][start:start + _pair_block])
+
+    def blocks():
+        # (hue codes, {column: values}) per block of rows
+        for start in range(0, rows, _pair_block):
+            yield row_codes[start:start + _pair_block].astype(np.intp), \
+                {column: arrays[column][start:start + _pair_block] for column in columns}
+
+    def hue_values(values, valid, codes, h):
+        return values[valid & (codes == h)] if hue else values[valid]
+
+    def describe(column, codes, values):
+        values = np.asarray(values, dtype=float)
+        valid = np.isfinite(values) & (codes >= 0)
+        for h, group in enumerate(stats[column]):
+            group.describe(hue_values(values, valid, codes, h))
+
+    def bin_column(column, codes, values):
+        # the column's cell on the panel grid as x and its row offset as y (with the hue folded in), -1 for rows
+        # without a cell, and whether the block has none of those
+        values = np.asarray(values, dtype=float)
+        lo, hi = extents[column]
+        cell = np.floor((values - lo) / (hi - lo) * bins)
+        valid = np.isfinite(cell) & (codes >= 0)
+        cell = np.where(valid, cell, -1).astype(np.int32)
+        offset = np.where(valid, (codes * bins + cell) * bins, -1).astype(np.int32)
+        if column in diagonal:
+            for h, group in enumerate(stats[column]):
+                if diag_kind == 'hist':
+                    diagonals[column][h] += np.histogram(hue_values(values, valid, codes, h), edges[column])[0]
+                elif diagonals[column][h] is not None:
+                    diagonals[column][h] += _kde.linear_bin(hue_values(values, valid, codes, h), group.lo, group.hi,
+                                                            len(diagonals[column][h]))
+        return cell, offset, bool(valid.all())
+
+    def bin_pair(pair, binned):
+        (cell, _, x_complete), (_, offset, y_complete) = binned[pair[0]], binned[pair[1]]
+        flat = offset + cell
+        if not (x_complete and y_complete):
+            flat = flat[(cell >= 0) & (offset >= 0)]
+        counts[pair] += np.bincount(flat, minlength=hues * bins * bins)
+
+    # each unordered pair is counted once, with the earlier column as x; the mirrored panel is its transpose
+    position = {column: i for i, column in enumerate(columns)}
+    counts = {tuple(sorted(pair, key=position.get)): np.zeros(hues * bins * bins, dtype=np.int64) for pair in pairs}
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+        for codes, block in blocks():
+            list(pool.map(lambda column: describe(column, codes, block[column]), columns))
+
+        extents, edges, diagonals = {}, {}, {}
+        for column in columns:
+            present = [group for group in stats[column] if group.count]
+            lo = min((group.lo for group in present), default=0.0)
+            hi = max((group.hi for group in present), default=1.0)
+            pad = (hi - lo) * 0.05 if hi > lo else 0.5
+            extents[column] = (lo - pad, hi + pad)
+            if column in diagonal and diag_kind == 'hist':
+                edges[column] = np.histogram_bin_edges(np.empty(0), diag_bins, range=(lo, hi))
+                diagonals[column] = [np.zeros(len(edges[column]) - 1) for _ in stats[column]]
+            elif column in diagonal:
+                # a KDE grid per hue over its own range, as binned_kde would lay it out
+                diagonals[column] = [
+                    np.zeros(_kde.grid_bins(group.lo, group.hi, _kde.bandwidth(group.std(), group.count), kde_gridsize))
+                    if group.count > 1 and group.std() > 0 else None for group in stats[column]]
+
+        for codes, block in blocks():
+            binned = dict(zip(columns, pool.map(lambda column: bin_column(column, codes, block[column]), columns)))
+            list(pool.map(lambda pair: bin_pair(pair, binned), counts))
+
+        summaries = {}
+        for column in columns:
+            groups = stats[column]
+            if column not in diagonal:
+                summaries[column] = extents[column], None
+            elif diag_kind == 'hist':
+                summaries[column] = extents[column], [(binned, edges[column]) if group.count else None
+                                                      for group, binned in zip(groups, diagonals[column])]
+            else:
+                total = sum(group.count for group in groups)
+                curves = []
+                for group, grid in zip(groups, diagonals[column]):
+                    if not group.count:
+                        curves.append(None)
+                    elif grid is None:
+                        curves.append((np.linspace(group.lo, group.lo, kde_gridsize), np.zeros(kde_gridsize)))
+                    else:
+                        points = np.linspace(group.lo, group.hi, kde_gridsize)
+                        density = _kde.grid_density(grid, group.lo, group.hi,
+                                                    _kde.bandwidth(group.std(), group.count), points)
+                        curves.append((points, density * group.count / total))
+                summaries[column] = extents[column], curves
+
+        def image(pair):
+            x, y = pair
+            if (x, y) in counts:
+                return _heat_image(counts[x, y].reshape(hues, bins, bins), colors)
+            return _heat_image(counts[y, x].reshape(hues, bins, bins).transpose(0, 2, 1), colors)
+        return summaries, dict(zip(pairs, pool.map(image, pairs)))
+
+
+def _pair_grid(data, hue, hue_order, vars, x_vars, y_vars, kind, diag_kind, height, aspect, corner, plot_kws,
+               diag_kws, bar_color, font_color, rotation, aggregate, aggregate_threshold, kde_gridsize, workers,
+               output, dpi):
+    # the neon engine (see above); returns the figure with every panel drawn. Without a diagonal (x_vars differ
+    # from y_vars, or diag_kind=None) every cell is an off-diagonal panel
+    import matplotlib
+    import matplotlib.lines as mlines
+    import pandas as pd
+
+    if kind not in ('scatter', 'density', 'auto'):
+        raise ValueError(f"engine='neon' draws kind='scatter', 'density' or 'auto' panels, not kind={kind!r}")
+    x_vars, y_vars = _pair_vars(data, hue, vars, x_vars, y_vars)
+    if diag_kind == 'auto':
+        diag_kind = 'kde' if hue else 'hist'
+    diagonal = set(x_vars) if x_vars == y_vars and diag_kind is not None else set()
+    columns = list(dict.fromkeys(x_vars + y_vars))
+    arrays, levels = _prepare(data, columns, hue)
+    if hue:
+        levels = pd.Index(levels if hue_order is None else hue_order).dropna()
+    s, alpha = plot_kws.get('s', 20), plot_kws.get('alpha', 0.7)
+
+    fig = _new_figure(output, figsize=(height * aspect * len(x_vars), height * len(y_vars)))
+    # the axes are not shared: every cell is given the limits of its row and column below, and matplotlib's sharing
+    # costs O(cells) on every limit change of a wide grid
+    axes = fig.subplots(len(y_vars), len(x_vars), squeeze=False, gridspec_kw={'wspace': 0.08, 'hspace': 0.08})
+    cells = {(i, j): axes[i, j] for i in range(len(y_vars)) for j in range(len(x_vars)) if not corner or j <= i}
+    scatters = {(i, j): ax for (i, j), ax in cells.items() if not (x_vars[j] == y_vars[i] and x_vars[j] in diagonal)}
+    # the threshold counts the markers of the whole grid
+    crowded = len(arrays[columns[0]]) * len(scatters) > aggregate_threshold if columns else False
+    if kind == 'auto':
+        kind = 'density' if crowded else 'scatter'
+    if aggregate is None:
+        aggregate = crowded
+
+    if kind == 'density':
+        groups = [(f'{level}', bar_color[i % len(bar_color)], None) for i, level in enumerate(levels)] if hue \
+            else [(None, bar_color[0], None)]
+        pairs = [(x_vars[j], y_vars[i]) for i, j in scatters]
+        summaries, panels = _pair_binned(arrays, hue, levels, columns, diagonal, diag_kind, diag_kws.get('bins', 20),
+                                         kde_gridsize, pairs, [color for _, color, _ in groups],
+                                         plot_kws.get('bins', 100), workers)
+    else:
+        groups = _hue_groups(arrays, hue, columns, bar_color, levels=levels)
+        panels = {(x_vars[j], y_vars[i]): (_pixel_shape(ax, dpi), np.sqrt(s) / 2 * (dpi or fig.dpi) / 72)
+                  if aggregate else None for (i, j), ax in scatters.items()}
+        summaries, panels = _pair_aggregates(groups, columns, diagonal, panels, diag_kind, diag_kws.get('bins', 20),
+                                             kde_gridsize, workers)
+
+    for (i, j), ax in cells.items():
+        x_var, y_var = x_vars[j], y_vars[i]
+        if (x_var, y_var) not in panels:
+            # the diagonal lives on a twin with its own y scale, the cell itself keeps the row's limits
+            twin = ax.twinx()
+            ax.tick_params(axis='y', left=matplotlib.rcParams['ytick.left'])  # twinx turns the left ticks on
+            for (_, color, _), binned in zip(groups, summaries[x_var][1]):
+                if binned is None:
+                    continue
+                if diag_kind == 'hist':
+                    counts, edges = binned
+                    _, _, patches = twin.hist(edges[:-1], bins=edges, weights=counts, color=color, edgecolor=color,
+                                              alpha=0.5)
+                    _glow_patches(twin, patches, color, alpha_step=25, width_step=1, fill=True)
+                else:
+                    line, = twin.plot(*binned, color=color)
+                    _glow_line(twin, line, color, alpha_step=24, width_step=2)
+            twin.set_ylim(bottom=0)
+            twin.yaxis.set_visible(False)
+            twin.grid(False)
+        elif kind == 'density' or aggregate:
+            ax.imshow(panels[x_var, y_var], extent=summaries[x_var][0] + summaries[y_var][0], origin='lower',
+                      aspect='auto', interpolation='nearest', zorder=1)
+        else:
+            for (_, color, _), (x, y) in zip(groups, panels[x_var, y_var]):
+                ax.scatter(x, y, color=color, s=s, edgecolor=color, alpha=alpha)
+                _glow_scatter(ax, x, y, color, s, width_step=1)
+
+    # tick labels and axis labels on the outer cells only
+    for (i, j), ax in np.ndenumerate(axes):
+        if (i, j) not in cells:
+            ax.remove()
+            continue
+        ax.set_xlim(summaries[x_vars[j]][0])
+        ax.set_ylim(summaries[y_vars[i]][0])
+        ax.tick_params(labelbottom=i == len(y_vars) - 1, labelleft=j == 0)
+        if i == len(y_vars) - 1:
+            ax.set_xlabel(x_vars[j], color=font_color, fontsize=18)
+            ax.tick_params(axis='x', labelrotation=rotation)
+        if j == 0:
+            ax.set_ylabel(y_vars[i], color=font_color, fontsize=18)
+
+    profiling.mark('legend')
+    if hue:
+        handles = [mlines.Line2D([], [], marker='o', linestyle='', color=color, markersize=8, label=label)
+                   for label, color, _ in groups]
+        legend = fig.legend(handles=handles, title=hue, loc='center left', bbox_to_anchor=(1, 0.5), frameon=False)
+        for text in legend.get_texts():
+            text.set_color(font_color)
+        legend.get_title().set_color(font_color)
+    return fig
+
 
+@_themed
 def pairplot(data, hue=None, hue_order=None, 
              vars=None, x_vars=None, y_vars=None, kind='scatter', diag_kind='auto', 
              markers=None, height=2.5, aspect=1, corner=False, dropna=False, 
@@ -1595,29 +2562,47 @@ def pairplot(data, hue=None, hue_order=None,
              font_family='Sangha', font_color='#FDF0F0', font_size=20,
              title_pad=15, bg_color='#212946', grid_color='#FE53BB',
              bar_color=['#FE53BB', '#FEFFAC', '#97FEED', '#E384FF', '#FF8400', '#45FFCA', '#0B666A', '#3E00FF'],
-             num=1,
-            plot_title=''):
-    
-    import warnings
-    # Suppress all warnings
-    warnings.filterwarnings("ignore")
-    sns.set(rc={"axes.facecolor":"#212946","figure.facecolor":"#212946", 'ytick.color': font_color})
-    
-    if hue == None:
-        my_palette = sns.set_palette(sns.color_palette(bar_color))
-    else:
-        my_palette = sns.set_palette(sns.color_palette(bar_color))
-  
-    sns.set_style({'grid.linestyle': ':', 'grid.color':'#2a365e'}) 
-    
-    
+             num=1, engine='seaborn', aggregate=None, aggregate_threshold=200_000, kde_gridsize=100, workers=None,
+            plot_title='', output=None, dpi=None):
+    # engine='neon' builds the grid with the neon engine above (panels aggregated on `workers` threads, markers
+    # replaced by density images once rows times scatter panels pass `aggregate_threshold`); `markers` only applies
+    # to engine='seaborn'. kind='density' (2D-binned heat panels, plot_kws={'bins': 100} per axis) and kind='auto'
+    # always use the neon engine
+
+    import matplotlib
+    import seaborn as sns
+    from cycler import cycler
+
+    # the seaborn theme (darkgrid, notebook context) with the neon palette as its colour cycle, applied only while the
+    # grid is drawn rather than set globally with sns.set/sns.set_palette/sns.set_style
+    style = {**sns.axes_style('darkgrid'), **sns.plotting_context('notebook'), 'font.family': 'sans-serif',
+             'axes.facecolor': bg_color, 'figure.facecolor': bg_color, 'ytick.color': font_color,
+             'grid.linestyle': ':', 'grid.color': '#2a365e', 'axes.prop_cycle': cycler(color=bar_color)}
+    my_palette = None
+    if engine == 'neon' or kind in ('density', 'auto'):
+        ticks = {'xtick.labelsize': 12, 'ytick.labelsize': 12, 'xtick.labelcolor': font_color,
+                 'ytick.labelcolor': font_color}
+        with matplotlib.rc_context({**style, **ticks}):
+            fig = _pair_grid(data, hue, hue_order, vars, x_vars, y_vars, kind, diag_kind, height, aspect, corner,
+                             plot_kws or {}, diag_kws or {}, bar_color, font_color, rotation, aggregate,
+                             aggregate_threshold, kde_gridsize, workers, output, dpi)
+            _make_ticks(fig)
+        fig.suptitle(plot_title, fontsize=26, color=font_color, y=1.05)
+        return _finish(fig, output, dpi)
+    if engine != 'seaborn':
+        raise ValueError(f"engine must be 'seaborn' or 'neon', not {engine!r}")
+
+    data = _frame(data)  # the grid shows every numeric column
+
     # the plot itself
-    if hue != None:
-        plot = sns.pairplot(data, palette=my_palette, hue=hue, markers=markers, 
-                        kind=kind, corner=corner, plot_kws=plot_kws, grid_kws=grid_kws, diag_kws=diag_kws)
-    else:    
-        plot = sns.pairplot(data, palette=my_palette, hue=hue, markers=markers, 
-                        kind=kind, corner=corner, plot_kws=plot_kws, grid_kws=grid_kws, diag_kws=({'edgecolor':'black', 'linewidth':1}))
+    with matplotlib.rc_context(style):
+        if hue != None:
+            plot = sns.pairplot(data, palette=my_palette, hue=hue, markers=markers,
+                            kind=kind, corner=corner, plot_kws=plot_kws, grid_kws=grid_kws, diag_kws=diag_kws)
+        else:
+            plot = sns.pairplot(data, palette=my_palette, hue=hue, markers=markers,
+                            kind=kind, corner=corner, plot_kws=plot_kws, grid_kws=grid_kws, diag_kws=({'edgecolor':'black', 'linewidth':1}))
+        _make_ticks(plot.fig)
     
     # Set xticks and yticks font color and font size
     for ax in plot.axes.flat:
@@ -1639,9 +2624,6 @@ def pairplot(data, hue=None, hue_order=None,
 
         plot.legend.get_title().set_color(font_color)    
         
-    for ax in plt.gcf().get_axes():
-        ax.yaxis.labelpad = 10  
-        ax.xaxis.labelpad = 10
     
         
         
@@ -1654,8 +2636,68 @@ def pairplot(data, hue=None, hue_order=None,
     ax.annotate(annotation_text_top, xy=(annotation_x_top, annotation_y_top),
                     xycoords='axes fraction', fontsize=12, color='none')
     
-    plt.show()
+    return _finish(plot.fig, output, dpi)
+
 
 
 
 
+# -------- Dashboard------------------------------------------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------------------------------------------------------------
+# dashboard() lays several charts out as the panels of one figure. The theme is set up once for the whole page, every
+# chart draws into its own axes (the ax= argument of the single-axes charts) and the page is encoded once, instead of
+# one figure, theme and image per chart stitched together afterwards.
+
+_panel_charts = ('scatter', 'bar', 'barh', 'line', 'hist', 'violin', 'pie', 'box', 'scatterbox', 'displot')
+
+
+@_themed
+def dashboard(panels, layout=None, font_family='Sangha', font_color='#FDF0F0', font_size=20, title_pad=15,
+              bg_color='#212946', grid_color='#FE53BB', plot_title=None, figsize=None, width_ratios=None,
+              height_ratios=None, output=None, dpi=None):
+    # panels: {name: spec}, a spec being a dict that names the chart ('chart': 'bar') plus that chart's keyword
+    # arguments like the specs of render_many; a list of specs names them by position. layout: a mosaic of those names
+    # as taken by Figure.subplot_mosaic (a list of rows, or a string such as 'AAB;CDB' for single-letter names), where
+    # a panel spans every cell holding its name and '.' leaves a cell empty; by default the panels fill the rows of an
+    # about square grid. figsize defaults to 8x6 inches per cell. The styling arguments are the page's, so the panel
+    # specs do not take them.
+    if not isinstance(panels, dict):
+        panels = dict(enumerate(panels))
+    for name, spec in panels.items():
+        if spec.get('chart') not in _panel_charts:
+            raise ValueError(f"panel {name!r}: chart must be one of {', '.join(_panel_charts)}, "
+                             f"not {spec.get('chart')!r}")
+        styled = [argument for argument in _theme_arguments if argument in spec]
+        if styled:
+            raise ValueError(f"panel {name!r}: {', '.join(styled)} is set once for the whole dashboard")
+    if layout is None:
+        columns = int(np.ceil(np.sqrt(len(panels))))
+        names = list(panels) + ['.'] * (-len(panels) % columns)
+        layout = [names[i:i + columns] for i in range(0, len(names), columns)]
+
+    fig = _new_figure(output, layout='constrained')
+    axes = fig.subplot_mosaic(layout, width_ratios=width_ratios, height_ratios=height_ratios)
+    missing = [name for name in panels if name not in axes]
+    if missing:
+        raise ValueError(f"the layout has no cell for the panels {missing!r}")
+    if figsize is None:
+        rows, columns = next(iter(axes.values())).get_subplotspec().get_gridspec().get_geometry()
+        figsize = (8 * columns, 6 * rows)
+    fig.set_size_inches(figsize)
+
+    # the chart functions themselves, without the theme and output handling of @_themed around every call
+    style = dict(font_family=font_family, font_color=font_color, font_size=font_size, title_pad=title_pad,
+                 bg_color=bg_color, grid_color=grid_color)
+    for name, spec in panels.items():
+        spec = dict(spec)
+        chart = globals()[spec.pop('chart')].__wrapped__
+        chart(**spec, **style, ax=axes[name], output='panel', dpi=dpi)
+
+    if plot_title is not None:
+        fig.suptitle(plot_title, fontsize=26, color=font_color)
+    if output is not None:
+        # the panels are placed once, here, and the layout frozen: encoding the page then draws it as often as it
+        # would draw a single chart, instead of solving the layout again on every draw
+        fig.get_layout_engine().execute(fig)
+        fig.set_layout_engine('none')
+    return _finish(fig, output, dpi)
@@ -0,0 +1,156 @@
+import contextlib
+import contextvars
+import functools
+import json
+import time
+from collections.abc import Mapping
+
+# -------- Profiling hooks-----------------------------------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------------------------------------------------------------
+# with matisse.profile() as calls: records, for every neon chart called inside the block, how long each stage took
+# and how many artists the figure ended up with. The stages are exclusive (a glow pass inside the artist stage is
+# only counted as glow):
+#   theme       waiting for the theme lock and entering the rc context
+#   prep        pulling, filtering and sorting the referenced columns, hue grouping
+#   kde         kernel density estimates
+#   artists     figure, axes and base artists, and whatever the chart does that is not another stage
+#   glow        glow layers (and the density image of an aggregated scatter)
+#   legend      legend, labels and title
+#   annotation  annotation text
+#   render      draw and encode (png/svg/pdf), or plt.show()
+# State lives in context variables, so concurrent threads and asyncio tasks each profile their own calls; a thread
+# started inside the block does not inherit it. Without an active profile() every hook is one ContextVar lookup.
+
+_sessions = contextvars.ContextVar('matisse_profile_sessions', default=())
+_recorder = contextvars.ContextVar('matisse_profile_recorder', default=None)
+
+
+class _Recorder:
+    def __init__(self, chart):
+        self.chart = chart
+        self.started = self.last = time.perf_counter()
+        self.stack = ['theme']
+        self.stages = {}
+        self.rows = None  # rows counted while a streamed source is read
+
+    def _charge(self):
+        now = time.perf_counter()
+        name = self.stack[-1]
+        self.stages[name] = self.stages.get(name, 0.0) + now - self.last
+        self.last = now
+
+    def push(self, name):
+        self._charge()
+        self.stack.append(name)
+
+    def pop(self):
+        self._charge()
+        self.stack.pop()
+
+    def mark(self, name):
+        self._charge()
+        self.stack[-1] = name
+
+
+def mark(name):
+    # from here on the running chart's time goes to stage `name` (until the next mark)
+    recorder = _recorder.get()
+    if recorder is not None:
+        recorder.mark(name)
+
+
+@contextlib.contextmanager
+def _stage_block(recorder, name):
+    recorder.push(name)
+    try:
+        yield
+    finally:
+        recorder.pop()
+
+
+def stage(name):
+    # decorator: the time spent in the function is counted as stage `name`
+    def decorator(function):
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            recorder = _recorder.get()
+            if recorder is None:
+                return function(*args, **kwargs)
+            with _stage_block(recorder, name):
+                return function(*args, **kwargs)
+        return timed
+    return decorator
+
+
+def rows(count):
+    # the running chart read `count` more rows of a streamed source, whose length is only known once it is read
+    recorder = _recorder.get()
+    if recorder is not None:
+        recorder.rows = (recorder.rows or 0) + count
+
+
+@contextlib.contextmanager
+def chart_call(chart, data=None):
+    # wraps one chart call (neon_tokyo._themed); yields a function the caller hands the built figure to
+    sessions = _sessions.get()
+    if not sessions:
+        yield lambda fig: None
+        return
+
+    from . import stream
+
+    recorder = _Recorder(chart)
+    record = {'chart': chart}
+    # the length of a path or a list of chunks is not a row count: streamed rows are counted by rows() as they are read
+    if isinstance(data, Mapping):
+        record['rows'] = len(next(iter(data.values()), ()))
+    elif data is not None and hasattr(data, '__len__') and not stream.is_source(data):
+        record['rows'] = len(data)
+
+    def built(fig):
+        if fig is not None:
+            record['artists'] = len(fig.findobj())
+
+    token = _recorder.set(recorder)
+    try:
+        yield built
+    finally:
+        recorder._charge()
+        _recorder.reset(token)
+        if recorder.rows is not None:
+            record['rows'] = recorder.rows
+        record['seconds'] = recorder.last - recorder.started
+        record['stages'] = recorder.stages
+        for session in sessions:
+            session.add(record)
+
+
+class _Session:
+    def __init__(self, callback, logger):
+        self.calls = []
+        self.callback = callback
+        self.logger = logger
+
+    def add(self, record):
+        self.calls.append(record)
+        if self.callback is not None:
+            self.callback(record)
+        if self.logger is not None:
+            self.logger.info(json.dumps(record), extra={'matisse_profile': record})
+
+
+@contextlib.contextmanager
+def profile(callback=None, logger=None):
+    # yields the list the records are appended to; callback(record) is called after every chart, and a logger
+    # (a logging.Logger, or True for the 'matisse.profile' logger) gets each record as one JSON line at INFO level,
+    # with the dict itself in the log record's `matisse_profile` attribute. Blocks can be nested.
+    if logger is True:
+        import logging
+        logger = logging.getLogger('matisse.profile')
+
+    session = _Session(callback, logger)
+    token = _sessions.set(_sessions.get() + (session,))
+    try:
+        yield session.calls
+    finally:
+        _sessions.reset(token)
@@ -0,0 +1,83 @@
+import numpy as np
+
+# -------- Raster helpers------------------------------------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------------------------------------------------------------
+# Pixel-grid building blocks for the aggregated chart modes: vectorized 2D binning, a separable Gaussian blur and
+# compositing of premultiplied RGBA images. Everything here costs O(rows) once and O(pixels) afterwards.
+
+
+def bin2d(x, y, extent, shape, weights=None):
+    # counts of the points on a (rows, cols) grid covering extent=(x0, x1, y0, y1); row 0 is the bottom (y0) edge
+    # and points outside the extent or with a missing coordinate are dropped
+    rows, cols = shape
+    x0, x1, y0, y1 = extent
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    column = (x - x0) / (x1 - x0) * cols
+    row = (y - y0) / (y1 - y0) * rows
+    # selected before the cast to integers, which is undefined for NaN; the upper edges belong to the last bin,
+    # like np.histogram2d
+    inside = (column >= 0) & (column <= cols) & (row >= 0) & (row <= rows)
+    column = np.minimum(column[inside].astype(np.intp), cols - 1)
+    row = np.minimum(row[inside].astype(np.intp), rows - 1)
+    if weights is not None:
+        weights = np.asarray(weights, dtype=float)[inside]
+    counts = np.bincount(row * cols + column, weights=weights, minlength=rows * cols)
+    return counts.reshape(rows, cols).astype(np.float32)
+
+
+def gaussian_blur(image, sigma):
+    # separable Gaussian blur over the first two axes (any trailing channel axis is kept); the image is treated
+    # as zero outside its border, so nothing wraps around. Narrow kernels are applied directly; wide ones run on a
+    # half-resolution copy (the result is smooth at that scale anyway) and are sampled back up
+    if sigma <= 0:
+        return image
+    if sigma > 4:
+        rows, cols = image.shape[:2]
+        small = image[:rows - rows % 2, :cols - cols % 2]
+        small = (small[0::2, 0::2] + small[1::2, 0::2] + small[0::2, 1::2] + small[1::2, 1::2]) / 4
+        small = gaussian_blur(small, sigma / 2)
+        blurred = np.zeros_like(image)
+        blurred[:rows - rows % 2, :cols - cols % 2] = small.repeat(2, axis=0).repeat(2, axis=1)
+        return blurred
+
+    reach = int(np.ceil(3 * sigma))
+    offsets = np.arange(-reach, reach + 1)
+    kernel = np.exp(-0.5 * (offsets / sigma) ** 2)
+    kernel = (kernel / kernel.sum()).astype(image.dtype)
+
+    for axis in (0, 1):
+        image = np.moveaxis(image, axis, 0)
+        length = len(image)
+        padded = np.zeros((length + 2 * reach,) + image.shape[1:], dtype=image.dtype)
+        padded[reach:reach + length] = image
+        image = kernel[0] * padded[:length]
+        for tap in range(1, len(kernel)):
+            image += kernel[tap] * padded[tap:tap + length]
+        image = np.moveaxis(image, 0, axis)
+    return image
+
+
+def shade(counts, color, peak=None, floor=0.15):
+    # premultiplied RGBA image of one colour whose opacity follows the log of the counts; empty cells stay clear
+    import matplotlib.colors as mcolors
+
+    peak = counts.max() if peak is None else peak
+    alpha = np.zeros_like(counts)
+    if peak > 0:
+        filled = counts > 0
+        alpha[filled] = floor + (1 - floor) * np.log1p(counts[filled]) / np.log1p(peak)
+    rgb = np.asarray(mcolors.to_rgb(color), dtype=alpha.dtype)
+    return np.concatenate([alpha[..., None] * rgb, alpha[..., None]], axis=-1)
+
+
+def over(top, bottom):
+    # Porter-Duff "over" for premultiplied RGBA images
+    return top + bottom * (1 - top[..., 3:])
+
+
+def unpremultiply(image):
+    # premultiplied RGBA -> straight RGBA clipped to [0, 1], ready for imshow
+    alpha = np.clip(image[..., 3:], 0, 1)
+    rgb = np.divide(image[..., :3], alpha, out=np.zeros_like(image[..., :3]), where=alpha > 0)
+    return np.concatenate([np.clip(rgb, 0, 1), alpha], axis=-1)
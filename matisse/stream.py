@@ -0,0 +1,190 @@
+import glob
+import os
+
+import numpy as np
+
+from . import kde as _kde
+from . import neon_tokyo, profiling
+
+# -------- Streamed histograms-------------------------------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------------------------------------------------------------
+# hist() and displot() also take a source of chunks instead of a frame: a path to a Parquet or CSV file, a directory
+# or glob pattern of such partitions, an iterable of chunks (anything the charts take as data), or a function that
+# returns a fresh iterator of chunks. The rows are binned one chunk at a time, so memory is bounded by a chunk plus
+# the bin counts (and KDE grid) of every hue, however large the source.
+# The bins are the in-memory ones: a first pass collects each hue's range (and, for the KDE, its count and spread),
+# a second pass bins. A source that can only be read once (a generator) is binned in a single pass, so it needs
+# fixed bin edges; its KDE is estimated on a fine grid over those edges.
+
+_parquet = ('.parquet', '.pq')
+
+
+def is_source(data):
+    return isinstance(data, (str, os.PathLike)) or (
+        not neon_tokyo._is_frame(data) and not isinstance(data, np.ndarray) and
+        (callable(data) or hasattr(data, '__iter__')))
+
+
+def _partitions(path):
+    if os.path.isdir(path):
+        paths = [os.path.join(root, name) for root, _, names in os.walk(path) for name in names
+                 if not name.startswith(('.', '_'))]
+    elif glob.has_magic(path):
+        paths = glob.glob(path, recursive=True)
+    else:
+        paths = [path]
+    if not paths:
+        raise FileNotFoundError(f"no files found at {path!r}")
+    return sorted(paths)
+
+
+def _read(path, columns, chunksize):
+    # only `columns` are read, `chunksize` rows at a time
+    if path.lower().endswith(_parquet):
+        import pyarrow.parquet as pq
+
+        yield from pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns)
+    else:
+        import pandas as pd
+
+        with pd.read_csv(path, usecols=columns, chunksize=chunksize) as reader:
+            yield from reader
+
+
+def _reader(source, columns, chunksize):
+    # a function returning an iterator over the chunks, and whether it can be called more than once
+    if isinstance(source, (str, os.PathLike)):
+        paths = _partitions(os.fspath(source))
+        return (lambda: (chunk for path in paths for chunk in _read(path, columns, chunksize))), True
+    if callable(source):
+        return source, True
+    if iter(source) is source:
+        return (lambda: source), False
+    return (lambda: iter(source)), True
+
+
+class _Group:
+    # running statistics and bin counts of one hue
+    def __init__(self, label):
+        self.label = label
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # sum of squared deviations from the mean
+        self.lo = np.inf
+        self.hi = -np.inf
+        self.counts = None
+        self.edges = None
+        self.grid = None  # KDE grid counts over [grid_lo, grid_hi]
+        self.grid_lo = self.grid_hi = None
+
+    def describe(self, values):
+        # merges the moments of a chunk into the running ones (Chan et al.), which stays exact across chunks
+        if not len(values):
+            return
+        values = np.asarray(values, dtype=float)
+        count, mean = len(values), values.mean()
+        m2 = ((values - mean) ** 2).sum()
+        delta = mean - self.mean
+        total = self.count + count
+        self.mean += delta * count / total
+        self.m2 += m2 + delta ** 2 * self.count * count / total
+        self.count = total
+        self.lo = min(self.lo, values.min())
+        self.hi = max(self.hi, values.max())
+
+    def std(self):
+        return np.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+
+@profiling.stage('prep')
+def histograms(source, y_column, hue=None, bins=20, weights=None, kde=False, kde_gridsize=100,
+               chunksize=1_000_000, share_bins=False):
+    # per hue, in order of first appearance: (label, bin counts, bin edges, (grid, density) or None, largest value).
+    # Hues without any value have no counts. `weights` can only be a column name here. share_bins=True bins every
+    # hue on the edges of the first one that has values (displot overlays its hues on common bins).
+    if weights is not None and not isinstance(weights, str):
+        raise ValueError("a streamed histogram takes its weights from a column: pass the column name")
+    columns = list(dict.fromkeys(column for column in (y_column, hue or None, weights) if column is not None))
+    chunks, rereadable = _reader(source, columns, chunksize)
+    edges = None if np.ndim(bins) == 0 else np.asarray(bins, dtype=float)
+    if edges is None and not rereadable:
+        raise ValueError("a single-use iterator of chunks is only read once: pass fixed bin edges as bins=[...], or "
+                         "a path, a list or a function returning the chunks, which can be read twice")
+
+    groups = {}
+    shared = []  # the common edges with share_bins, once the first hue has set them
+
+    def split(chunk, count=False):
+        # (group, non-missing values, their weights) per hue of the chunk; count=True on the pass that bins, so the
+        # profiled row count covers the source once
+        import pandas as pd
+
+        arrays = neon_tokyo._columns(chunk, columns)
+        if count:
+            profiling.rows(len(arrays[y_column]))
+        for label, _, group in neon_tokyo._hue_groups(arrays, hue, columns, [None]):
+            values = group[y_column]
+            valid = pd.notna(values)
+            if label not in groups:
+                groups[label] = _Group(label)
+            yield groups[label], values[valid], group[weights][valid] if weights else None
+
+    two_passes = rereadable and (edges is None or kde)
+    if two_passes:
+        for chunk in chunks():
+            for group, values, _ in split(chunk):
+                group.describe(values)
+
+    def prepare(group):
+        # the bins (and KDE grid) of a group, from its range when it is known
+        if edges is not None:
+            group.edges = edges
+        elif shared:
+            group.edges = shared[0]
+        else:
+            lo, hi = (group.lo, group.hi) if group.count else (0.0, 1.0)
+            if lo == hi:
+                lo, hi = lo - 0.5, hi + 0.5
+            group.edges = np.linspace(lo, hi, int(bins) + 1)
+            if share_bins and group.count:
+                shared.append(group.edges)
+        group.counts = np.zeros(len(group.edges) - 1)
+
+        if kde:
+            if two_passes and group.count > 1 and group.std() > 0:
+                bw = _kde.bandwidth(group.std(), group.count)
+                group.grid_lo, group.grid_hi = group.lo, group.hi
+                size = _kde.grid_bins(group.lo, group.hi, bw, kde_gridsize)
+            else:
+                # range and spread are not known before the data: the finest grid over the bin edges
+                group.grid_lo, group.grid_hi = group.edges[0], group.edges[-1]
+                size = 2 ** 16
+            group.grid = np.zeros(size)
+
+    for chunk in chunks():
+        for group, values, chunk_weights in split(chunk, count=True):
+            if group.counts is None:
+                prepare(group)
+            if not two_passes:
+                group.describe(values)
+            group.counts += np.histogram(values, bins=group.edges, weights=chunk_weights)[0]
+            if kde and len(values):
+                values = np.asarray(values, dtype=float)
+                values = values[(values >= group.grid_lo) & (values <= group.grid_hi)]
+                group.grid += _kde.linear_bin(values, group.grid_lo, group.grid_hi, len(group.grid))
+
+    results = []
+    for group in groups.values():
+        if not group.count:
+            results.append((group.label, None, None, None, np.nan))
+            continue
+        curve = None
+        if kde:
+            grid = np.linspace(group.lo, group.hi, kde_gridsize)
+            if group.count < 2 or not group.std() > 0 or not group.grid.sum():
+                curve = np.linspace(group.lo, group.lo, kde_gridsize), np.zeros(kde_gridsize)
+            else:
+                bw = _kde.bandwidth(group.std(), group.count)
+                curve = grid, _kde.grid_density(group.grid, group.grid_lo, group.grid_hi, bw, grid)
+        results.append((group.label, group.counts, group.edges, curve, group.hi))
+    return results
@@ -0,0 +1,80 @@
+import io
+
+import numpy as np
+import pytest
+
+from matisse.bloom import Bloom
+
+
+def _figure():
+    import matplotlib
+
+    matplotlib.use('Agg')
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(4, 3), dpi=100)
+    ax = fig.subplots()
+    rng = np.random.default_rng(0)
+    points = ax.scatter(*rng.normal(size=(2, 500)), color='#FE53BB')
+    line, = ax.plot(np.linspace(-3, 3, 50), np.sin(np.linspace(-3, 3, 50)), color='#97FEED')
+    return fig, ax, [points, line]
+
+
+def _count_draws(sources):
+    # counts the draws of each source that really render it (the bloom wraps what it finds on the artist)
+    draws = [0] * len(sources)
+    for i, artist in enumerate(sources):
+        def counted(renderer, draw=artist.draw, i=i):
+            draws[i] += 1
+            return draw(renderer)
+        artist.draw = counted
+    return draws
+
+
+def _pixels(fig):
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    canvas = FigureCanvasAgg(fig)
+    canvas.draw()
+    return canvas, np.asarray(canvas.buffer_rgba()).astype(int)
+
+
+def test_sources_are_drawn_once_per_frame():
+    fig, ax, sources = _figure()
+    draws = _count_draws(sources)
+    Bloom(ax, sources)
+    canvas, _ = _pixels(fig)
+    assert draws == [1, 1]
+    canvas.draw()
+    assert draws == [2, 2]
+
+
+def test_vector_outputs_keep_the_sources_as_vectors():
+    fig, ax, sources = _figure()
+    draws = _count_draws(sources)
+    Bloom(ax, sources)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='svg')
+    # once into the buffer the glow is blurred from, once as vectors over the embedded glow image
+    assert draws == [2, 2]
+    assert b'<image' in buffer.getvalue()
+
+
+def test_composite_without_glow_is_the_plain_drawing():
+    fig, ax, sources = _figure()
+    _, plain = _pixels(fig)
+    Bloom(ax, sources, strength=0)
+    _, composited = _pixels(fig)
+    # equal up to the 8-bit rounding of Agg's own blending
+    assert np.abs(composited - plain).max() <= 3
+
+
+@pytest.mark.parametrize('hidden', [False, True])
+def test_glow_follows_the_visibility_of_the_bloom(hidden):
+    fig, ax, sources = _figure()
+    _, plain = _pixels(fig)
+    bloom = Bloom(ax, sources)
+    bloom.set_visible(not hidden)
+    _, pixels = _pixels(fig)
+    # a hidden bloom leaves the sources to draw themselves as if it was not there
+    assert (np.abs(pixels - plain).max() <= 3) == hidden
@@ -0,0 +1,107 @@
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from matisse.cache import RenderCache, render_key
+
+
+def _frame(rows=50):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({'x': rng.normal(size=rows), 'y': rng.normal(size=rows), 'w': rng.uniform(size=rows),
+                         'g': np.array(['a', 'b'])[rng.integers(0, 2, rows)], 'unused': np.arange(rows)})
+
+
+def _changed(frame, column):
+    # the same frame with one value of `column` replaced
+    frame = frame.copy()
+    frame.loc[0, column] = 'c' if column == 'g' else frame.loc[0, column] + 1
+    return frame
+
+
+# (chart, arguments, the columns it reads)
+CASES = [
+    ('bar', dict(y_column='y', x_column='x'), ['x', 'y']),
+    ('scatter', dict(y_column='y', x_column='x', hue='g'), ['x', 'y', 'g']),
+    ('hist', dict(y_column='y', weights='w'), ['y', 'w']),
+    ('joint', dict(x_column='x', y_column='y', hue='g'), ['x', 'y', 'g']),
+    ('pairplot', dict(hue='g'), ['x', 'y', 'w', 'g', 'unused']),
+    ('pairplot', dict(vars=['x', 'w']), ['x', 'w']),
+    ('pairplot', dict(x_vars=['x'], y_vars=['y', 'w'], engine='neon'), ['x', 'y', 'w']),
+]
+
+
+@pytest.mark.parametrize('chart, arguments, read', CASES)
+def test_key_follows_every_column_the_chart_reads(chart, arguments, read):
+    frame = _frame()
+    key = render_key(chart, data=frame, output='png', **arguments)
+    assert render_key(chart, data=frame.copy(), output='png', **arguments) == key
+    for column in frame.columns:
+        changed = render_key(chart, data=_changed(frame, column), output='png', **arguments) != key
+        assert changed == (column in read), column
+
+
+def test_key_follows_frames_nested_in_dashboard_panels():
+    pa = pytest.importorskip('pyarrow')
+    frame = _frame()
+    panels = {'a': dict(chart='bar', data=pa.Table.from_pandas(frame), y_column='y', x_column='x')}
+    key = render_key('dashboard', panels=panels, output='png')
+    panels['a']['data'] = pa.Table.from_pandas(_changed(frame, 'y'))
+    assert render_key('dashboard', panels=panels, output='png') != key
+
+
+def test_key_follows_rewritten_files(tmp_path):
+    path = tmp_path / 'part.csv'
+    _frame().to_csv(path, index=False)
+    key = render_key('hist', data=str(path), y_column='y', output='png')
+    assert render_key('hist', data=str(path), y_column='y', output='png') == key
+
+    _changed(_frame(), 'y').to_csv(path, index=False)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert render_key('hist', data=str(path), y_column='y', output='png') != key
+
+
+def test_render_hits_the_cache():
+    cache = RenderCache()
+    frame = _frame()
+    first = cache.render('bar', data=frame, y_column='y', x_column='x')
+    assert cache.render('bar', data=frame.copy(), y_column='y', x_column='x') == first
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.render('bar', data=_changed(frame, 'y'), y_column='y', x_column='x')
+    assert cache.misses == 2
+
+
+def test_memory_store_evicts_least_recently_used():
+    cache = RenderCache(max_bytes=25)
+    for key in 'abc':
+        cache.put(key, 'png', key.encode() * 10)
+    assert cache.get('a', 'png') is None  # 30 bytes do not fit, the oldest went
+    assert cache.get('b', 'png') == b'b' * 10
+
+    cache.put('d', 'png', b'd' * 10)  # b was used after c, so c is the least recently used now
+    assert cache.get('c', 'png') is None
+    assert cache.get('b', 'png') is not None and cache.get('d', 'png') is not None
+    assert cache.get('e', 'png') is None
+    assert cache.misses == 3
+
+    cache.put('big', 'png', b'x' * 26)  # larger than the whole store: not kept
+    assert cache.get('big', 'png') is None
+
+
+def test_disk_store_evicts_least_recently_used(tmp_path):
+    cache = RenderCache(max_bytes=0, directory=tmp_path, max_disk_bytes=30)
+    for key in 'abc':
+        cache.put(key, 'png', key.encode() * 10)
+        time.sleep(0.01)
+    cache.get('a', 'png')  # touched, so b is now the oldest
+    time.sleep(0.01)
+    cache.put('d', 'png', b'd' * 10)
+    assert sorted(os.listdir(tmp_path)) == ['a.png', 'c.png', 'd.png']
+
+    fresh = RenderCache(directory=tmp_path)
+    assert fresh.get('c', 'png') == b'c' * 10
+    fresh.clear()
+    assert os.listdir(tmp_path) == []
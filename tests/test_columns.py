@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from matisse import neon_tokyo
+
+
+def _frame():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({'x': rng.normal(size=20), 'n': np.arange(20), 'g': np.array(['a', 'b'])[np.arange(20) % 2]})
+
+
+def _inputs():
+    # (the library _library names for it, the same frame in every form `data` can take)
+    frame = _frame()
+    yield None, frame
+    yield None, {column: frame[column].to_numpy() for column in frame.columns}
+    pa = pytest.importorskip('pyarrow')
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    yield 'pyarrow', table
+    yield 'pyarrow', table.to_batches()[0]
+    # not a Table: read through the interchange protocol
+    yield None, table.__dataframe__()
+    pl = pytest.importorskip('polars')
+    yield 'polars', pl.from_pandas(frame)
+
+
+def test_every_input_gives_the_same_columns():
+    frame = _frame()
+    for library, data in _inputs():
+        assert neon_tokyo._is_frame(data)
+        assert neon_tokyo._library(data) == library
+        assert neon_tokyo._column_names(data) == ['x', 'n', 'g']
+        columns = neon_tokyo._columns(data, ['x', 'g', None, 'x'])
+        assert list(columns) == ['x', 'g']
+        np.testing.assert_array_equal(columns['x'], frame['x'])
+        assert list(columns['g']) == list(frame['g'])
+
+
+def test_arrays_and_paths_are_not_frames():
+    assert not neon_tokyo._is_frame(np.arange(3))
+    assert not neon_tokyo._is_frame('part.csv')
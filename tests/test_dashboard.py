@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from matisse import neon_tokyo
+
+
+def _panels():
+    frame = pd.DataFrame({'x': np.arange(10.0), 'y': np.arange(10.0) ** 2})
+    groups = [np.arange(10.0), np.arange(5.0) * 2]
+    # panels given with nothing but their data: every chart's defaults have to draw into a panel
+    return {'pie': dict(chart='pie', x_column=[3, 2, 1], labels=['a', 'b', 'c']),
+            'line': dict(chart='line', data=frame, y_column='y', x_column='x'),
+            'hist': dict(chart='hist', data=frame, y_column='y'),
+            'box': dict(chart='box', x_column=groups),
+            'scatterbox': dict(chart='scatterbox', x_column=groups)}
+
+
+def test_dashboard_draws_every_panel():
+    layout = [['pie', 'line', 'box'], ['pie', 'hist', 'scatterbox']]
+    fig = neon_tokyo.dashboard(_panels(), layout=layout, output='figure')
+    assert {ax.get_label() for ax in fig.axes} >= {'pie', 'line', 'hist', 'box', 'scatterbox'}
+    assert neon_tokyo.dashboard(_panels(), output='png')[:8] == b'\x89PNG\r\n\x1a\n'
+
+
+def test_panel_styles_are_set_once():
+    panels = _panels()
+    panels['line']['bg_color'] = 'black'
+    with pytest.raises(ValueError, match='once for the whole dashboard'):
+        neon_tokyo.dashboard(panels, output='figure')
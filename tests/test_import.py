@@ -0,0 +1,31 @@
+import json
+import subprocess
+import sys
+
+# importing the package must stay cheap: matplotlib.pyplot, pandas, seaborn and scipy are only loaded by the charts
+# that use them (see the note at the top of neon_tokyo.py)
+
+HEAVY = ('matplotlib.pyplot', 'pandas', 'seaborn', 'scipy')
+
+SCRIPT = f"""
+import json, sys, time
+started = time.perf_counter()
+import matisse
+seconds = time.perf_counter() - started
+print(json.dumps({{'seconds': seconds, 'loaded': [name for name in {HEAVY!r} if name in sys.modules]}}))
+"""
+
+
+def _cold_import():
+    # a fresh interpreter, so nothing is cached from the test process
+    finished = subprocess.run([sys.executable, '-c', SCRIPT], capture_output=True, text=True, check=True)
+    return json.loads(finished.stdout.strip().splitlines()[-1])
+
+
+def test_import_does_not_load_heavy_modules():
+    assert _cold_import()['loaded'] == []
+
+
+def test_import_time():
+    # numpy dominates (about 0.1 s); the bound leaves room for a slow machine, not for seaborn or pandas (~1 s)
+    assert min(_cold_import()['seconds'] for _ in range(3)) < 0.75
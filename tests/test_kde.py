@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from matisse import kde
+
+# binned_kde must draw the curves scipy.stats.gaussian_kde drew before it: same bandwidth rules, and the binning and
+# FFT only cost a small fraction of the peak density
+
+
+def _reference(values, grid, bw_method, weights=None):
+    stats = pytest.importorskip('scipy.stats')
+    return stats.gaussian_kde(values, bw_method=bw_method, weights=weights)(grid)
+
+
+@pytest.mark.parametrize('bw_method', ['silverman', 'scott', 0.3])
+@pytest.mark.parametrize('cut', [0, 3])
+def test_binned_kde_matches_gaussian_kde(bw_method, cut):
+    rng = np.random.default_rng(0)
+    values = np.concatenate([rng.normal(size=3000), rng.normal(4, 0.5, size=1000)])
+    grid, density = kde.binned_kde(values, gridsize=200, bw_method=bw_method, cut=cut)
+
+    expected = _reference(values, grid, bw_method)
+    assert grid[0] < values.min() or cut == 0
+    np.testing.assert_allclose(density, expected, atol=2e-3 * expected.max())
+
+
+def test_weighted_binned_kde_matches_gaussian_kde():
+    rng = np.random.default_rng(1)
+    values = rng.gamma(2, size=2000)
+    weights = rng.uniform(0.1, 3, size=2000)
+    grid, density = kde.binned_kde(values, gridsize=150, weights=weights)
+
+    expected = _reference(values, grid, 'silverman', weights)
+    np.testing.assert_allclose(density, expected, atol=2e-3 * expected.max())
+
+
+def test_degenerate_samples_give_a_flat_zero_curve():
+    for values in ([], [2.0], [1.0, 1.0, 1.0]):
+        grid, density = kde.binned_kde(np.asarray(values), gridsize=10)
+        assert len(grid) == 10 and not density.any()
+
+
+def test_smooth_along_an_axis_matches_one_dimensional_smoothing():
+    rng = np.random.default_rng(2)
+    counts = rng.poisson(3, size=(40, 64)).astype(float)
+    for axis in (0, 1):
+        # every 1D slice along `axis`, smoothed on its own
+        expected = np.stack([kde.smooth(line, 0.1, 0.4) for line in np.moveaxis(counts, axis, -1)])
+        np.testing.assert_allclose(kde.smooth(counts, 0.1, 0.4, axis=axis), np.moveaxis(expected, -1, axis),
+                                   atol=1e-9)
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+from matisse import neon_tokyo
+
+
+def _series(rows=50_000):
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 20, rows)
+    return pd.DataFrame({'x': x, 'y': np.sin(x) + rng.normal(0, 0.05, rows)})
+
+
+def _render(frame, **arguments):
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = neon_tokyo.line(frame, 'y', 'x', figsize=(6, 4), output='figure', **arguments)
+    canvas = FigureCanvasAgg(fig)
+    canvas.draw()
+    return np.asarray(canvas.buffer_rgba()).astype(int), len(fig.axes[0].get_lines()[0].get_xdata())
+
+
+def test_decimation_keeps_every_column_envelope():
+    frame = _series()
+    x, y = frame['x'].to_numpy(), frame['y'].to_numpy()
+    for ordered, values in ((x, y), (x[::-1], y[::-1])):
+        kept_x, kept_y = neon_tokyo._min_max_decimate(ordered, values, 100)
+        assert len(kept_x) <= 400 and kept_x[0] == ordered[0] and kept_x[-1] == ordered[-1]
+        column = np.minimum(((ordered - ordered[0]) / (ordered[-1] - ordered[0]) * 100).astype(int), 99)
+        kept = np.isin(ordered, kept_x)
+        for i in range(100):
+            assert values[column == i].min() in values[kept & (column == i)]
+            assert values[column == i].max() in values[kept & (column == i)]
+
+
+def test_decimation_leaves_paths_that_are_not_monotonic_in_x():
+    x = np.random.default_rng(1).uniform(size=10_000)
+    kept_x, kept_y = neon_tokyo._min_max_decimate(x, x * 2, 100)
+    assert kept_x is x
+
+
+def test_decimated_render_matches_the_full_one():
+    frame = _series()
+    # the default path follows descending y: x goes back and forth, so nothing is dropped and nothing changes
+    decimated, points = _render(frame)
+    full, _ = _render(frame, decimate=False)
+    assert points == len(frame)
+    np.testing.assert_array_equal(decimated, full)
+
+    # along x: a few points per pixel column, and only antialiasing differs
+    decimated, points = _render(frame, presorted=True)
+    full, _ = _render(frame, presorted=True, decimate=False)
+    assert points < len(frame) / 10
+    assert (np.abs(decimated - full).max(axis=-1) > 32).mean() < 0.01
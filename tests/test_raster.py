@@ -0,0 +1,42 @@
+import numpy as np
+
+from matisse.raster import bin2d, gaussian_blur, over, shade, unpremultiply
+
+
+def test_bin2d_matches_histogram2d():
+    rng = np.random.default_rng(0)
+    x, y = rng.normal(size=(2, 5000))
+    extent, shape = (-2.0, 2.5, -1.5, 3.0), (30, 40)
+    # points on the upper edges and outside the extent included
+    x = np.concatenate([x, [2.5, -2.0, 10.0]])
+    y = np.concatenate([y, [3.0, -1.5, 0.0]])
+
+    expected, _, _ = np.histogram2d(y, x, bins=shape, range=[extent[2:], extent[:2]])
+    np.testing.assert_array_equal(bin2d(x, y, extent, shape), expected)
+
+
+def test_weighted_bin2d_drops_missing_coordinates():
+    rng = np.random.default_rng(1)
+    x, y = rng.uniform(0, 1, size=(2, 1000))
+    weights = rng.uniform(size=1000)
+    x[:10] = np.nan
+
+    expected, _, _ = np.histogram2d(y[10:], x[10:], bins=(8, 8), range=[(0, 1), (0, 1)], weights=weights[10:])
+    np.testing.assert_allclose(bin2d(x, y, (0, 1, 0, 1), (8, 8), weights), expected, rtol=1e-6)
+
+
+def test_gaussian_blur_keeps_the_mass_away_from_the_border():
+    image = np.zeros((64, 64, 4), dtype=np.float32)
+    image[32, 32] = 1
+    for sigma in (1.5, 6):
+        blurred = gaussian_blur(image, sigma)
+        np.testing.assert_allclose(blurred.sum(axis=(0, 1)), 1, rtol=1e-3)
+        assert blurred[..., 0].argmax() // 64 in (31, 32)
+
+
+def test_compositing_round_trip():
+    counts = np.array([[0.0, 1.0], [10.0, 100.0]], dtype=np.float32)
+    image = unpremultiply(over(shade(counts, 'red'), np.zeros((2, 2, 4), dtype=np.float32)))
+    assert image[0, 0, 3] == 0
+    np.testing.assert_allclose(image[1:, :, :3], [[[1, 0, 0], [1, 0, 0]]])
+    assert image[1, 1, 3] == 1
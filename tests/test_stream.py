@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from matisse import stream
+
+# streamed histograms must count what np.histogram counts on the whole column, whatever the chunking
+
+
+def _frame(rows=5000):
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({'y': rng.gamma(2, size=rows), 'w': rng.uniform(size=rows),
+                          'g': np.array(['a', 'b', 'c'])[rng.integers(0, 3, rows)]})
+    frame.loc[::97, 'y'] = np.nan
+    return frame
+
+
+def _chunks(frame, size=700):
+    return [frame.iloc[start:start + size] for start in range(0, len(frame), size)]
+
+
+def _sources(tmp_path):
+    # (name, source) for every rereadable kind of source, all holding _frame()
+    frame = _frame()
+    path = tmp_path / 'part.csv'
+    frame.to_csv(path, index=False)
+    yield 'csv', str(path)
+    yield 'list', _chunks(frame)
+    yield 'function', lambda: iter(_chunks(frame))
+    pytest.importorskip('pyarrow')
+    directory = tmp_path / 'parts'
+    directory.mkdir()
+    for i, chunk in enumerate(_chunks(frame, 2000)):
+        chunk.to_parquet(directory / f'{i}.parquet', index=False)
+    yield 'parquet', str(directory)
+
+
+def test_two_passes_match_np_histogram(tmp_path):
+    frame = _frame()
+    values = frame['y'].dropna()
+    expected, edges = np.histogram(values, bins=25)
+    for name, source in _sources(tmp_path):
+        [(label, counts, got_edges, curve, top)] = stream.histograms(source, 'y', bins=25, chunksize=900)
+        np.testing.assert_array_equal(counts, expected, err_msg=name)
+        np.testing.assert_allclose(got_edges, edges, err_msg=name)
+        assert curve is None and top == values.max()
+
+
+def test_hues_are_binned_on_their_own_range():
+    frame = _frame()
+    results = stream.histograms(_chunks(frame), 'y', hue='g', bins=12, weights='w')
+    assert [label for label, *_ in results] == list(pd.unique(frame['g']))
+    for label, counts, edges, _, _ in results:
+        group = frame[(frame['g'] == label) & frame['y'].notna()]
+        expected, expected_edges = np.histogram(group['y'], bins=12, weights=group['w'])
+        np.testing.assert_allclose(counts, expected)
+        np.testing.assert_allclose(edges, expected_edges)
+
+
+def test_shared_bins_follow_the_first_hue():
+    results = stream.histograms(_chunks(_frame()), 'y', hue='g', bins=10, share_bins=True)
+    first = results[0][2]
+    assert all(edges is first for _, _, edges, _, _ in results)
+
+
+def test_single_pass_with_fixed_edges():
+    frame = _frame()
+    edges = np.linspace(0, 12, 31)
+    [(_, counts, got_edges, curve, top)] = stream.histograms(iter(_chunks(frame)), 'y', bins=edges, kde=True)
+    np.testing.assert_array_equal(counts, np.histogram(frame['y'].dropna(), bins=edges)[0])
+    np.testing.assert_array_equal(got_edges, edges)
+    assert top == frame['y'].max()
+
+    # the KDE comes from a fine grid over the edges, so it matches the two-pass one closely
+    [(_, _, _, reference, _)] = stream.histograms(_chunks(frame), 'y', bins=edges, kde=True)
+    np.testing.assert_allclose(curve[1], reference[1], atol=1e-3 * reference[1].max())
+
+
+def test_single_use_iterator_needs_fixed_edges():
+    with pytest.raises(ValueError, match='single-use'):
+        stream.histograms(iter(_chunks(_frame())), 'y', bins=20)
+
+
+def test_streamed_displot_without_hue_values_raises():
+    from matisse import neon_tokyo
+
+    frame = _frame().iloc[:0]
+    with pytest.raises(ValueError, match='hue'):
+        neon_tokyo.displot([frame], 'y', hue='g', output='png')
+
+
+def test_profiled_rows_of_a_streamed_source(tmp_path):
+    import matisse
+    from matisse import neon_tokyo
+
+    frame = _frame()
+    path = tmp_path / 'part.csv'
+    frame.to_csv(path, index=False)
+    with matisse.profile() as calls:
+        for source in (_chunks(frame), str(path)):
+            neon_tokyo.hist(source, 'y', kde=True, output='figure')
+    # every row once, not the number of chunks or the length of the path, though the source is read twice
+    assert [call['rows'] for call in calls] == [len(frame), len(frame)]